@@ -1,4 +1,4 @@
-from task5_hash.main import SHA1
+from task5_hash.registry import get_backend, hash_to_int
 from task8.main import ECCWrapper, ECCPoint
 
 
@@ -7,14 +7,22 @@ class ECDSA:
     Class of ECDSA (Elliptic Curve Digital Signature Algorithm) implementation.
     """
 
-    def __init__(self, curve_name: str) -> None:
+    def __init__(self, curve_name: str, hash_name="sha1", fast_hash: bool = False) -> None:
         """
         Initializes of ECDSA object.
         :param curve_name: name of curve that used
+        :param hash_name: name of hash from task5_hash.registry ("sha1", "sha256", ...) or hash backend object
+        :param fast_hash: use hashlib implementation of hash, if it exists
         """
         self.curve_name = curve_name
         self.ecc_wrapper = ECCWrapper(curve_name)
-        self.sha1 = SHA1()
+        self.hash_backend = get_backend(hash_name, fast_hash)
+
+    def _hash_value(self, message: str) -> int:
+        """
+        Calculates hash of message, truncated to bit length of curve order.
+        """
+        return hash_to_int(self.hash_backend, message.encode(), self.ecc_wrapper.curve.order.bit_length())
 
     def generate_key_pair(self, seed=1) -> (int, ECCPoint):
         """
@@ -32,7 +40,7 @@ class ECDSA:
         :param message: string message to sign
         :return: r and s parts of signature
         """
-        hash_value = self.sha1.get_hash(message.encode())
+        hash_value = self._hash_value(message)
         signature = self._ecdsa_sign(int(private_key), hash_value)
         return signature
 
@@ -44,14 +52,14 @@ class ECDSA:
         :param signature: r and s value of signature
         :return: True of False whether the signature are correct or not
         """
-        recalculated_hash_value = self.sha1.get_hash(message.encode())
-        return self._ecdsa_verify(public_key, int(recalculated_hash_value, 16), signature)
+        recalculated_hash_value = self._hash_value(message)
+        return self._ecdsa_verify(public_key, recalculated_hash_value, signature)
 
-    def _ecdsa_sign(self, private_key: int, hash_value: str) -> (int, int):
+    def _ecdsa_sign(self, private_key: int, hash_value: int) -> (int, int):
         """
         Sign function.
         :param private_key: private key for signing
-        :param hash_value: strin hash value
+        :param hash_value: int hash value
         :return: r and s
         """
         # Generate random value that is not bigger than curve order
@@ -62,15 +70,15 @@ class ECDSA:
         while r == 0 or s == 0:
             point = self.ecc_wrapper.scalar_mult(k, self.ecc_wrapper.base_point_get())
             r = point.x % self.ecc_wrapper.curve.order
-            s = ((int(hash_value, 16) + r * private_key) * self._mod_inverse(k, self.ecc_wrapper.curve.order)) % self.ecc_wrapper.curve.order
+            s = ((hash_value + r * private_key) * self._mod_inverse(k, self.ecc_wrapper.curve.order)) % self.ecc_wrapper.curve.order
 
         return r, s
 
-    def _ecdsa_verify(self, public_key: ECCPoint, hash_value: str, signature: (int, int)) -> bool:
+    def _ecdsa_verify(self, public_key: ECCPoint, hash_value: int, signature: (int, int)) -> bool:
         """
         Verify function.
         :param public_key: public key
-        :param hash_value: string of hash value
+        :param hash_value: int hash value
         :signature: r and s of signature
         :return: True of False whether the signature are correct or not
         """
@@ -143,3 +151,10 @@ if __name__ == "__main__":
     print(f"\nTry to verify signature of message by providing another public key")
     verified = ecdsa.verify_signature(public_key2, message, signature)
     print("Signature Verified:", verified)
+
+    print("\n3. Sign by SHA-256 hash (hashlib implementation): ")
+    ecdsa_sha256 = ECDSA(curve_name, hash_name="sha256", fast_hash=True)
+    signature = ecdsa_sha256.sign_message(private_key, message)
+    print("Signature:", signature)
+    print("Signature Verified:", ecdsa_sha256.verify_signature(public_key, message, signature))
+    print("Signature Verified by SHA1 ECDSA:", ecdsa.verify_signature(public_key, message, signature))
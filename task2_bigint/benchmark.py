@@ -0,0 +1,184 @@
+import argparse
+import csv
+import json
+import operator
+import platform
+import random
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+from task2_bigint.big_int import Base, BigInt, EndianType
+from task2_bigint.limb_big_int import LimbBigInt, LimbType, NativeBigInt
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+# Creators of tested big ints: callable(base, endian_type, hex_repr)
+ENGINES = {
+    "BigInt": lambda base, endian_type, hex_repr: BigInt(base, endian_type, hex_repr),
+    "LimbBigInt32": lambda base, endian_type, hex_repr: LimbBigInt(base, endian_type, hex_repr, LimbType.LIMB_32),
+    "LimbBigInt64": lambda base, endian_type, hex_repr: LimbBigInt(base, endian_type, hex_repr, LimbType.LIMB_64),
+    "NativeBigInt": lambda base, endian_type, hex_repr: NativeBigInt(base, endian_type, hex_repr),
+}
+
+SHIFT = 13
+
+# Operations on big ints: callable(a, b, mod)
+OPERATIONS = {
+    "and": lambda a, b, m: a & b,
+    "or": lambda a, b, m: a | b,
+    "xor": lambda a, b, m: a ^ b,
+    "invert": lambda a, b, m: ~a,
+    "lshift": lambda a, b, m: a << SHIFT,
+    "rshift": lambda a, b, m: a >> SHIFT,
+    "add": lambda a, b, m: a + b,
+    "sub": lambda a, b, m: a - b,
+    "mul": lambda a, b, m: a * b,
+    "le": lambda a, b, m: a <= b,
+    "eq": lambda a, b, m: a == b,
+    "divmod": lambda a, b, m: divmod(a, b),
+    "pow_mod": lambda a, b, m: pow(a, b, m),
+    "getHex": lambda a, b, m: a.getHex(),
+    "to_bytes": lambda a, b, m: a.to_bytes(),
+}
+
+
+def int_operations(base: int) -> Dict[str, Callable]:
+    """
+    Returns the same operations for native int (or gmpy2.mpz) values truncated to width of base.
+    :param base: width in bytes
+    """
+    mask = (1 << (8 * base)) - 1
+    return {
+        "and": lambda a, b, m: a & b,
+        "or": lambda a, b, m: a | b,
+        "xor": lambda a, b, m: a ^ b,
+        "invert": lambda a, b, m: a ^ mask,
+        "lshift": lambda a, b, m: (a << SHIFT) & mask,
+        "rshift": lambda a, b, m: a >> SHIFT,
+        "add": lambda a, b, m: (a + b) & mask,
+        "sub": lambda a, b, m: (a - b) & mask,
+        "mul": lambda a, b, m: a * b,
+        "le": lambda a, b, m: a <= b,
+        "eq": lambda a, b, m: a == b,
+        "divmod": lambda a, b, m: divmod(a, b),
+        "pow_mod": lambda a, b, m: pow(a, b, m),
+        "getHex": lambda a, b, m: int(a).to_bytes(base, "big").hex(),
+        "to_bytes": lambda a, b, m: int(a).to_bytes(base, "big"),
+    }
+
+
+def time_call(func: Callable, repeat: int) -> float:
+    """
+    Measures time of one call of func.
+    :param func: callable without arguments
+    :param repeat: number of measurements, the best one is taken
+    :return: seconds per call
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_benchmark(widths: List[int], engines: List[str], operations: List[str], repeat: int = 5,
+                  seed: int = 3) -> List[dict]:
+    """
+    Times every operation of every engine for all widths and endian types, and the same operation of native int.
+    :param widths: widths of numbers in bytes
+    :param engines: names of engines from ENGINES
+    :param operations: names of operations from OPERATIONS
+    :param repeat: number of measurements of every operation
+    :param seed: seed for random operands
+    :return: list of result rows
+    """
+    random.seed(seed)
+    results = []
+    for base in widths:
+        x = random.getrandbits(8 * base) | (1 << (8 * base - 1))
+        y = random.getrandbits(8 * base - 8) | 1
+        mod = random.getrandbits(8 * base) | (1 << (8 * base - 1)) | 1
+        # Short exponent, so pow_mod of big widths does not dominate the run
+        exp = random.getrandbits(64)
+
+        baselines = {"int": (x, y, mod, exp, int_operations(base))}
+        if gmpy2 is not None:
+            baselines["gmpy2"] = (gmpy2.mpz(x), gmpy2.mpz(y), gmpy2.mpz(mod), gmpy2.mpz(exp), int_operations(base))
+
+        baseline_times = {}
+        for name, (a, b, m, e, int_ops) in baselines.items():
+            for operation in operations:
+                second = e if operation == "pow_mod" else b
+                baseline_times[name, operation] = time_call(lambda: int_ops[operation](a, second, m), repeat)
+
+        for endian_type in EndianType:
+            byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+            for engine in engines:
+                a, b, m, e = (ENGINES[engine](base, endian_type, value.to_bytes(base, byteorder).hex())
+                              for value in (x, y, mod, exp))
+                for operation in operations:
+                    second = e if operation == "pow_mod" else b
+                    func = OPERATIONS[operation]
+                    try:
+                        func(a, second, m)
+                    except (AttributeError, TypeError):
+                        # Engine does not support the operation
+                        continue
+                    seconds = time_call(lambda: func(a, second, m), repeat)
+                    row = {"engine": engine, "operation": operation, "base": base, "endian": endian_type.name,
+                           "ns_per_op": seconds * 1e9}
+                    for name in baselines:
+                        row[f"{name}_ns_per_op"] = baseline_times[name, operation] * 1e9
+                        row[f"slowdown_vs_{name}"] = seconds / baseline_times[name, operation]
+                    results.append(row)
+                    print(f"{engine:>13} {operation:>8} base={base:<5} {endian_type.name:<19} "
+                          f"{seconds * 1e9:12.0f} ns/op  x{row['slowdown_vs_int']:.1f} vs int", flush=True)
+    return results
+
+
+def save_json(results: List[dict], path: str) -> None:
+    """
+    Saves results with environment description as JSON.
+    """
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "gmpy2": gmpy2.version() if gmpy2 is not None else None,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def save_csv(results: List[dict], path: str) -> None:
+    """
+    Saves results as CSV, one row per engine, operation, width and endian type.
+    """
+    fields = list(dict.fromkeys(key for row in results for key in row))
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of BigInt engines against native int")
+    parser.add_argument("--widths", type=int, nargs="+", default=[Base.BASE_32, Base.BASE_64, 256, 512],
+                        help="widths of numbers in bytes")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements of every operation")
+    parser.add_argument("--json", default="bigint_benchmark.json", help="path of JSON output")
+    parser.add_argument("--csv", default=None, help="path of CSV output")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmark(args.widths, args.engines, args.operations, args.repeat)
+    save_json(benchmark_results, args.json)
+    if args.csv:
+        save_csv(benchmark_results, args.csv)
+    print(f"Saved {len(benchmark_results)} results to {args.json}" + (f" and {args.csv}" if args.csv else ""))
@@ -1,5 +1,11 @@
 from __future__ import annotations
+import random
+import struct
 from enum import Enum, IntEnum
+from typing import List, Optional, Sequence
+
+from task2_bigint.modular import Division, Modular
+from task2_bigint.multiplication import Multiplication
 
 
 class EndianType(Enum):
@@ -19,23 +25,69 @@ class Base(IntEnum):
 
 
 class BigInt:
+    """
+    Big integer stored as list of bytes from the most significant one.
+
+    With base=None the number has variable width: only significant bytes are stored (zero is an empty list),
+    results grow on overflow and leading zeros are removed, so small values cost less.
+    Operands of different width are aligned by leading zeros, the result has the wider base;
+    if any operand is of variable width, the result is of variable width too.
+    """
     MAX_BYTE_VAL = 16
+    # Division and modular exponentiation work on limbs of this size, not on bytes
+    LIMB_BITS = 32
 
-    def __init__(self, base: Base = Base.BASE_32, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE, hex_repr: str = None):
+    def __init__(self, base: Optional[int] = Base.BASE_32, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE,
+                 hex_repr: str = None):
         self.base_size = base
         self.endian_type = endian_type
-        self.bytes = [0] * self.base_size
+        self.bytes = [0] * (base or 0)
+        self._hash = None
         if hex_repr:
             self.setHex(hex_repr)
 
-    def getHex(self):
-        hex_repr = ""
-        for bytes_idx in range(0, self.base_size):
-            hex_byte_repr = hex(self.bytes[bytes_idx])[2:]
-            if len(hex_byte_repr) % 2 == 1:
-                hex_byte_repr = "0" + hex_byte_repr
-            hex_repr += hex_byte_repr
+    @property
+    def is_variable(self) -> bool:
+        """
+        True for number of variable width.
+        """
+        return self.base_size is None
+
+    def _result(self, data: Sequence[int], base: Optional[int]) -> "BigInt":
+        """
+        Creates BigInt of the same endian type from bytes (from the most significant one).
+        For fixed width the bytes are truncated or padded with leading zeros to base,
+        for variable width leading zeros are removed.
+        """
+        result = BigInt(base=base, endian_type=self.endian_type)
+        if base is None:
+            start = 0
+            while start < len(data) and data[start] == 0:
+                start += 1
+            result.bytes = list(data[start:])
+        else:
+            data = data[-base:] if base else []
+            result.bytes[base - len(data):] = data
+        return result
+
+    def _result_base(self, other: "BigInt") -> Optional[int]:
+        """
+        Returns base of result of operation with other: the wider base or None for variable width.
+        """
+        if self.is_variable or other.is_variable:
+            return None
+        return max(self.base_size, other.base_size)
 
+    def _aligned(self, other: "BigInt") -> (list, list):
+        """
+        Returns bytes of both operands padded with leading zeros to the same length.
+        """
+        size = max(len(self.bytes), len(other.bytes))
+        return [0] * (size - len(self.bytes)) + self.bytes, [0] * (size - len(other.bytes)) + other.bytes
+
+    def getHex(self):
+        # Zero of variable width is represented by one byte
+        hex_repr = bytes(self.bytes or [0]).hex()
         if self.endian_type == EndianType.LITTLE_ENDIAN_TYPE:
             hex_repr = BigInt.hex_to_little_endian(hex_repr)
         return hex_repr
@@ -44,8 +96,56 @@ class BigInt:
         if self.endian_type == EndianType.LITTLE_ENDIAN_TYPE:
             hex_repr = BigInt.hex_to_little_endian(hex_repr)
 
-        for bytes_idx in range(0, self.base_size):
-            self.bytes[bytes_idx] = int(hex_repr[bytes_idx * 2:bytes_idx * 2 + 2], base=16)
+        if self.is_variable:
+            self.bytes = self._result(bytes.fromhex(hex_repr), None).bytes
+        else:
+            for bytes_idx in range(0, self.base_size):
+                self.bytes[bytes_idx] = int(hex_repr[bytes_idx * 2:bytes_idx * 2 + 2], base=16)
+        self._hash = None
+
+    @staticmethod
+    def from_bytes(data, base: Optional[int] = Base.BASE_32,
+                   endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE) -> "BigInt":
+        """
+        Creates BigInt from bytes in order of endian_type.
+        :param data: bytes-like object (bytes, bytearray, memoryview, ...), not longer than base
+        :param base: base size of BigInt, None for variable width
+        :param endian_type: byte order of data
+        :return: new BigInt
+        """
+        view = memoryview(data).cast("B")
+        if base is not None and len(view) > base:
+            raise ValueError(f"Value of {len(view)} bytes does not fit into base of {base} bytes")
+
+        if endian_type == EndianType.LITTLE_ENDIAN_TYPE:
+            view = view[::-1]
+        # Bytes are stored from the most significant one, shorter data is padded by leading zeros
+        return BigInt(endian_type=endian_type)._result(view.tolist(), base)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns bytes of value in order of endian_type: base_size bytes or significant bytes for variable width.
+        """
+        data = bytes(self.bytes or [0])
+        if self.endian_type == EndianType.LITTLE_ENDIAN_TYPE:
+            data = data[::-1]
+        return data
+
+    def __bytes__(self):
+        return self.to_bytes()
+
+    def readinto(self, buffer) -> int:
+        """
+        Writes bytes of value in order of endian_type into the caller-supplied buffer.
+        :param buffer: writable bytes-like object (bytearray, memoryview, ...) of at least base_size bytes
+        :return: number of written bytes
+        """
+        view = memoryview(buffer).cast("B")
+        data = memoryview(bytes(self.bytes or [0]))
+        if self.endian_type == EndianType.LITTLE_ENDIAN_TYPE:
+            data = data[::-1]
+        view[:len(data)] = data
+        return len(data)
 
     @staticmethod
     def hex_to_little_endian(hex_repr: str) -> str:
@@ -63,27 +163,20 @@ class BigInt:
         return self.__str__()
 
     def __and__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
-        for bytes_idx in range(0, self.base_size):
-            result.bytes[bytes_idx] = self.bytes[bytes_idx] & other.bytes[bytes_idx]
-
-        return result
+        a, b = self._aligned(other)
+        return self._result([x & y for x, y in zip(a, b)], self._result_base(other))
 
     def __or__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
-        for bytes_idx in range(0, self.base_size):
-            result.bytes[bytes_idx] = self.bytes[bytes_idx] | other.bytes[bytes_idx]
-
-        return result
+        a, b = self._aligned(other)
+        return self._result([x | y for x, y in zip(a, b)], self._result_base(other))
 
     def __xor__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
-        for bytes_idx in range(0, self.base_size):
-            result.bytes[bytes_idx] = self.bytes[bytes_idx] ^ other.bytes[bytes_idx]
-
-        return result
+        a, b = self._aligned(other)
+        return self._result([x ^ y for x, y in zip(a, b)], self._result_base(other))
 
     def __invert__(self):
+        if self.is_variable:
+            raise ValueError("Bitwise complement is not defined for variable width BigInt")
         result = BigInt(base=self.base_size, endian_type=self.endian_type)
         for bytes_idx in range(0, self.base_size):
             result.bytes[bytes_idx] = BigInt.MAX_BYTE_VAL - self.bytes[bytes_idx]
@@ -91,81 +184,187 @@ class BigInt:
         return result
 
     def __lshift__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
         byte_shifts, bit_shifts = divmod(other, 8)
+        if self.is_variable:
+            # One more byte for the bits shifted out of the most significant byte
+            data = [0] + self.bytes + [0] * byte_shifts
+        else:
+            data = self.bytes[byte_shifts:] + [0] * min(byte_shifts, self.base_size)
 
-        for i in range(0, self.base_size - byte_shifts):
-            shifted_byte = self.bytes[i + byte_shifts] << bit_shifts
-            if i + byte_shifts + 1 < self.base_size and bit_shifts > 0:
-                shifted_byte |= self.bytes[i + byte_shifts + 1] >> (8 - bit_shifts)
-            result.bytes[i] = shifted_byte
+        result = [0] * len(data)
+        for i in range(0, len(data)):
+            shifted_byte = (data[i] << bit_shifts) & 0xFF
+            if i + 1 < len(data) and bit_shifts > 0:
+                shifted_byte |= data[i + 1] >> (8 - bit_shifts)
+            result[i] = shifted_byte
 
-        return result
+        return self._result(result, self.base_size)
 
     def __rshift__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
         byte_shifts, bit_shifts = divmod(other, 8)
+        if self.is_variable:
+            data = self.bytes[:max(0, len(self.bytes) - byte_shifts)]
+        else:
+            data = [0] * min(byte_shifts, self.base_size) + self.bytes[:max(0, self.base_size - byte_shifts)]
 
-        for i in range(byte_shifts, self.base_size):
-            shifted_byte = self.bytes[i - byte_shifts] >> bit_shifts
-            if i - byte_shifts - 1 >= 0 and bit_shifts > 0:
-                shifted_byte |= self.bytes[i - byte_shifts - 1] << (8 - bit_shifts)
-            result.bytes[i] = shifted_byte
+        result = [0] * len(data)
+        for i in range(0, len(data)):
+            shifted_byte = data[i] >> bit_shifts
+            if i - 1 >= 0 and bit_shifts > 0:
+                shifted_byte |= (data[i - 1] << (8 - bit_shifts)) & 0xFF
+            result[i] = shifted_byte
 
-        return result
+        return self._result(result, self.base_size)
 
     def __add__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
+        a, b = self._aligned(other)
+        # One more byte for the carry, it is dropped for fixed width
+        result = [0] * (len(a) + 1)
         carry = 0
-        for i in range(self.base_size - 1, -1, -1):
-            byte_sum = self.bytes[i] + other.bytes[i] + carry
-            result.bytes[i] = byte_sum % 256
+        for i in range(len(a) - 1, -1, -1):
+            byte_sum = a[i] + b[i] + carry
+            result[i + 1] = byte_sum % 256
             carry = byte_sum // 256
-        return result
+        result[0] = carry
+        return self._result(result, self._result_base(other))
 
     def __sub__(self, other):
-        result = BigInt(base=self.base_size, endian_type=self.endian_type)
+        a, b = self._aligned(other)
+        result = [0] * len(a)
         borrow = 0
-        for i in range(self.base_size - 1, -1, -1):
-            byte_diff = self.bytes[i] - other.bytes[i] - borrow
+        for i in range(len(a) - 1, -1, -1):
+            byte_diff = a[i] - b[i] - borrow
             if byte_diff < 0:
                 byte_diff += 256
                 borrow = 1
             else:
                 borrow = 0
-            result.bytes[i] = byte_diff
-        return result
+            result[i] = byte_diff
+
+        base = self._result_base(other)
+        if base is None and borrow:
+            raise ValueError("Negative result of subtraction for variable width BigInt")
+        return self._result(result, base)
 
     def __mul__(self, other: "BigInt") -> "BigInt":
-        result = BigInt(base=self.base_size * 2, endian_type=self.endian_type)
+        """
+        Multiplies numbers. Product of fixed width numbers does not overflow:
+        its base is the sum of bases of operands (2 * base_size for operands of the same width).
+        """
+        base = self._result_base(other)
+        if base is not None:
+            base = self.base_size + other.base_size
 
-        # Create a temporary buffer to store intermediate results
-        buffer = [0] * (2 * self.base_size)
+        # Bytes are stored from the most significant one, multiplication engine expects the least significant first
+        product = Multiplication.multiply(self.bytes[::-1], other.bytes[::-1], limb_bits=8)
+        return self._result(product[::-1], base)
 
-        # Perform long multiplication digit by digit
-        for i in range(self.base_size):
-            for j in range(self.base_size):
-                product = self.bytes[i] * other.bytes[j]
-                buffer[i + j] += product
-                buffer[i + j + 1] += buffer[i + j] // 256
-                buffer[i + j] %= 256
+    def _to_limbs(self) -> List[int]:
+        """
+        Returns value as 32-bit limbs from the least significant one, for the limb engines of modular.py.
+        """
+        data = bytes(self.bytes)
+        data = bytes(-len(data) % 4) + data
+        return list(struct.unpack(f">{len(data) // 4}I", data))[::-1]
 
-        # Reduce the buffer modulo 256 and store it in the result
-        carry = 0
-        for i in range(2 * self.base_size - 1, -1, -1):
-            carry *= 256
-            carry += buffer[i]
-            result.bytes[i] = carry % 256
-            carry //= 256
+    def _from_limbs(self, limbs: Sequence[int], base: Optional[int]) -> "BigInt":
+        """
+        Creates BigInt of the same endian type from 32-bit limbs, truncated or padded with zeros to base.
+        """
+        return self._result(struct.pack(f">{len(limbs)}I", *reversed(limbs)), base)
 
-        return result
+    def __divmod__(self, other: "BigInt") -> ("BigInt", "BigInt"):
+        """
+        Divides by Knuth algorithm D on 32-bit limbs, quotient and remainder have the wider base of operands.
+        """
+        base = self._result_base(other)
+        quotient, remainder = Division.divmod_limbs(self._to_limbs(), other._to_limbs(), BigInt.LIMB_BITS)
+        return self._from_limbs(quotient, base), self._from_limbs(remainder, base)
+
+    def __floordiv__(self, other: "BigInt") -> "BigInt":
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: "BigInt") -> "BigInt":
+        return divmod(self, other)[1]
+
+    def __pow__(self, exp: "BigInt", mod: "BigInt" = None) -> "BigInt":
+        if mod is None:
+            raise TypeError("BigInt supports only modular exponentiation: pow(base, exp, mod)")
+        return BigInt.pow_mod(self, exp, mod)
+
+    @staticmethod
+    def pow_mod(base: "BigInt", exp: "BigInt", mod: "BigInt") -> "BigInt":
+        """
+        Calculates base ** exp mod mod by sliding window exponentiation with Montgomery multiplication
+        (division for even modulus). Montgomery context is cached per modulus.
+        :param base: base
+        :param exp: exponent
+        :param mod: modulus, result has the same base and endian type
+        :return: new BigInt
+        """
+        result = Modular.pow_limbs(base._to_limbs(), exp._to_limbs(), mod._to_limbs(), BigInt.LIMB_BITS)
+        return mod._from_limbs(result, mod.base_size)
+
+    def _significant_bytes(self) -> list:
+        """
+        Returns bytes without leading zeros, so numbers of different base can be compared.
+        """
+        start = 0
+        while start < len(self.bytes) and self.bytes[start] == 0:
+            start += 1
+        return self.bytes[start:]
+
+    def _compare(self, other: "BigInt") -> int:
+        """
+        Compares values of BigInts, also of different base.
+        :return: -1 if self < other, 0 if equal, 1 if self > other
+        """
+        a, b = self.bytes, other.bytes
+        if len(a) != len(b):
+            a, b = self._significant_bytes(), other._significant_bytes()
+            if len(a) != len(b):
+                return -1 if len(a) < len(b) else 1
+
+        # Bytes are stored from the most significant one, so list comparison stops on the first different byte
+        if a == b:
+            return 0
+        return -1 if a < b else 1
+
+    def __eq__(self, other):
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __ne__(self, other):
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) != 0
+
+    def __lt__(self, other):
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) < 0
 
     def __le__(self, other):
-        result = True
-        for i in range(self.base_size):
-            if self.bytes[i] > other.bytes[i]:
-                result = False
-        return result
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        if not isinstance(other, BigInt):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __hash__(self):
+        # Hash is cached, setHex resets it. Direct changes of self.bytes after hashing are not tracked.
+        if self._hash is None:
+            self._hash = hash(tuple(self._significant_bytes()))
+        return self._hash
 
 
 def test_set_get_hex(input_hex_repr, endian_type):
@@ -174,6 +373,29 @@ def test_set_get_hex(input_hex_repr, endian_type):
     assert b.getHex() == input_hex_repr, f"Error for {input_hex_repr}. Output is {b.getHex()}"
 
 
+def test_bytes(input_hex_repr, endian_type, base):
+    b = BigInt(hex_repr=input_hex_repr, endian_type=endian_type, base=base)
+    data = b.to_bytes()
+    assert data.hex() == input_hex_repr, f"Error for to_bytes of {input_hex_repr}. Output is {data.hex()}"
+
+    result = BigInt.from_bytes(memoryview(bytearray(data)), base=base, endian_type=endian_type)
+    assert result.getHex() == input_hex_repr, f"Error for from_bytes of {input_hex_repr}. Output is {result.getHex()}"
+
+    buffer = bytearray(base + 2)
+    written = b.readinto(memoryview(buffer)[1:])
+    assert written == base and buffer[1:-1] == data, f"Error for readinto of {input_hex_repr}. Output is {buffer.hex()}"
+
+
+def test_compare(input_hex_repr_1, input_hex_repr_2, expected, endian_type, base_1, base_2):
+    b1 = BigInt(hex_repr=input_hex_repr_1, endian_type=endian_type, base=base_1)
+    b2 = BigInt(hex_repr=input_hex_repr_2, endian_type=endian_type, base=base_2)
+    result = (b1 < b2, b1 <= b2, b1 == b2, b1 != b2, b1 >= b2, b1 > b2)
+    expected = (expected < 0, expected <= 0, expected == 0, expected != 0, expected >= 0, expected > 0)
+    assert result == expected, f"Error for compare {input_hex_repr_1} and {input_hex_repr_2}. Output is {result}"
+    if expected[2]:
+        assert hash(b1) == hash(b2), f"Error for hash of {input_hex_repr_1} and {input_hex_repr_2}"
+
+
 def test_and(input_hex_repr_1, input_hex_repr_2, expected, endian_type, base):
     b1 = BigInt(hex_repr=input_hex_repr_1, endian_type=endian_type, base=base)
     b2 = BigInt(hex_repr=input_hex_repr_2, endian_type=endian_type, base=base)
@@ -235,6 +457,110 @@ def test_mul(input_hex_repr_1, input_hex_repr_2, expected, endian_type, base):
     assert result.getHex() == expected, f"Error for {input_hex_repr_1} * {input_hex_repr_2}. Output is {result.getHex()}"
 
 
+def test_modular_against_int(base, endian_type, iterations=20):
+    """
+    Compares divmod, mod and pow_mod with the native int on random values.
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+
+    def to_hex(value):
+        return value.to_bytes(base, byteorder).hex()
+
+    for _ in range(iterations):
+        x = random.getrandbits(8 * base)
+        y = random.getrandbits(random.randint(1, 8 * base)) or 1
+        b1 = BigInt(hex_repr=to_hex(x), endian_type=endian_type, base=base)
+        b2 = BigInt(hex_repr=to_hex(y), endian_type=endian_type, base=base)
+        quotient, remainder = divmod(b1, b2)
+        assert (quotient.getHex(), remainder.getHex()) == (to_hex(x // y), to_hex(x % y)), f"Error for divmod({b1}, {b2})"
+        assert (b1 // b2).getHex() == to_hex(x // y), f"Error for {b1} // {b2}"
+        assert (b1 % b2).getHex() == to_hex(x % y), f"Error for {b1} % {b2}"
+
+        # Short exponent to keep the test fast.
+        # Odd modulus goes through Montgomery multiplication, even one through division.
+        e = random.getrandbits(64)
+        exp = BigInt(hex_repr=to_hex(e), endian_type=endian_type, base=base)
+        for m in (y | 1, y & ~1 or 2):
+            mod = BigInt(hex_repr=to_hex(m), endian_type=endian_type, base=base)
+            assert pow(b1, exp, mod).getHex() == to_hex(pow(x, e, m)), f"Error for pow({b1}, {exp}, {mod})"
+
+    try:
+        divmod(BigInt(hex_repr=to_hex(1), base=base), BigInt(base=base))
+        assert False, "No error for division by zero"
+    except ZeroDivisionError:
+        pass
+
+
+def test_variable_against_int(endian_type, iterations=50):
+    """
+    Compares operators of variable width BigInt with the native int on random values of random sizes.
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+
+    def to_hex(value):
+        return value.to_bytes(max(1, (value.bit_length() + 7) // 8), byteorder).hex()
+
+    for _ in range(iterations):
+        x = random.getrandbits(random.randint(0, 600))
+        y = random.getrandbits(random.randint(0, 600))
+        x, y = max(x, y), min(x, y)
+        shift = random.randint(0, 200)
+        b1 = BigInt(None, endian_type, to_hex(x))
+        b2 = BigInt(None, endian_type, to_hex(y))
+
+        # Only significant bytes are stored
+        assert len(b1.bytes) == (x.bit_length() + 7) // 8, f"Error for size of {to_hex(x)}. Output is {b1.bytes}"
+        assert b1.getHex() == to_hex(x), f"Error for hex {to_hex(x)}. Output is {b1.getHex()}"
+        assert BigInt.from_bytes(b1.to_bytes(), None, endian_type) == b1, f"Error for bytes of {b1}"
+        assert (b1 & b2).getHex() == to_hex(x & y), f"Error for {b1} & {b2}"
+        assert (b1 | b2).getHex() == to_hex(x | y), f"Error for {b1} | {b2}"
+        assert (b1 ^ b2).getHex() == to_hex(x ^ y), f"Error for {b1} ^ {b2}"
+        assert (b1 << shift).getHex() == to_hex(x << shift), f"Error for {b1} << {shift}"
+        assert (b1 >> shift).getHex() == to_hex(x >> shift), f"Error for {b1} >> {shift}"
+        assert (b1 + b2).getHex() == to_hex(x + y), f"Error for {b1} + {b2}"
+        assert (b1 - b2).getHex() == to_hex(x - y), f"Error for {b1} - {b2}"
+        assert (b1 * b2).getHex() == to_hex(x * y), f"Error for {b1} * {b2}"
+        assert (b1 < b2, b1 == b2, b1 > b2) == (x < y, x == y, x > y), f"Error for compare {b1} and {b2}"
+        if y:
+            quotient, remainder = divmod(b1, b2)
+            assert (quotient.getHex(), remainder.getHex()) == (to_hex(x // y), to_hex(x % y)), \
+                f"Error for divmod({b1}, {b2})"
+        if x != y:
+            try:
+                b2 - b1
+                assert False, f"No error for negative {b2} - {b1}"
+            except ValueError:
+                pass
+
+
+def test_mixed_width(endian_type, iterations=20):
+    """
+    Operators on operands of different base: the result has the wider base, or variable width
+    if any operand is variable.
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+    narrow, wide = Base.BASE_32, Base.BASE_64
+    mask = (1 << (8 * wide)) - 1
+
+    for _ in range(iterations):
+        x = random.getrandbits(8 * narrow)
+        y = random.getrandbits(8 * wide)
+        b1 = BigInt(narrow, endian_type, x.to_bytes(narrow, byteorder).hex())
+        b2 = BigInt(wide, endian_type, y.to_bytes(wide, byteorder).hex())
+        for name, func, expected in (("&", lambda a, b: a & b, x & y), ("|", lambda a, b: a | b, x | y),
+                                     ("^", lambda a, b: a ^ b, x ^ y), ("+", lambda a, b: a + b, (x + y) & mask),
+                                     ("-", lambda a, b: a - b, (x - y) & mask)):
+            for a, b in ((b1, b2), (b2, b1)):
+                value = expected if a is b1 or name != "-" else (y - x) & mask
+                assert func(a, b).getHex() == value.to_bytes(wide, byteorder).hex(), f"Error for {a} {name} {b}"
+        product = b1 * b2
+        assert product.base_size == narrow + wide and product.getHex() == (x * y).to_bytes(narrow + wide, byteorder).hex()
+
+        variable = BigInt(None, endian_type, x.to_bytes(narrow, byteorder).hex())
+        assert (variable + b2).is_variable and (variable + b2).getHex() == BigInt(None, endian_type, (
+            x + y).to_bytes(wide + 1, byteorder).hex()).getHex(), f"Error for {variable} + {b2}"
+
+
 if __name__ == "__main__":
     # Hex tests
     test_set_get_hex("0100000000000000000000000000000000000000000000000000000000000000", EndianType.BIG_ENDIAN_TYPE)
@@ -246,6 +572,29 @@ if __name__ == "__main__":
     test_set_get_hex("ffaa000000000000000000000000000000000000000000000000000000000000", EndianType.LITTLE_ENDIAN_TYPE)
     test_set_get_hex("ffaa000000000000000000000000000000000000000000000000000000000000", EndianType.BIG_ENDIAN_TYPE)
 
+    # Bytes import and export
+    test_bytes("ffaa000000000000000000000000000000000000000000000000000000000001", EndianType.LITTLE_ENDIAN_TYPE, Base.BASE_32)
+    test_bytes("ffaa000000000000000000000000000000000000000000000000000000000001", EndianType.BIG_ENDIAN_TYPE, Base.BASE_32)
+
+    # Compare operations
+    test_compare("0100000000000000000000000000000000000000000000000000000000000000",
+                 "00ff000000000000000000000000000000000000000000000000000000000000",
+                 1, EndianType.BIG_ENDIAN_TYPE, Base.BASE_32, Base.BASE_32)
+    test_compare("0100000000000000000000000000000000000000000000000000000000000000",
+                 "00ff000000000000000000000000000000000000000000000000000000000000",
+                 -1, EndianType.LITTLE_ENDIAN_TYPE, Base.BASE_32, Base.BASE_32)
+    test_compare("00ff000000000000000000000000000000000000000000000000000000000000",
+                 "00ff000000000000000000000000000000000000000000000000000000000000",
+                 0, EndianType.BIG_ENDIAN_TYPE, Base.BASE_32, Base.BASE_32)
+    test_compare("0100000000000000000000000000000000000000000000000000000000000000",
+                 "0100000000000000000000000000000000000000000000000000000000000000"
+                 "0000000000000000000000000000000000000000000000000000000000000000",
+                 0, EndianType.LITTLE_ENDIAN_TYPE, Base.BASE_32, Base.BASE_64)
+    test_compare("0100000000000000000000000000000000000000000000000000000000000000",
+                 "0000000000000000000000000000000000000000000000000000000000000000"
+                 "0000000000000000000000000000000000000000000000000000000000000001",
+                 -1, EndianType.LITTLE_ENDIAN_TYPE, Base.BASE_32, Base.BASE_64)
+
     # And operation
     test_and("0100000000000000000000000000000000000000000000000000000000000000", "0100000000000000000000000000000000000000000000000000000000000000", "0100000000000000000000000000000000000000000000000000000000000000", EndianType.LITTLE_ENDIAN_TYPE, base=Base.BASE_32)
     test_and("0100000000000000000000000000000000000000000000000000000000000000", "0200000000000000000000000000000000000000000000000000000000000000", "0000000000000000000000000000000000000000000000000000000000000000", EndianType.LITTLE_ENDIAN_TYPE, base=Base.BASE_32)
@@ -317,6 +666,23 @@ if __name__ == "__main__":
 
     test_mul("0000000000000000000000000000000000000000000000000000000000000002",
              "0000000000000000000000000000000000000000000000000000000000000002",
-             "00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000400", EndianType.BIG_ENDIAN_TYPE,
+             "00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000004", EndianType.BIG_ENDIAN_TYPE,
+            base=Base.BASE_32)
+
+    test_mul("36f028580bb02cc8272a9a020f4200e346e276ae664e45ee80745574e2f5ab80",
+             "70983d692f648185febe6d6fa607630ae68649f7e6fc45b94680096c06e4fadb",
+             "1829bd6c45ad341ba0365687296b9b049ce48eba082a20a0518eeae6e508b787c452c31987d828b6ca609430160430ffcd38142cda061e9b7b10ff73cfa4b680", EndianType.BIG_ENDIAN_TYPE,
             base=Base.BASE_32)
 
+    # Division, modulo and modular exponentiation
+    random.seed(3)
+    for endian in EndianType:
+        for base_size in (Base.BASE_32, Base.BASE_64, 256):
+            test_modular_against_int(base_size, endian)
+
+    # Variable width and operands of different width
+    for endian in EndianType:
+        test_variable_against_int(endian)
+        test_mixed_width(endian)
+
+    print("All BigInt tests passed")
@@ -0,0 +1,278 @@
+from __future__ import annotations
+import random
+from typing import List
+
+import numpy as np
+
+from task2_bigint.big_int import Base, EndianType
+
+
+class BigIntBatch:
+    """
+    Batch of N big integers of the same width, stored as (N, limbs) NumPy matrix of uint32 limbs.
+    Limbs in a row are kept from the least significant to the most significant one.
+    Every operator is applied to all numbers at once, results are truncated to the width of base.
+    Batch of one number is broadcast to the whole second operand, e.g. to xor all keys with one mask.
+    """
+    LIMB_BITS = 32
+    LIMB_BYTES = 4
+    LIMB_MASK = np.uint64(0xFFFFFFFF)
+
+    def __init__(self, limbs: np.ndarray, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE):
+        """
+        Initializes batch from the matrix of limbs.
+        :param limbs: (N, limbs) matrix of 32-bit limbs
+        :param endian_type: endian type of bytes and hex representation
+        """
+        limbs = np.asarray(limbs)
+        if limbs.ndim != 2:
+            raise ValueError(f"Expected (N, limbs) matrix, got shape {limbs.shape}")
+        self.limbs = np.ascontiguousarray(limbs, dtype=np.uint32)
+        self.endian_type = endian_type
+
+    @property
+    def base_size(self) -> int:
+        """
+        Width of every number in bytes.
+        """
+        return self.limbs.shape[1] * BigIntBatch.LIMB_BYTES
+
+    def __len__(self):
+        return self.limbs.shape[0]
+
+    @staticmethod
+    def zeros(count: int, base: Base = Base.BASE_32,
+              endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE) -> BigIntBatch:
+        """
+        Creates batch of count zeros.
+        """
+        BigIntBatch._check_base(base)
+        return BigIntBatch(np.zeros((count, base // BigIntBatch.LIMB_BYTES), dtype=np.uint32), endian_type)
+
+    @staticmethod
+    def from_bytes(data, base: Base = Base.BASE_32,
+                   endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE) -> BigIntBatch:
+        """
+        Creates batch from contiguous buffer of numbers, each of base bytes in endian_type order.
+        :param data: bytes-like object of N * base bytes
+        :param base: width of number in bytes
+        :param endian_type: byte order of every number
+        :return: new BigIntBatch
+        """
+        BigIntBatch._check_base(base)
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if raw.size % base:
+            raise ValueError(f"Buffer of {raw.size} bytes is not a multiple of base of {base} bytes")
+        raw = raw.reshape(-1, base)
+        if endian_type == EndianType.BIG_ENDIAN_TYPE:
+            raw = raw[:, ::-1]
+        limbs = np.ascontiguousarray(raw).view("<u4").astype(np.uint32)
+        return BigIntBatch(limbs, endian_type)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns contiguous buffer of numbers, each of base bytes in endian_type order.
+        """
+        raw = self.limbs.astype("<u4").view(np.uint8).reshape(len(self), self.base_size)
+        if self.endian_type == EndianType.BIG_ENDIAN_TYPE:
+            raw = raw[:, ::-1]
+        return raw.tobytes()
+
+    @staticmethod
+    def from_hex_list(hex_list: List[str], base: Base = Base.BASE_32,
+                      endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE) -> BigIntBatch:
+        """
+        Creates batch from hex representations in the same format as BigInt.getHex.
+        :param hex_list: list of hex representations
+        :param base: width of number in bytes
+        :param endian_type: endian type of hex representation
+        :return: new BigIntBatch
+        """
+        rows = []
+        for hex_repr in hex_list:
+            row = bytes.fromhex(hex_repr)
+            if len(row) > base:
+                raise ValueError(f"Value of {len(row)} bytes does not fit into base of {base} bytes")
+            # Pad with zeros on the side of the most significant byte
+            rows.append(row.rjust(base, b"\x00") if endian_type == EndianType.BIG_ENDIAN_TYPE
+                        else row.ljust(base, b"\x00"))
+        return BigIntBatch.from_bytes(b"".join(rows), base, endian_type)
+
+    def to_hex_list(self) -> List[str]:
+        """
+        Returns hex representations in the same format as BigInt.getHex.
+        """
+        data = self.to_bytes()
+        base = self.base_size
+        return [data[i:i + base].hex() for i in range(0, len(data), base)]
+
+    @staticmethod
+    def _check_base(base: int) -> None:
+        if base % BigIntBatch.LIMB_BYTES:
+            raise ValueError(f"Base of {base} bytes is not a multiple of {BigIntBatch.LIMB_BITS}-bit limbs")
+
+    def _check_operand(self, other: BigIntBatch) -> None:
+        """
+        Verifies that other batch has numbers of the same width.
+        :param other: second operand
+        """
+        if other.limbs.shape[1] != self.limbs.shape[1]:
+            raise ValueError(f"Operands of different width: {self.base_size} and {other.base_size}")
+
+    def _new(self, limbs: np.ndarray) -> BigIntBatch:
+        return BigIntBatch(limbs, self.endian_type)
+
+    def __str__(self):
+        return str(self.to_hex_list())
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __and__(self, other):
+        self._check_operand(other)
+        return self._new(self.limbs & other.limbs)
+
+    def __or__(self, other):
+        self._check_operand(other)
+        return self._new(self.limbs | other.limbs)
+
+    def __xor__(self, other):
+        self._check_operand(other)
+        return self._new(self.limbs ^ other.limbs)
+
+    def __invert__(self):
+        return self._new(~self.limbs)
+
+    def __lshift__(self, other: int):
+        limb_shifts, bit_shifts = divmod(other, BigIntBatch.LIMB_BITS)
+        count = self.limbs.shape[1]
+        result = np.zeros_like(self.limbs)
+        if limb_shifts >= count:
+            return self._new(result)
+
+        # Every limb is shifted in 64 bits: lower half stays in place, upper half moves to the next limb
+        wide = self.limbs[:, :count - limb_shifts].astype(np.uint64) << np.uint64(bit_shifts)
+        result[:, limb_shifts:] = wide & BigIntBatch.LIMB_MASK
+        result[:, limb_shifts + 1:] |= (wide[:, :-1] >> np.uint64(BigIntBatch.LIMB_BITS)).astype(np.uint32)
+        return self._new(result)
+
+    def __rshift__(self, other: int):
+        limb_shifts, bit_shifts = divmod(other, BigIntBatch.LIMB_BITS)
+        count = self.limbs.shape[1]
+        result = np.zeros_like(self.limbs)
+        if limb_shifts >= count:
+            return self._new(result)
+
+        wide = self.limbs[:, limb_shifts:].astype(np.uint64)
+        result[:, :count - limb_shifts] = wide >> np.uint64(bit_shifts)
+        if bit_shifts:
+            # Lower bits of the next limb move to the upper bits of the current one
+            moved = (wide[:, 1:] << np.uint64(BigIntBatch.LIMB_BITS - bit_shifts)) & BigIntBatch.LIMB_MASK
+            result[:, :count - limb_shifts - 1] |= moved.astype(np.uint32)
+        return self._new(result)
+
+    def __add__(self, other):
+        self._check_operand(other)
+        sums = self.limbs.astype(np.uint64) + other.limbs
+        result = np.empty(sums.shape, dtype=np.uint32)
+        carry = np.zeros(sums.shape[0], dtype=np.uint64)
+
+        # Carry goes sequentially over limbs, but for all numbers at once
+        for i in range(sums.shape[1]):
+            column = sums[:, i] + carry
+            result[:, i] = column & BigIntBatch.LIMB_MASK
+            carry = column >> np.uint64(BigIntBatch.LIMB_BITS)
+        return self._new(result)
+
+    def __sub__(self, other):
+        self._check_operand(other)
+        diffs = self.limbs.astype(np.int64) - other.limbs
+        result = np.empty(diffs.shape, dtype=np.uint32)
+        borrow = np.zeros(diffs.shape[0], dtype=np.int64)
+
+        for i in range(diffs.shape[1]):
+            column = diffs[:, i] - borrow
+            result[:, i] = column & 0xFFFFFFFF
+            borrow = (column < 0).astype(np.int64)
+        return self._new(result)
+
+    def compare(self, other: BigIntBatch) -> np.ndarray:
+        """
+        Compares numbers pairwise by the most significant different limb.
+        :param other: second operand
+        :return: array of -1 (less), 0 (equal), 1 (greater) for every number
+        """
+        self._check_operand(other)
+        a, b = np.broadcast_arrays(self.limbs, other.limbs)
+        different = a != b
+        # Index of the most significant different limb (or 0 for equal numbers)
+        top = a.shape[1] - 1 - np.argmax(different[:, ::-1], axis=1)
+        rows = np.arange(a.shape[0])
+        order = np.where(a[rows, top] < b[rows, top], -1, 1)
+        return np.where(different.any(axis=1), order, 0)
+
+    def __lt__(self, other):
+        return self.compare(other) < 0
+
+    def __le__(self, other):
+        return self.compare(other) <= 0
+
+    def __gt__(self, other):
+        return self.compare(other) > 0
+
+    def __ge__(self, other):
+        return self.compare(other) >= 0
+
+    def __eq__(self, other):
+        return self.compare(other) == 0
+
+    def __ne__(self, other):
+        return self.compare(other) != 0
+
+
+def test_batch_against_int(base, endian_type, count=200):
+    """
+    Compares results of all batch operators with the native int on random values.
+    :param base: base size in bytes
+    :param endian_type: endian type of hex representation
+    :param count: number of random pairs in batch
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+    mask = (1 << (8 * base)) - 1
+    xs = [random.getrandbits(8 * base) for _ in range(count)]
+    ys = [random.getrandbits(random.choice((8, 8 * base))) for _ in range(count)]
+    ys[0] = xs[0]
+    shift = random.randint(0, 8 * base)
+
+    def to_hex_list(values):
+        return [value.to_bytes(base, byteorder).hex() for value in values]
+
+    b1 = BigIntBatch.from_hex_list(to_hex_list(xs), base, endian_type)
+    b2 = BigIntBatch.from_hex_list(to_hex_list(ys), base, endian_type)
+
+    assert b1.to_hex_list() == to_hex_list(xs), "Error for hex"
+    assert (b1 & b2).to_hex_list() == to_hex_list(x & y for x, y in zip(xs, ys)), "Error for &"
+    assert (b1 | b2).to_hex_list() == to_hex_list(x | y for x, y in zip(xs, ys)), "Error for |"
+    assert (b1 ^ b2).to_hex_list() == to_hex_list(x ^ y for x, y in zip(xs, ys)), "Error for ^"
+    assert (~b1).to_hex_list() == to_hex_list(x ^ mask for x in xs), "Error for ~"
+    assert (b1 << shift).to_hex_list() == to_hex_list((x << shift) & mask for x in xs), f"Error for << {shift}"
+    assert (b1 >> shift).to_hex_list() == to_hex_list(x >> shift for x in xs), f"Error for >> {shift}"
+    assert (b1 + b2).to_hex_list() == to_hex_list((x + y) & mask for x, y in zip(xs, ys)), "Error for +"
+    assert (b1 - b2).to_hex_list() == to_hex_list((x - y) & mask for x, y in zip(xs, ys)), "Error for -"
+    assert list(b1 < b2) == [x < y for x, y in zip(xs, ys)], "Error for <"
+    assert list(b1 == b2) == [x == y for x, y in zip(xs, ys)], "Error for =="
+    assert list(b1 >= b2) == [x >= y for x, y in zip(xs, ys)], "Error for >="
+
+    # One mask for the whole batch
+    mask_batch = BigIntBatch.from_hex_list(to_hex_list(ys[:1]), base, endian_type)
+    assert (b1 ^ mask_batch).to_hex_list() == to_hex_list(x ^ ys[0] for x in xs), "Error for ^ with one mask"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+
+    for endian in EndianType:
+        for base_size in (Base.BASE_32, Base.BASE_64, 256):
+            test_batch_against_int(base_size, endian)
+
+    print("All BigIntBatch tests passed")
@@ -0,0 +1,726 @@
+from __future__ import annotations
+import operator
+import random
+import sys
+from array import array
+from enum import IntEnum
+from itertools import starmap, zip_longest
+from typing import Optional
+
+from task2_bigint.big_int import Base, EndianType
+from task2_bigint.limb_operations import LimbOperations
+from task2_bigint.modular import Division, Modular
+from task2_bigint.multiplication import Multiplication
+
+
+class LimbType(IntEnum):
+    """
+    Static class with sizes of limbs (in bits).
+    """
+    LIMB_32 = 32
+    LIMB_64 = 64
+
+
+def _limb_typecode(limb_bits: int) -> str:
+    """
+    Finds array.array typecode of unsigned integer with limb_bits size on this platform.
+    :param limb_bits: size of limb in bits
+    :return: typecode for array.array
+    """
+    for typecode in "ILQ":
+        if array(typecode).itemsize * 8 == limb_bits:
+            return typecode
+    raise ValueError(f"No unsigned array type of {limb_bits} bits on this platform")
+
+
+class LimbBigInt:
+    """
+    Big integer stored in array.array of 32 or 64-bit limbs.
+    Limbs are kept from the least significant to the most significant one, so
+    every operator loops once per limb instead of once per byte.
+    Hex representation and endianness work the same way as in BigInt.
+
+    With base=None the number has variable width: only significant limbs are stored,
+    results grow on overflow and leading zero limbs are removed.
+    """
+    TYPECODES = {limb_type: _limb_typecode(limb_type) for limb_type in LimbType}
+
+    def __init__(self, base: Optional[Base] = Base.BASE_32, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE,
+                 hex_repr: str = None, limb_type: LimbType = LimbType.LIMB_64):
+        limb_bytes = limb_type // 8
+        if base is not None and base % limb_bytes:
+            raise ValueError(f"Base of {base} bytes is not a multiple of {limb_type}-bit limbs")
+
+        self.base_size = base
+        self.endian_type = endian_type
+        self.limb_type = limb_type
+        self.limb_mask = (1 << limb_type) - 1
+        self.limbs = array(LimbBigInt.TYPECODES[limb_type], bytes(base or 0))
+        self._hash = None
+        if hex_repr:
+            self.setHex(hex_repr)
+
+    @property
+    def is_variable(self) -> bool:
+        """
+        True for number of variable width.
+        """
+        return self.base_size is None
+
+    def _new(self, base: Optional[int] = None) -> LimbBigInt:
+        """
+        Creates zero LimbBigInt with the same endian and limb type.
+        :param base: base size of result, by default the same as self
+        :return: new LimbBigInt
+        """
+        return LimbBigInt(base=base or self.base_size, endian_type=self.endian_type, limb_type=self.limb_type)
+
+    def _from_limbs(self, limbs, base: Optional[int] = None) -> LimbBigInt:
+        """
+        Creates LimbBigInt from the limbs. For fixed width the limbs are truncated or padded
+        with zeros to the width, for variable width leading zero limbs are removed.
+        :param limbs: iterable of limbs from the least significant one
+        :param base: base size of result, by default the same as self
+        :return: new LimbBigInt
+        """
+        result = self._new(base)
+        result.limbs = array(self.limbs.typecode, limbs)
+        result._fit_width()
+        return result
+
+    def _fit_width(self) -> None:
+        """
+        Truncates or pads limbs to the width of base, or removes leading zero limbs for variable width.
+        """
+        limbs = self.limbs
+        if self.is_variable:
+            while limbs and limbs[-1] == 0:
+                limbs.pop()
+            return
+
+        size = self.base_size // limbs.itemsize
+        if len(limbs) > size:
+            del limbs[size:]
+        elif len(limbs) < size:
+            limbs.frombytes(bytes((size - len(limbs)) * limbs.itemsize))
+
+    def _check_operand(self, other: LimbBigInt) -> None:
+        """
+        Verifies that other operand has the same width (or both are variable) and limb type.
+        :param other: second operand
+        """
+        if other.base_size != self.base_size or other.limb_type != self.limb_type:
+            raise ValueError(f"Operands of different width: {self.base_size}/{self.limb_type} "
+                             f"and {other.base_size}/{other.limb_type}")
+
+    def _le_limbs(self) -> array:
+        """
+        Returns limbs, which raw bytes are the value in little endian order:
+        limbs themselves on little endian platform, swapped copy otherwise.
+        """
+        if sys.byteorder == "little":
+            return self.limbs
+        limbs = array(self.limbs.typecode, self.limbs)
+        limbs.byteswap()
+        return limbs
+
+    def _byte_length(self) -> int:
+        """
+        Returns number of bytes in representation: base_size or significant bytes for variable width.
+        """
+        if not self.is_variable:
+            return self.base_size
+        if not self.limbs:
+            return 1
+        return (len(self.limbs) - 1) * self.limbs.itemsize + (self.limbs[-1].bit_length() + 7) // 8
+
+    def _set_bytes(self, data) -> None:
+        """
+        Sets value from bytes in order of endian_type, data is copied straight into the limbs.
+        :param data: bytes-like object, not longer than base_size
+        """
+        view = memoryview(data).cast("B")
+        itemsize = self.limbs.itemsize
+        if self.is_variable:
+            size = -(-len(view) // itemsize) * itemsize
+        elif len(view) > self.base_size:
+            raise ValueError(f"Value of {len(view)} bytes does not fit into base of {self.base_size} bytes")
+        else:
+            size = self.base_size
+
+        limbs = array(self.limbs.typecode, bytes(size))
+        if self.endian_type == EndianType.BIG_ENDIAN_TYPE:
+            view = view[::-1]
+        memoryview(limbs).cast("B")[:len(view)] = view
+        if sys.byteorder != "little":
+            limbs.byteswap()
+        self.limbs = limbs
+        self._fit_width()
+        self._hash = None
+
+    def _bytes_view(self) -> memoryview:
+        """
+        Returns memoryview of representation bytes in order of endian_type.
+        """
+        if not self.limbs:
+            # Zero of variable width is represented by one byte
+            return memoryview(b"\x00")
+        view = memoryview(self._le_limbs()).cast("B")[:self._byte_length()]
+        if self.endian_type == EndianType.BIG_ENDIAN_TYPE:
+            view = view[::-1]
+        return view
+
+    @staticmethod
+    def from_bytes(data, base: Optional[Base] = Base.BASE_32, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE,
+                   limb_type: LimbType = LimbType.LIMB_64) -> LimbBigInt:
+        """
+        Creates LimbBigInt from bytes in order of endian_type.
+        :param data: bytes-like object (bytes, bytearray, memoryview, ...), not longer than base
+        :param base: base size, None for variable width
+        :param endian_type: byte order of data
+        :param limb_type: size of limbs
+        :return: new LimbBigInt
+        """
+        result = LimbBigInt(base=base, endian_type=endian_type, limb_type=limb_type)
+        result._set_bytes(data)
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns bytes of value in order of endian_type: base_size bytes or significant bytes for variable width.
+        """
+        return self._bytes_view().tobytes()
+
+    def __bytes__(self):
+        return self.to_bytes()
+
+    def readinto(self, buffer) -> int:
+        """
+        Writes bytes of value in order of endian_type into the caller-supplied buffer without intermediate copies.
+        :param buffer: writable bytes-like object (bytearray, memoryview, ...)
+        :return: number of written bytes
+        """
+        view = self._bytes_view()
+        memoryview(buffer).cast("B")[:len(view)] = view
+        return len(view)
+
+    def getbuffer(self) -> memoryview:
+        """
+        Returns writable memoryview of limbs without copying.
+        Limbs are in the native byte order, from the least significant one.
+        Cached hash is reset, as the value can be changed through the view.
+        """
+        self._hash = None
+        return memoryview(self.limbs)
+
+    def getHex(self):
+        return self._bytes_view().hex()
+
+    def setHex(self, hex_repr: str):
+        self._set_bytes(bytes.fromhex(hex_repr))
+
+    def __str__(self):
+        return self.getHex()
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __and__(self, other):
+        self._check_operand(other)
+        # Missing limbs of the shorter variable operand are zeros, so zip truncation is exact
+        return self._from_limbs(map(operator.and_, self.limbs, other.limbs))
+
+    def __or__(self, other):
+        self._check_operand(other)
+        return self._from_limbs(starmap(operator.or_, zip_longest(self.limbs, other.limbs, fillvalue=0)))
+
+    def __xor__(self, other):
+        self._check_operand(other)
+        return self._from_limbs(starmap(operator.xor, zip_longest(self.limbs, other.limbs, fillvalue=0)))
+
+    def __invert__(self):
+        # Unlike BigInt, it is a real bitwise complement in the width of base.
+        if self.is_variable:
+            raise ValueError("Bitwise complement is not defined for variable width LimbBigInt")
+        return self._from_limbs(map(self.limb_mask.__xor__, self.limbs))
+
+    def __lshift__(self, other):
+        limb_shifts, bit_shifts = divmod(other, self.limb_type)
+        limbs = self.limbs
+        if not self.is_variable:
+            # Limbs shifted out of the width are dropped anyway
+            limb_shifts = min(limb_shifts, len(limbs))
+            limbs = limbs[:len(limbs) - limb_shifts]
+        return self._from_limbs([0] * limb_shifts + LimbOperations.shift_left(limbs, bit_shifts, self.limb_type))
+
+    def __rshift__(self, other):
+        limb_shifts, bit_shifts = divmod(other, self.limb_type)
+        return self._from_limbs(LimbOperations.shift_right(self.limbs[limb_shifts:], bit_shifts, self.limb_type))
+
+    def __add__(self, other):
+        self._check_operand(other)
+        return self._from_limbs(LimbOperations.add(self.limbs, other.limbs, self.limb_type))
+
+    def __sub__(self, other):
+        self._check_operand(other)
+        size = max(len(self.limbs), len(other.limbs))
+        if self.is_variable and LimbOperations.compare(self.limbs, other.limbs) < 0:
+            raise ValueError("Negative result of subtraction for variable width LimbBigInt")
+        return self._from_limbs(LimbOperations.sub(self.limbs, other.limbs, self.limb_type, size))
+
+    def __mul__(self, other: LimbBigInt) -> LimbBigInt:
+        self._check_operand(other)
+        product = Multiplication.multiply(self.limbs, other.limbs, self.limb_type)
+        return self._from_limbs(product, base=None if self.is_variable else self.base_size * 2)
+
+    def __divmod__(self, other: LimbBigInt) -> (LimbBigInt, LimbBigInt):
+        self._check_operand(other)
+        quotient, remainder = Division.divmod_limbs(self.limbs, other.limbs, self.limb_type)
+        return self._from_limbs(quotient), self._from_limbs(remainder)
+
+    def __floordiv__(self, other: LimbBigInt) -> LimbBigInt:
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: LimbBigInt) -> LimbBigInt:
+        return divmod(self, other)[1]
+
+    def __pow__(self, exp: LimbBigInt, mod: LimbBigInt = None) -> LimbBigInt:
+        if mod is None:
+            raise TypeError("LimbBigInt supports only modular exponentiation: pow(base, exp, mod)")
+        return LimbBigInt.pow_mod(self, exp, mod)
+
+    @staticmethod
+    def pow_mod(base: LimbBigInt, exp: LimbBigInt, mod: LimbBigInt) -> LimbBigInt:
+        """
+        Calculates base ** exp mod mod by sliding window exponentiation with Montgomery multiplication.
+        Montgomery context is cached per modulus.
+        :param base: base
+        :param exp: exponent
+        :param mod: modulus, result has the same width
+        :return: new LimbBigInt
+        """
+        mod._check_operand(base)
+        mod._check_operand(exp)
+        return mod._from_limbs(Modular.pow_limbs(base.limbs, exp.limbs, mod.limbs, mod.limb_type))
+
+    def _compare(self, other: LimbBigInt) -> int:
+        """
+        Compares values from the most significant limb and stops on the first different one.
+        Operands can have different width and limb type.
+        :return: -1 if self < other, 0 if equal, 1 if self > other
+        """
+        if other.limb_type == self.limb_type:
+            return LimbOperations.compare(self.limbs, other.limbs)
+
+        a = self._le_limbs().tobytes().rstrip(b"\x00")
+        b = other._le_limbs().tobytes().rstrip(b"\x00")
+        if len(a) != len(b):
+            return -1 if len(a) < len(b) else 1
+        a, b = a[::-1], b[::-1]
+        if a == b:
+            return 0
+        return -1 if a < b else 1
+
+    def __eq__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __ne__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) != 0
+
+    def __lt__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        if not isinstance(other, LimbBigInt):
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def __hash__(self):
+        # Hash of significant bytes does not depend on width and limb type, so equal values have equal hashes
+        if self._hash is None:
+            self._hash = hash(self._le_limbs().tobytes().rstrip(b"\x00"))
+        return self._hash
+
+
+class NativeBigInt:
+    """
+    Big integer stored in a single native Python int.
+    Fallback engine with the same hex and endianness API as BigInt and LimbBigInt.
+    With base=None the number has variable width, like LimbBigInt.
+    """
+
+    def __init__(self, base: Optional[Base] = Base.BASE_32, endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE,
+                 hex_repr: str = None):
+        self.base_size = base
+        self.endian_type = endian_type
+        self.mask = None if base is None else (1 << (8 * base)) - 1
+        self.value = 0
+        self._hash = None
+        if hex_repr:
+            self.setHex(hex_repr)
+
+    @property
+    def is_variable(self) -> bool:
+        """
+        True for number of variable width.
+        """
+        return self.base_size is None
+
+    def _new(self, value: int, base: Optional[int] = None) -> NativeBigInt:
+        """
+        Creates NativeBigInt with the same endian type.
+        :param value: int value, truncated to width of base
+        :param base: base size of result, by default the same as self
+        :return: new NativeBigInt
+        """
+        result = NativeBigInt(base=base or self.base_size, endian_type=self.endian_type)
+        if result.is_variable:
+            if value < 0:
+                raise ValueError("Negative result for variable width NativeBigInt")
+            result.value = value
+        else:
+            result.value = value & result.mask
+        return result
+
+    def _check_operand(self, other: NativeBigInt) -> None:
+        """
+        Verifies that other operand has the same width (or both are variable).
+        :param other: second operand
+        """
+        if other.base_size != self.base_size:
+            raise ValueError(f"Operands of different width: {self.base_size} and {other.base_size}")
+
+    def _byteorder(self) -> str:
+        """
+        Returns byteorder name of endian_type for int.to_bytes/int.from_bytes.
+        """
+        return "little" if self.endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+
+    def _byte_length(self) -> int:
+        """
+        Returns number of bytes in representation: base_size or significant bytes for variable width.
+        """
+        if self.is_variable:
+            return max(1, (self.value.bit_length() + 7) // 8)
+        return self.base_size
+
+    @staticmethod
+    def from_bytes(data, base: Optional[Base] = Base.BASE_32,
+                   endian_type: EndianType = EndianType.BIG_ENDIAN_TYPE) -> NativeBigInt:
+        """
+        Creates NativeBigInt from bytes in order of endian_type.
+        :param data: bytes-like object (bytes, bytearray, memoryview, ...), not longer than base
+        :param base: base size, None for variable width
+        :param endian_type: byte order of data
+        :return: new NativeBigInt
+        """
+        result = NativeBigInt(base=base, endian_type=endian_type)
+        result._set_bytes(data)
+        return result
+
+    def _set_bytes(self, data) -> None:
+        """
+        Sets value from bytes in order of endian_type.
+        :param data: bytes-like object
+        """
+        value = int.from_bytes(data, self._byteorder())
+        if not self.is_variable and value > self.mask:
+            raise ValueError(f"Value does not fit into base of {self.base_size} bytes")
+        self.value = value
+        self._hash = None
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns bytes of value in order of endian_type: base_size bytes or significant bytes for variable width.
+        """
+        return self.value.to_bytes(self._byte_length(), self._byteorder())
+
+    def __bytes__(self):
+        return self.to_bytes()
+
+    def readinto(self, buffer) -> int:
+        """
+        Writes bytes of value in order of endian_type into the caller-supplied buffer.
+        :param buffer: writable bytes-like object (bytearray, memoryview, ...)
+        :return: number of written bytes
+        """
+        data = self.to_bytes()
+        memoryview(buffer).cast("B")[:len(data)] = data
+        return len(data)
+
+    def getHex(self):
+        return self.to_bytes().hex()
+
+    def setHex(self, hex_repr: str):
+        self._set_bytes(bytes.fromhex(hex_repr))
+
+    def __str__(self):
+        return self.getHex()
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __and__(self, other):
+        self._check_operand(other)
+        return self._new(self.value & other.value)
+
+    def __or__(self, other):
+        self._check_operand(other)
+        return self._new(self.value | other.value)
+
+    def __xor__(self, other):
+        self._check_operand(other)
+        return self._new(self.value ^ other.value)
+
+    def __invert__(self):
+        if self.is_variable:
+            raise ValueError("Bitwise complement is not defined for variable width NativeBigInt")
+        return self._new(self.value ^ self.mask)
+
+    def __lshift__(self, other):
+        return self._new(self.value << other)
+
+    def __rshift__(self, other):
+        return self._new(self.value >> other)
+
+    def __add__(self, other):
+        self._check_operand(other)
+        return self._new(self.value + other.value)
+
+    def __sub__(self, other):
+        self._check_operand(other)
+        return self._new(self.value - other.value)
+
+    def __mul__(self, other: NativeBigInt) -> NativeBigInt:
+        self._check_operand(other)
+        return self._new(self.value * other.value, base=None if self.is_variable else self.base_size * 2)
+
+    def __divmod__(self, other: NativeBigInt) -> (NativeBigInt, NativeBigInt):
+        self._check_operand(other)
+        quotient, remainder = divmod(self.value, other.value)
+        return self._new(quotient), self._new(remainder)
+
+    def __floordiv__(self, other: NativeBigInt) -> NativeBigInt:
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: NativeBigInt) -> NativeBigInt:
+        return divmod(self, other)[1]
+
+    def __pow__(self, exp: NativeBigInt, mod: NativeBigInt = None) -> NativeBigInt:
+        if mod is None:
+            raise TypeError("NativeBigInt supports only modular exponentiation: pow(base, exp, mod)")
+        return NativeBigInt.pow_mod(self, exp, mod)
+
+    @staticmethod
+    def pow_mod(base: NativeBigInt, exp: NativeBigInt, mod: NativeBigInt) -> NativeBigInt:
+        """
+        Calculates base ** exp mod mod by the native pow.
+        :param base: base
+        :param exp: exponent
+        :param mod: modulus, result has the same width
+        :return: new NativeBigInt
+        """
+        mod._check_operand(base)
+        mod._check_operand(exp)
+        return mod._new(pow(base.value, exp.value, mod.value))
+
+    def __eq__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value == other.value
+
+    def __ne__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value != other.value
+
+    def __lt__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value < other.value
+
+    def __le__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value > other.value
+
+    def __ge__(self, other):
+        if not isinstance(other, NativeBigInt):
+            return NotImplemented
+        return self.value >= other.value
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.value)
+        return self._hash
+
+
+def test_bytes(big_int, expected: bytes):
+    """
+    Verifies bytes export and import of big int through bytes, memoryview and bytearray.
+    :param big_int: tested big int
+    :param expected: expected bytes in order of its endian_type
+    """
+    assert big_int.to_bytes() == expected, f"Error for to_bytes of {big_int}. Output is {big_int.to_bytes().hex()}"
+    assert bytes(big_int) == expected, f"Error for bytes() of {big_int}"
+
+    buffer = bytearray(len(expected) + 2)
+    written = big_int.readinto(memoryview(buffer)[1:])
+    assert written == len(expected) and buffer[1:-1] == expected, f"Error for readinto of {big_int}"
+
+    result = type(big_int).from_bytes(memoryview(buffer)[1:-1], big_int.base_size, big_int.endian_type)
+    assert result.getHex() == big_int.getHex(), f"Error for from_bytes of {big_int}. Output is {result}"
+
+
+def test_compare(b1, b2, x, y):
+    """
+    Verifies all comparison operators and hash of big ints with values x and y.
+    """
+    result = (b1 < b2, b1 <= b2, b1 == b2, b1 != b2, b1 >= b2, b1 > b2)
+    expected = (x < y, x <= y, x == y, x != y, x >= y, x > y)
+    assert result == expected, f"Error for compare {b1} and {b2}. Output is {result}"
+    if x == y:
+        assert hash(b1) == hash(b2), f"Error for hash of {b1} and {b2}"
+
+
+def test_against_int(big_int_factory, base, endian_type, iterations=50):
+    """
+    Compares results of all operators with the native int on random values.
+    :param big_int_factory: callable(base, endian_type, hex_repr) that creates tested big int
+    :param base: base size in bytes
+    :param endian_type: endian type of hex representation
+    :param iterations: number of random pairs
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+    mask = (1 << (8 * base)) - 1
+
+    def to_hex(value, size=base):
+        return value.to_bytes(size, byteorder).hex()
+
+    for _ in range(iterations):
+        x = random.getrandbits(8 * base)
+        y = random.getrandbits(8 * base)
+        shift = random.randint(0, 8 * base)
+        b1 = big_int_factory(base, endian_type, to_hex(x))
+        b2 = big_int_factory(base, endian_type, to_hex(y))
+
+        assert b1.getHex() == to_hex(x), f"Error for hex {to_hex(x)}. Output is {b1.getHex()}"
+        test_bytes(b1, bytes.fromhex(to_hex(x)))
+        assert (b1 & b2).getHex() == to_hex(x & y), f"Error for {b1} & {b2}"
+        assert (b1 | b2).getHex() == to_hex(x | y), f"Error for {b1} | {b2}"
+        assert (b1 ^ b2).getHex() == to_hex(x ^ y), f"Error for {b1} ^ {b2}"
+        assert (~b1).getHex() == to_hex(x ^ mask), f"Error for ~{b1}"
+        assert (b1 << shift).getHex() == to_hex((x << shift) & mask), f"Error for {b1} << {shift}"
+        assert (b1 >> shift).getHex() == to_hex(x >> shift), f"Error for {b1} >> {shift}"
+        assert (b1 + b2).getHex() == to_hex((x + y) & mask), f"Error for {b1} + {b2}"
+        assert (b1 - b2).getHex() == to_hex((x - y) & mask), f"Error for {b1} - {b2}"
+        assert (b1 * b2).getHex() == to_hex(x * y, 2 * base), f"Error for {b1} * {b2}"
+        test_compare(b1, b2, x, y)
+        test_compare(b1, b1, x, x)
+        if y:
+            quotient, remainder = divmod(b1, b2)
+            assert quotient.getHex() == to_hex(x // y), f"Error for {b1} // {b2}"
+            assert remainder.getHex() == to_hex(x % y), f"Error for {b1} % {b2}"
+            # Short exponent to keep the test fast
+            exp_shift = 8 * base - 16
+            assert pow(b1, b2 >> exp_shift, b1 | b2).getHex() == to_hex(pow(x, y >> exp_shift, x | y)), \
+                f"Error for pow({b1}, {b2 >> exp_shift}, {b1 | b2})"
+
+
+def test_variable_against_int(big_int_factory, endian_type, iterations=50):
+    """
+    Compares results of operators of variable width big int with the native int on random values of random sizes.
+    :param big_int_factory: callable(base, endian_type, hex_repr) that creates tested big int
+    :param endian_type: endian type of hex representation
+    :param iterations: number of random pairs
+    """
+    byteorder = "little" if endian_type == EndianType.LITTLE_ENDIAN_TYPE else "big"
+
+    def to_hex(value):
+        return value.to_bytes(max(1, (value.bit_length() + 7) // 8), byteorder).hex()
+
+    for _ in range(iterations):
+        x = random.getrandbits(random.randint(0, 600))
+        y = random.getrandbits(random.randint(0, 600))
+        x, y = max(x, y), min(x, y)
+        shift = random.randint(0, 200)
+        b1 = big_int_factory(None, endian_type, to_hex(x))
+        b2 = big_int_factory(None, endian_type, to_hex(y))
+
+        assert b1.getHex() == to_hex(x), f"Error for hex {to_hex(x)}. Output is {b1.getHex()}"
+        test_bytes(b1, bytes.fromhex(to_hex(x)))
+        assert (b1 & b2).getHex() == to_hex(x & y), f"Error for {b1} & {b2}"
+        assert (b1 | b2).getHex() == to_hex(x | y), f"Error for {b1} | {b2}"
+        assert (b1 ^ b2).getHex() == to_hex(x ^ y), f"Error for {b1} ^ {b2}"
+        assert (b1 << shift).getHex() == to_hex(x << shift), f"Error for {b1} << {shift}"
+        assert (b1 >> shift).getHex() == to_hex(x >> shift), f"Error for {b1} >> {shift}"
+        assert (b1 + b2).getHex() == to_hex(x + y), f"Error for {b1} + {b2}"
+        assert (b1 - b2).getHex() == to_hex(x - y), f"Error for {b1} - {b2}"
+        assert (b1 * b2).getHex() == to_hex(x * y), f"Error for {b1} * {b2}"
+        test_compare(b1, b2, x, y)
+        if y:
+            quotient, remainder = divmod(b1, b2)
+            assert quotient.getHex() == to_hex(x // y), f"Error for {b1} // {b2}"
+            assert remainder.getHex() == to_hex(x % y), f"Error for {b1} % {b2}"
+        if x != y:
+            try:
+                b2 - b1
+                assert False, f"No error for negative {b2} - {b1}"
+            except ValueError:
+                pass
+
+
+if __name__ == "__main__":
+    random.seed(3)
+
+    for endian in EndianType:
+        for base_size in (Base.BASE_32, Base.BASE_64, 256):
+            for limb in LimbType:
+                test_against_int(lambda base, endian_type, hex_repr: LimbBigInt(base, endian_type, hex_repr, limb),
+                                 base_size, endian)
+            test_against_int(NativeBigInt, base_size, endian)
+
+        for limb in LimbType:
+            test_variable_against_int(lambda base, endian_type, hex_repr: LimbBigInt(base, endian_type, hex_repr, limb),
+                                      endian)
+        test_variable_against_int(NativeBigInt, endian)
+
+    # The same hex vectors as for BigInt
+    b = LimbBigInt(hex_repr="ffaa000000000000000000000000000000000000000000000000000000000000",
+                   endian_type=EndianType.LITTLE_ENDIAN_TYPE)
+    print(f"LimbBigInt little endian: {b.getHex()}")
+    b = LimbBigInt(hex_repr="36f028580bb02cc8272a9a020f4200e346e276ae664e45ee80745574e2f5ab80",
+                   limb_type=LimbType.LIMB_32)
+    b2 = LimbBigInt(hex_repr="70983d692f648185febe6d6fa607630ae68649f7e6fc45b94680096c06e4fadb",
+                    limb_type=LimbType.LIMB_32)
+    assert (b + b2).getHex() == "a78865c13b14ae4e25e90771b54963ee2d68c0a64d4a8ba7c6f45ee0e9daa65b"
+    print(f"LimbBigInt add: {(b + b2).getHex()}")
+    # Equal values of different width and limb type are equal keys
+    keys = {LimbBigInt(Base.BASE_32, hex_repr="0102", limb_type=LimbType.LIMB_32): "value"}
+    assert keys[LimbBigInt(Base.BASE_64, hex_repr="0102", limb_type=LimbType.LIMB_64)] == "value"
+    assert keys[LimbBigInt(None, hex_repr="000102")] == "value"
+    values = sorted(LimbBigInt(None, hex_repr=value.to_bytes(4, "big").hex()) for value in (300, 5, 70000, 0))
+    assert [int(value.getHex(), 16) for value in values] == [0, 5, 300, 70000]
+
+    print("All LimbBigInt and NativeBigInt tests passed")
@@ -0,0 +1,111 @@
+from typing import List, Sequence
+
+from task2_bigint.multiplication import Multiplication
+
+
+class LimbOperations:
+    """
+    Helper operations on lists of limbs (from the least significant limb).
+    """
+
+    @staticmethod
+    def strip(limbs: Sequence[int]) -> List[int]:
+        """
+        Removes leading (most significant) zero limbs. Zero is an empty list.
+        """
+        return list(limbs[:LimbOperations.significant_length(limbs)])
+
+    @staticmethod
+    def significant_length(limbs: Sequence[int]) -> int:
+        """
+        Returns number of limbs without leading (most significant) zero limbs.
+        """
+        size = len(limbs)
+        while size and limbs[size - 1] == 0:
+            size -= 1
+        return size
+
+    @staticmethod
+    def compare(a: Sequence[int], b: Sequence[int]) -> int:
+        """
+        Compares two lists of limbs, leading zero limbs are ignored.
+        :return: -1 if a < b, 0 if a == b, 1 if a > b
+        """
+        size_a = LimbOperations.significant_length(a)
+        size_b = LimbOperations.significant_length(b)
+        if size_a != size_b:
+            return -1 if size_a < size_b else 1
+        # Compare from the most significant limb, stop on the first different one
+        for i in range(size_a - 1, -1, -1):
+            if a[i] != b[i]:
+                return -1 if a[i] < b[i] else 1
+        return 0
+
+    @staticmethod
+    def add(a: Sequence[int], b: Sequence[int], limb_bits: int) -> List[int]:
+        """
+        Adds lists of limbs, result is one limb longer than the longer operand.
+        """
+        if len(a) < len(b):
+            a, b = b, a
+        mask = (1 << limb_bits) - 1
+        result = [0] * (len(a) + 1)
+        carry = 0
+        for i in range(len(a)):
+            limb_sum = a[i] + (b[i] if i < len(b) else 0) + carry
+            result[i] = limb_sum & mask
+            carry = limb_sum >> limb_bits
+        result[len(a)] = carry
+        return result
+
+    @staticmethod
+    def sub(a: Sequence[int], b: Sequence[int], limb_bits: int, size: int = None) -> List[int]:
+        """
+        Subtracts lists of limbs modulo 2 ** (limb_bits * size).
+        :param size: number of limbs in result, by default len(a)
+        """
+        size = len(a) if size is None else size
+        mask = (1 << limb_bits) - 1
+        result = [0] * size
+        borrow = 0
+        for i in range(size):
+            limb_diff = (a[i] if i < len(a) else 0) - (b[i] if i < len(b) else 0) - borrow
+            result[i] = limb_diff & mask
+            borrow = (limb_diff >> limb_bits) & 1
+        return result
+
+    @staticmethod
+    def mul_low(a: Sequence[int], b: Sequence[int], limb_bits: int, size: int) -> List[int]:
+        """
+        Multiplies lists of limbs modulo 2 ** (limb_bits * size).
+        """
+        product = Multiplication.multiply(a, b, limb_bits)[:size]
+        return product + [0] * (size - len(product))
+
+    @staticmethod
+    def shift_left(limbs: Sequence[int], shift: int, limb_bits: int) -> List[int]:
+        """
+        Shifts limbs left by shift < limb_bits bits, result is one limb longer.
+        """
+        mask = (1 << limb_bits) - 1
+        result = [0] * (len(limbs) + 1)
+        carry = 0
+        for i, limb in enumerate(limbs):
+            shifted = (limb << shift) | carry
+            result[i] = shifted & mask
+            carry = shifted >> limb_bits
+        result[len(limbs)] = carry
+        return result
+
+    @staticmethod
+    def shift_right(limbs: Sequence[int], shift: int, limb_bits: int) -> List[int]:
+        """
+        Shifts limbs right by shift < limb_bits bits.
+        """
+        mask = (1 << limb_bits) - 1
+        result = [0] * len(limbs)
+        for i, limb in enumerate(limbs):
+            result[i] = limb >> shift
+            if i + 1 < len(limbs) and shift:
+                result[i] |= (limbs[i + 1] << (limb_bits - shift)) & mask
+        return result
@@ -0,0 +1,289 @@
+import random
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from task2_bigint.limb_operations import LimbOperations
+from task2_bigint.multiplication import Multiplication
+
+
+class Division:
+    """
+    Division of numbers stored as limbs.
+    """
+
+    @staticmethod
+    def divmod_limbs(a: Sequence[int], b: Sequence[int], limb_bits: int) -> (List[int], List[int]):
+        """
+        Divides limbs by Knuth algorithm D (one quotient limb per step).
+        :param a: limbs of dividend
+        :param b: limbs of divisor
+        :param limb_bits: size of limb in bits
+        :return: stripped limbs of quotient and remainder
+        """
+        a = LimbOperations.strip(a)
+        b = LimbOperations.strip(b)
+        if not b:
+            raise ZeroDivisionError("BigInt division by zero")
+        if LimbOperations.compare(a, b) < 0:
+            return [], a
+
+        if len(b) == 1:
+            return Division._divmod_single_limb(a, b[0], limb_bits)
+
+        mask = (1 << limb_bits) - 1
+        # Normalize divisor, so its most significant bit is set
+        shift = limb_bits - b[-1].bit_length()
+        b = LimbOperations.shift_left(b, shift, limb_bits)[:-1]
+        a = LimbOperations.shift_left(a, shift, limb_bits)
+
+        n = len(b)
+        b_top, b_next = b[-1], b[-2]
+        quotient = [0] * (len(a) - n)
+
+        for j in range(len(a) - n - 1, -1, -1):
+            # Estimate quotient limb by two top limbs, it is at most 2 bigger than the real one
+            q_hat, r_hat = divmod((a[j + n] << limb_bits) | a[j + n - 1], b_top)
+            while q_hat > mask or q_hat * b_next > ((r_hat << limb_bits) | a[j + n - 2]):
+                q_hat -= 1
+                r_hat += b_top
+                if r_hat > mask:
+                    break
+
+            # Multiply and subtract
+            carry = 0
+            borrow = 0
+            for i in range(n):
+                product = q_hat * b[i] + carry
+                carry = product >> limb_bits
+                limb_diff = a[i + j] - (product & mask) - borrow
+                a[i + j] = limb_diff & mask
+                borrow = (limb_diff >> limb_bits) & 1
+            limb_diff = a[j + n] - carry - borrow
+            a[j + n] = limb_diff & mask
+
+            if limb_diff < 0:
+                # Estimation was 1 too big, add divisor back
+                q_hat -= 1
+                carry = 0
+                for i in range(n):
+                    limb_sum = a[i + j] + b[i] + carry
+                    a[i + j] = limb_sum & mask
+                    carry = limb_sum >> limb_bits
+                a[j + n] = (a[j + n] + carry) & mask
+            quotient[j] = q_hat
+
+        remainder = LimbOperations.shift_right(a[:n], shift, limb_bits)
+        return LimbOperations.strip(quotient), LimbOperations.strip(remainder)
+
+    @staticmethod
+    def _divmod_single_limb(a: List[int], divisor: int, limb_bits: int) -> (List[int], List[int]):
+        """
+        Divides limbs by one limb divisor.
+        """
+        quotient = [0] * len(a)
+        remainder = 0
+        for i in range(len(a) - 1, -1, -1):
+            quotient[i], remainder = divmod((remainder << limb_bits) | a[i], divisor)
+        return LimbOperations.strip(quotient), LimbOperations.strip([remainder])
+
+
+class MontgomeryContext:
+    """
+    Precomputed values for Montgomery multiplication modulo odd N with R = 2 ** (limb_bits * n).
+    Numbers in Montgomery form are stored as x * R mod N.
+    """
+
+    def __init__(self, modulus: Sequence[int], limb_bits: int) -> None:
+        """
+        Precomputes N' = -N^-1 mod R and R^2 mod N.
+        :param modulus: stripped limbs of odd modulus
+        :param limb_bits: size of limb in bits
+        """
+        if not modulus or modulus[0] % 2 == 0:
+            raise ValueError("Montgomery modulus should be odd")
+
+        self.modulus = list(modulus)
+        self.limb_bits = limb_bits
+        self.size = len(modulus)
+
+        # Inverse of N mod R by Hensel lifting, starting from the inverse of the lowest limb
+        inverse = [pow(modulus[0], -1, 1 << limb_bits)]
+        precision = 1
+        while precision < self.size:
+            precision = min(2 * precision, self.size)
+            n_inv = LimbOperations.mul_low(self.modulus[:precision], inverse, limb_bits, precision)
+            inverse = LimbOperations.mul_low(inverse, LimbOperations.sub([2], n_inv, limb_bits, precision),
+                                             limb_bits, precision)
+        self.n_prime = LimbOperations.sub([], inverse, limb_bits, self.size)
+
+        r_squared = [0] * (2 * self.size) + [1]
+        self.r_squared = Division.divmod_limbs(r_squared, self.modulus, limb_bits)[1]
+        self.one = self.reduce(self.r_squared)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get(modulus: Tuple[int, ...], limb_bits: int) -> "MontgomeryContext":
+        """
+        Returns cached context for the modulus.
+        :param modulus: tuple of stripped limbs of odd modulus
+        :param limb_bits: size of limb in bits
+        """
+        return MontgomeryContext(modulus, limb_bits)
+
+    def reduce(self, t: Sequence[int]) -> List[int]:
+        """
+        Montgomery reduction, calculates t * R^-1 mod N for t < N * R.
+        :return: list of size limbs
+        """
+        size = self.size
+        t_low = list(t[:size])
+        m = LimbOperations.mul_low(t_low, self.n_prime, self.limb_bits, size)
+        # t + m * N is divisible by R, so division is the drop of lower limbs
+        u = LimbOperations.add(t, Multiplication.multiply(m, self.modulus, self.limb_bits), self.limb_bits)[size:]
+        u = LimbOperations.strip(u)
+        if LimbOperations.compare(u, self.modulus) >= 0:
+            u = LimbOperations.sub(u, self.modulus, self.limb_bits)
+        u = u[:size]
+        return u + [0] * (size - len(u))
+
+    def mul(self, a: Sequence[int], b: Sequence[int]) -> List[int]:
+        """
+        Multiplies numbers in Montgomery form.
+        """
+        return self.reduce(Multiplication.multiply(a, b, self.limb_bits))
+
+    def to_montgomery(self, a: Sequence[int]) -> List[int]:
+        """
+        Converts a < N to Montgomery form.
+        """
+        return self.mul(a, self.r_squared)
+
+    def from_montgomery(self, a: Sequence[int]) -> List[int]:
+        """
+        Converts a from Montgomery form.
+        """
+        return self.reduce(a)
+
+
+class Modular:
+    """
+    Modular exponentiation of numbers stored as limbs.
+    """
+
+    @staticmethod
+    def window_size(exp_bits: int) -> int:
+        """
+        Chooses size of sliding window by exponent size.
+        """
+        for min_bits, window in ((672, 6), (240, 5), (80, 4), (24, 3)):
+            if exp_bits >= min_bits:
+                return window
+        return 1
+
+    @staticmethod
+    def pow_limbs(base: Sequence[int], exp: Sequence[int], mod: Sequence[int], limb_bits: int) -> List[int]:
+        """
+        Calculates base ** exp mod mod by sliding window exponentiation.
+        Montgomery multiplication is used for odd modulus, division for even one.
+        :return: stripped limbs of result
+        """
+        mod = LimbOperations.strip(mod)
+        if not mod:
+            raise ZeroDivisionError("BigInt modulo by zero")
+        base = Division.divmod_limbs(base, mod, limb_bits)[1]
+        exp_bits = "".join(format(limb, f"0{limb_bits}b") for limb in reversed(exp)).lstrip("0")
+
+        if mod[0] % 2 == 1:
+            context = MontgomeryContext.get(tuple(mod), limb_bits)
+            base = context.to_montgomery(base)
+            result = Modular._sliding_window(base, exp_bits, context.mul, context.one)
+            return LimbOperations.strip(context.from_montgomery(result))
+
+        def mul(a, b):
+            return Division.divmod_limbs(Multiplication.multiply(a, b, limb_bits), mod, limb_bits)[1]
+        return LimbOperations.strip(Modular._sliding_window(base, exp_bits, mul, Division.divmod_limbs([1], mod, limb_bits)[1]))
+
+    @staticmethod
+    def _sliding_window(base: List[int], exp_bits: str, mul, one: List[int]) -> List[int]:
+        """
+        Left-to-right sliding window exponentiation.
+        :param base: base in the form used by mul
+        :param exp_bits: binary string of exponent without leading zeros
+        :param mul: modular multiplication function
+        :param one: one in the form used by mul
+        """
+        window = Modular.window_size(len(exp_bits))
+
+        # Odd powers of base: base, base^3, base^5, ...
+        odd_powers = [base]
+        if window > 1:
+            base_squared = mul(base, base)
+            for _ in range((1 << (window - 1)) - 1):
+                odd_powers.append(mul(odd_powers[-1], base_squared))
+
+        result = None
+        i = 0
+        while i < len(exp_bits):
+            if exp_bits[i] == "0":
+                result = mul(result, result)
+                i += 1
+                continue
+
+            # The longest window not longer than window size, that ends by 1
+            j = min(i + window, len(exp_bits))
+            while exp_bits[j - 1] == "0":
+                j -= 1
+            if result is None:
+                result = odd_powers[int(exp_bits[i:j], 2) >> 1]
+            else:
+                for _ in range(j - i):
+                    result = mul(result, result)
+                result = mul(result, odd_powers[int(exp_bits[i:j], 2) >> 1])
+            i = j
+
+        return one if result is None else result
+
+
+def _to_limbs(value: int, limb_bits: int) -> List[int]:
+    return [(value >> shift) & ((1 << limb_bits) - 1) for shift in range(0, value.bit_length(), limb_bits)]
+
+
+def _from_limbs(limbs: Sequence[int], limb_bits: int) -> int:
+    return sum(limb << (i * limb_bits) for i, limb in enumerate(limbs))
+
+
+def test_divmod(limb_bits, bits_a, bits_b):
+    """
+    Compares division of random values with the native int division.
+    """
+    x = random.getrandbits(bits_a)
+    y = random.getrandbits(bits_b) or 1
+    q, r = Division.divmod_limbs(_to_limbs(x, limb_bits), _to_limbs(y, limb_bits), limb_bits)
+    assert (_from_limbs(q, limb_bits), _from_limbs(r, limb_bits)) == divmod(x, y), f"Error for divmod({x}, {y})"
+
+
+def test_pow(limb_bits, bits, odd):
+    """
+    Compares modular exponentiation of random values with the native pow.
+    """
+    x = random.getrandbits(bits)
+    e = random.getrandbits(bits)
+    m = random.getrandbits(bits) | (1 << (bits - 1))
+    m = m | 1 if odd else m & ~1
+    result = Modular.pow_limbs(_to_limbs(x, limb_bits), _to_limbs(e, limb_bits), _to_limbs(m, limb_bits), limb_bits)
+    assert _from_limbs(result, limb_bits) == pow(x, e, m), f"Error for pow({x}, {e}, {m})"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+
+    for limb_bits in (8, 32, 64):
+        for bits_a, bits_b in ((64, 8), (256, 256), (512, 200), (2048, 1024), (4096, 2047), (100, 300)):
+            for _ in range(10):
+                test_divmod(limb_bits, bits_a, bits_b)
+
+        for bits in (8, 61, 256, 1024):
+            test_pow(limb_bits, bits, odd=True)
+            test_pow(limb_bits, bits, odd=False)
+
+    print("All modular tests passed")
@@ -0,0 +1,193 @@
+import random
+from itertools import zip_longest
+from operator import add
+from typing import List, Sequence
+
+
+class Multiplication:
+    """
+    Multiplication engine for numbers stored as limbs (from the least significant limb).
+    Limbs are multiplied as polynomial coefficients without carries: schoolbook for small
+    operands, Karatsuba and Toom-3 above thresholds. Carries are normalized once at the end.
+    """
+    # Minimal number of limbs of the shorter operand to use Karatsuba
+    KARATSUBA_THRESHOLD = 40
+    # Minimal number of limbs of the shorter operand to use Toom-3
+    TOOM3_THRESHOLD = 160
+
+    @staticmethod
+    def multiply(a: Sequence[int], b: Sequence[int], limb_bits: int) -> List[int]:
+        """
+        Multiplies two numbers stored as limbs.
+        :param a: limbs of first operand
+        :param b: limbs of second operand
+        :param limb_bits: size of limb in bits
+        :return: len(a) + len(b) limbs of product
+        """
+        coeffs = Multiplication.poly_mul(list(a), list(b))
+        return Multiplication.normalize(coeffs, limb_bits, len(a) + len(b))
+
+    @staticmethod
+    def normalize(coeffs: Sequence[int], limb_bits: int, size: int) -> List[int]:
+        """
+        Propagates carries of non-negative coefficients into limbs.
+        :param coeffs: coefficients of product, can be bigger than limb
+        :param limb_bits: size of limb in bits
+        :param size: number of limbs in result, higher limbs are truncated
+        :return: list of limbs
+        """
+        mask = (1 << limb_bits) - 1
+        result = [0] * size
+        carry = 0
+        for i in range(size):
+            if i < len(coeffs):
+                carry += coeffs[i]
+            result[i] = carry & mask
+            carry >>= limb_bits
+        return result
+
+    @staticmethod
+    def poly_mul(a: List[int], b: List[int]) -> List[int]:
+        """
+        Multiplies coefficient lists, algorithm is chosen by size of the shorter operand.
+        :param a: coefficients of first operand
+        :param b: coefficients of second operand
+        :return: len(a) + len(b) - 1 coefficients of product
+        """
+        if len(a) < len(b):
+            a, b = b, a
+        if not b:
+            return []
+
+        size = len(b)
+        if size < Multiplication.KARATSUBA_THRESHOLD:
+            return Multiplication.schoolbook(a, b)
+
+        if len(a) >= 2 * size:
+            # Unbalanced operands: multiply by slices of the longer one of the size of the shorter one
+            result = [0] * (len(a) + size - 1)
+            for offset in range(0, len(a), size):
+                part = Multiplication.poly_mul(a[offset:offset + size], b)
+                result[offset:offset + len(part)] = map(add, result[offset:offset + len(part)], part)
+            return result
+
+        if size < Multiplication.TOOM3_THRESHOLD:
+            return Multiplication.karatsuba(a, b)
+        return Multiplication.toom3(a, b)
+
+    @staticmethod
+    def schoolbook(a: List[int], b: List[int]) -> List[int]:
+        """
+        Quadratic multiplication of coefficient lists.
+        """
+        result = [0] * (len(a) + len(b) - 1)
+        len_b = len(b)
+        for i, x in enumerate(a):
+            if x:
+                result[i:i + len_b] = map(add, result[i:i + len_b], [x * y for y in b])
+        return result
+
+    @staticmethod
+    def karatsuba(a: List[int], b: List[int]) -> List[int]:
+        """
+        Karatsuba multiplication of coefficient lists:
+        (a0 + a1*x)(b0 + b1*x) = z0 + ((a0 + a1)(b0 + b1) - z0 - z2)*x + z2*x^2
+        """
+        half = max(len(a), len(b)) // 2
+        a0, a1 = a[:half], a[half:]
+        b0, b1 = b[:half], b[half:]
+
+        z0 = Multiplication.poly_mul(a0, b0)
+        z2 = Multiplication.poly_mul(a1, b1)
+        z1 = Multiplication.poly_mul(Multiplication._poly_add(a0, a1), Multiplication._poly_add(b0, b1))
+        z1 = Multiplication._poly_sub(Multiplication._poly_sub(z1, z0), z2)
+
+        result = [0] * (len(a) + len(b) - 1)
+        Multiplication._add_at(result, z0, 0)
+        Multiplication._add_at(result, z1, half)
+        Multiplication._add_at(result, z2, 2 * half)
+        return result
+
+    @staticmethod
+    def toom3(a: List[int], b: List[int]) -> List[int]:
+        """
+        Toom-3 multiplication of coefficient lists.
+        Evaluation in points 0, 1, -1, -2, inf and Bodrato interpolation sequence.
+        """
+        part = (max(len(a), len(b)) + 2) // 3
+        a0, a1, a2 = a[:part], a[part:2 * part], a[2 * part:]
+        b0, b1, b2 = b[:part], b[part:2 * part], b[2 * part:]
+
+        r0 = Multiplication.poly_mul(a0, b0)
+        r1 = Multiplication.poly_mul(*Multiplication._toom3_eval(a0, a1, a2, b0, b1, b2, 1))
+        rm1 = Multiplication.poly_mul(*Multiplication._toom3_eval(a0, a1, a2, b0, b1, b2, -1))
+        rm2 = Multiplication.poly_mul(*Multiplication._toom3_eval(a0, a1, a2, b0, b1, b2, -2))
+        rinf = Multiplication.poly_mul(a2, b2)
+
+        # Interpolation, all divisions are exact
+        c3 = [x // 3 for x in Multiplication._poly_sub(rm2, r1)]
+        c1 = [x // 2 for x in Multiplication._poly_sub(r1, rm1)]
+        c2 = Multiplication._poly_sub(rm1, r0)
+        c3 = Multiplication._poly_add([x // 2 for x in Multiplication._poly_sub(c2, c3)], [2 * x for x in rinf])
+        c2 = Multiplication._poly_sub(Multiplication._poly_add(c2, c1), rinf)
+        c1 = Multiplication._poly_sub(c1, c3)
+
+        result = [0] * (len(a) + len(b) - 1)
+        for power, coeffs in enumerate((r0, c1, c2, c3, rinf)):
+            Multiplication._add_at(result, coeffs, power * part)
+        return result
+
+    @staticmethod
+    def _toom3_eval(a0, a1, a2, b0, b1, b2, point: int) -> (List[int], List[int]):
+        """
+        Evaluates both split operands in the point.
+        """
+        square = point * point
+        a_val = [x + point * y + square * z for x, y, z in zip_longest(a0, a1, a2, fillvalue=0)]
+        b_val = [x + point * y + square * z for x, y, z in zip_longest(b0, b1, b2, fillvalue=0)]
+        return a_val, b_val
+
+    @staticmethod
+    def _poly_add(a: List[int], b: List[int]) -> List[int]:
+        return [x + y for x, y in zip_longest(a, b, fillvalue=0)]
+
+    @staticmethod
+    def _poly_sub(a: List[int], b: List[int]) -> List[int]:
+        return [x - y for x, y in zip_longest(a, b, fillvalue=0)]
+
+    @staticmethod
+    def _add_at(result: List[int], coeffs: List[int], offset: int) -> None:
+        """
+        Adds coefficients to result starting from offset. Zero coefficients out of result are dropped.
+        """
+        end = min(offset + len(coeffs), len(result))
+        result[offset:end] = map(add, result[offset:end], coeffs[:end - offset])
+
+
+def test_multiply(limb_bits, size_a, size_b):
+    """
+    Compares product of random limbs with the native int product.
+    """
+    a = [random.getrandbits(limb_bits) for _ in range(size_a)]
+    b = [random.getrandbits(limb_bits) for _ in range(size_b)]
+    x = sum(limb << (i * limb_bits) for i, limb in enumerate(a))
+    y = sum(limb << (i * limb_bits) for i, limb in enumerate(b))
+    product = Multiplication.multiply(a, b, limb_bits)
+    result = sum(limb << (i * limb_bits) for i, limb in enumerate(product))
+    assert result == x * y, f"Error for {size_a} x {size_b} limbs of {limb_bits} bits"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+
+    for limb_bits in (8, 32, 64):
+        for size_a, size_b in ((1, 1), (5, 3), (30, 30), (64, 17), (100, 100), (128, 128), (300, 200)):
+            test_multiply(limb_bits, size_a, size_b)
+
+    # Force Karatsuba and Toom-3 on small operands
+    Multiplication.KARATSUBA_THRESHOLD = 2
+    Multiplication.TOOM3_THRESHOLD = 4
+    for size_a, size_b in ((2, 2), (3, 5), (7, 7), (16, 9), (33, 40), (65, 64)):
+        test_multiply(32, size_a, size_b)
+
+    print("All multiplication tests passed")
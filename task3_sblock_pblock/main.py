@@ -1,4 +1,106 @@
-from typing import Tuple
+import io
+import os
+import random
+from functools import lru_cache
+from operator import getitem
+from typing import BinaryIO, List, Tuple
+
+# Size of chunk for streams and files, 1 MiB
+CHUNK_SIZE = 1 << 20
+
+
+def _translate(data, table: bytes) -> bytes:
+    """
+    Replaces every byte of data by value from 256-entry table.
+    :param data: bytes-like object
+    :param table: 256-entry table
+    :return: translated bytes
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    return bytes(data.translate(table))
+
+
+def _translate_str(inp_mesg: str, table: bytes) -> str:
+    """
+    Replaces every char of string by value from 256-entry table.
+    :param inp_mesg: string of chars with codes up to 255
+    :param table: 256-entry table
+    :return: translated string
+    """
+    try:
+        data = inp_mesg.encode("latin-1")
+    except UnicodeEncodeError as error:
+        raise ValueError(f"Char {inp_mesg[error.start]!r} is out of the 256-entry table") from None
+    return data.translate(table).decode("latin-1")
+
+
+def translate_stream(src: BinaryIO, dst: BinaryIO, table: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Translates binary stream by fixed-size chunks, so payload is never held in memory as a whole.
+    Chunks are read into one reusable buffer.
+    :param src: binary stream with readinto, e.g. file opened in "rb" mode
+    :param dst: binary stream to write, e.g. file opened in "wb" mode
+    :param table: 256-entry table
+    :param chunk_size: size of chunk in bytes
+    :return: number of processed bytes
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = 0
+    while True:
+        size = src.readinto(buffer)
+        if not size:
+            break
+        dst.write(buffer.translate(table) if size == chunk_size else view[:size].tobytes().translate(table))
+        total += size
+    return total
+
+
+def translate_file(src_path: str, dst_path: str, table: bytes, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Translates file by fixed-size chunks.
+    :param src_path: path of input file
+    :param dst_path: path of output file
+    :param table: 256-entry table
+    :param chunk_size: size of chunk in bytes
+    :return: number of processed bytes
+    """
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        return translate_stream(src, dst, table, chunk_size)
+
+
+class ByteStream:
+    """
+    Incremental encryption or decryption of bytes by 256-entry table.
+    Every byte is processed independently, so data can be split into chunks of any size.
+    """
+    def __init__(self, table: bytes):
+        """
+        :param table: 256-entry table, e.g. S_block.ENCRYPT_BYTES
+        """
+        self.table = table
+        self.finalized = False
+
+    def update(self, data) -> bytes:
+        """
+        Processes next chunk of data.
+        :param data: bytes-like object
+        :return: processed chunk
+        """
+        if self.finalized:
+            raise ValueError("Stream is already finalized")
+        return _translate(data, self.table)
+
+    def finalize(self) -> bytes:
+        """
+        Finishes the stream, no data is buffered, so the rest is always empty.
+        :return: empty bytes
+        """
+        if self.finalized:
+            raise ValueError("Stream is already finalized")
+        self.finalized = True
+        return b""
 
 
 class S_cryptography:
@@ -12,13 +114,8 @@ class S_cryptography:
         :param inp_mesg: input string to encryption
         :return: encrypted string
         """
-        out_mesg = ""
-
-        # Iterate over each char symbol of string
-        for char in inp_mesg:
-            # Encrypt the int representation of char by S_block
-            out_mesg += chr(S_block.s_encrypt(ord(char)))
-        return out_mesg
+        # Substitute all chars by one call with flat S-box table
+        return _translate_str(inp_mesg, S_block.ENCRYPT_BYTES)
 
     @staticmethod
     def decrypt(inp_mesg: str) -> str:
@@ -27,13 +124,72 @@ class S_cryptography:
         :param inp_mesg: input string to decryption
         :return: decrypted string
         """
-        out_mesg = ""
+        # Substitute all chars by one call with flat inverse S-box table
+        return _translate_str(inp_mesg, S_block.DECRYPT_BYTES)
 
-        # Iterate over each char symbol of string
-        for char in inp_mesg:
-            # Decrypt the int representation of char by S_block
-            out_mesg += chr(S_block.s_decrypt(ord(char)))
-        return out_mesg
+    @staticmethod
+    def encrypt_bytes(data) -> bytes:
+        """
+        Encrypts bytes.
+        :param data: bytes-like object to encryption
+        :return: encrypted bytes
+        """
+        return _translate(data, S_block.ENCRYPT_BYTES)
+
+    @staticmethod
+    def decrypt_bytes(data) -> bytes:
+        """
+        Decrypts bytes.
+        :param data: bytes-like object to decryption
+        :return: decrypted bytes
+        """
+        return _translate(data, S_block.DECRYPT_BYTES)
+
+    @staticmethod
+    def encryptor() -> ByteStream:
+        """
+        Creates stream object with update() and finalize() for encryption.
+        """
+        return ByteStream(S_block.ENCRYPT_BYTES)
+
+    @staticmethod
+    def decryptor() -> ByteStream:
+        """
+        Creates stream object with update() and finalize() for decryption.
+        """
+        return ByteStream(S_block.DECRYPT_BYTES)
+
+    @staticmethod
+    def encrypt_stream(src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Encrypts binary stream by chunks.
+        :return: number of processed bytes
+        """
+        return translate_stream(src, dst, S_block.ENCRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def decrypt_stream(src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Decrypts binary stream by chunks.
+        :return: number of processed bytes
+        """
+        return translate_stream(src, dst, S_block.DECRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def encrypt_file(src_path: str, dst_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Encrypts file by chunks.
+        :return: number of processed bytes
+        """
+        return translate_file(src_path, dst_path, S_block.ENCRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def decrypt_file(src_path: str, dst_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Decrypts file by chunks.
+        :return: number of processed bytes
+        """
+        return translate_file(src_path, dst_path, S_block.DECRYPT_BYTES, chunk_size)
 
 
 class S_block:
@@ -83,6 +239,11 @@ class S_block:
                         [0xa0, 0xe0, 0x3b, 0x4d, 0xae, 0x2a, 0xf5, 0xb0, 0xc8, 0xeb, 0xbb, 0x3c, 0x83, 0x53, 0x99, 0x61],
                         [0x17, 0x2b, 0x04, 0x7e, 0xba, 0x77, 0xd6, 0x26, 0xe1, 0x69, 0x14, 0x63, 0x55, 0x21, 0x0c, 0x7d]]
 
+    # Flat 256-entry tables, index is the whole 8bit value (row * 16 + column).
+    # Tables are bytes, so they can be used directly in bytes.translate and str.translate.
+    ENCRYPT_BYTES = bytes(value for row in ENCRYPT_TABLE for value in row)
+    DECRYPT_BYTES = bytes(value for row in DECRYPT_TABLE for value in row)
+
     @staticmethod
     def s_encrypt(inp_mesg: int) -> int:
         """
@@ -90,11 +251,8 @@ class S_block:
         :param inp_mesg: input integer (8bit) to encryption
         :return: encrypted int
         """
-        row = (inp_mesg & 0xF0) >> 4    # left 4bits
-        col = inp_mesg & 0x0F           # right 4bits
-
-        # Choose value from encrypt table by row and column index by left and right 4 bits
-        return S_block.ENCRYPT_TABLE[row][col]
+        # Flat table index is the same as row and column index by left and right 4 bits
+        return S_block.ENCRYPT_BYTES[inp_mesg & 0xFF]
 
     @staticmethod
     def s_decrypt(inp_mesg: int) -> int:
@@ -103,11 +261,8 @@ class S_block:
         :param inp_mesg: input integer (8bit) to decryption
         :return: decrypted int
         """
-        row = (inp_mesg & 0xF0) >> 4    # left 4bits
-        col = inp_mesg & 0x0F           # right 4bits
-
-        # Choose value from decrypt table by row and column index by left and right 4 bits
-        return S_block.DECRYPT_TABLE[row][col]
+        # Flat table index is the same as row and column index by left and right 4 bits
+        return S_block.DECRYPT_BYTES[inp_mesg & 0xFF]
 
 
 class P_cryptography:
@@ -121,13 +276,8 @@ class P_cryptography:
         :param inp_mesg: input string to encryption
         :return: encrypted string
         """
-        out_mesg = ""
-
-        # Iterate over each char symbol of string
-        for char in inp_mesg:
-            # Encrypt the int representation of char by P_block
-            out_mesg += chr(P_block.p_encrypt(ord(char), P_block.ENCRYPT_POS))
-        return out_mesg
+        # Permute all chars by one call with full P-box table
+        return _translate_str(inp_mesg, P_block.ENCRYPT_BYTES)
 
     @staticmethod
     def decrypt(inp_mesg: str) -> str:
@@ -136,13 +286,205 @@ class P_cryptography:
         :param inp_mesg: input string to decryption
         :return: decrypted string
         """
-        out_mesg = ""
+        # Permute all chars by one call with full inverse P-box table
+        return _translate_str(inp_mesg, P_block.DECRYPT_BYTES)
+
+    @staticmethod
+    def encrypt_bytes(data) -> bytes:
+        """
+        Encrypts bytes.
+        :param data: bytes-like object to encryption
+        :return: encrypted bytes
+        """
+        return _translate(data, P_block.ENCRYPT_BYTES)
+
+    @staticmethod
+    def decrypt_bytes(data) -> bytes:
+        """
+        Decrypts bytes.
+        :param data: bytes-like object to decryption
+        :return: decrypted bytes
+        """
+        return _translate(data, P_block.DECRYPT_BYTES)
+
+    @staticmethod
+    def encryptor() -> ByteStream:
+        """
+        Creates stream object with update() and finalize() for encryption.
+        """
+        return ByteStream(P_block.ENCRYPT_BYTES)
+
+    @staticmethod
+    def decryptor() -> ByteStream:
+        """
+        Creates stream object with update() and finalize() for decryption.
+        """
+        return ByteStream(P_block.DECRYPT_BYTES)
 
-        # Iterate over each char symbol of string
-        for char in inp_mesg:
-            # Decrypt the int representation of char by P_block
-            out_mesg += chr(P_block.p_decrypt(ord(char), P_block.DECRYPT_POS))
-        return out_mesg
+    @staticmethod
+    def encrypt_stream(src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Encrypts binary stream by chunks.
+        :return: number of processed bytes
+        """
+        return translate_stream(src, dst, P_block.ENCRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def decrypt_stream(src: BinaryIO, dst: BinaryIO, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Decrypts binary stream by chunks.
+        :return: number of processed bytes
+        """
+        return translate_stream(src, dst, P_block.DECRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def encrypt_file(src_path: str, dst_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Encrypts file by chunks.
+        :return: number of processed bytes
+        """
+        return translate_file(src_path, dst_path, P_block.ENCRYPT_BYTES, chunk_size)
+
+    @staticmethod
+    def decrypt_file(src_path: str, dst_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+        """
+        Decrypts file by chunks.
+        :return: number of processed bytes
+        """
+        return translate_file(src_path, dst_path, P_block.DECRYPT_BYTES, chunk_size)
+
+
+def _permute_bits(inp_mesg: int, bit_pos: Tuple[int], bit_len: int = 8) -> int:
+    """
+    Moves every bit of inp_mesg to position from bit_pos.
+    :param inp_mesg: input integer
+    :param bit_pos: positions of bits
+    :param bit_len: number of bits to move
+    :return: permuted int
+    """
+    out_mesg = 0x00
+
+    # Iterate over each bit
+    for bit_idx in range(bit_len):
+        # Get bit by index
+        bit = (inp_mesg >> bit_idx) & 0x01
+        # Move bit to position
+        out_mesg |= (bit << bit_pos[bit_idx])
+    return out_mesg
+
+
+@lru_cache(maxsize=None)
+def _permutation_table(bit_pos: Tuple[int]) -> bytes:
+    """
+    Precomputes permutation of all 256 8bit values.
+    :param bit_pos: positions of bits
+    :return: 256-entry table, compatible with bytes.translate
+    """
+    return bytes(_permute_bits(value, bit_pos) for value in range(256))
+
+
+def inverse_positions(bit_pos: Tuple[int]) -> Tuple[int]:
+    """
+    Builds inverse permutation of bits.
+    :param bit_pos: new position of every bit
+    :return: positions of bits, that move every bit back
+    """
+    if sorted(bit_pos) != list(range(len(bit_pos))):
+        raise ValueError(f"Positions of bits are not a permutation: {bit_pos}")
+    inverse = [0] * len(bit_pos)
+    for bit_idx, pos in enumerate(bit_pos):
+        inverse[pos] = bit_idx
+    return tuple(inverse)
+
+
+def _byte_sliced_tables(bit_pos: Tuple[int]) -> List[List[int]]:
+    """
+    Builds one 256-entry table per input byte: value of the byte -> mask of its bits moved to their positions.
+    Permutation of the whole value is OR (or sum, masks never overlap) of lookups of all its bytes.
+    :param bit_pos: new position of every bit
+    :return: tables from the least significant byte
+    """
+    tables = []
+    for byte_idx in range((len(bit_pos) + 7) // 8):
+        # Bits above bit_len are dropped
+        bit_masks = [1 << bit_pos[bit] if bit < len(bit_pos) else 0
+                     for bit in range(8 * byte_idx, 8 * byte_idx + 8)]
+        table = [0] * 256
+        for value in range(1, 256):
+            # Mask of value is mask of value without its lowest bit plus mask of the lowest bit
+            lowest = value & -value
+            table[value] = table[value ^ lowest] | bit_masks[lowest.bit_length() - 1]
+        tables.append(table)
+    return tables
+
+
+class P_box:
+    """
+    Class for permutation of bits of values of any width, e.g. 16, 32 or 64 bits or the whole block of cipher.
+    Permutation is evaluated by byte-sliced tables, one lookup per byte instead of loop per bit.
+    Inverse permutation is generated automatically.
+    """
+    def __init__(self, bit_pos: Tuple[int]):
+        """
+        :param bit_pos: new position of every bit, from the least significant bit
+        """
+        self.bit_pos = tuple(bit_pos)
+        self.inverse_pos = inverse_positions(self.bit_pos)
+        self.bit_len = len(self.bit_pos)
+        self.byte_len = (self.bit_len + 7) // 8
+        self.tables = _byte_sliced_tables(self.bit_pos)
+        self.inverse_tables = _byte_sliced_tables(self.inverse_pos)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def get(bit_pos: Tuple[int]) -> "P_box":
+        """
+        Returns cached P_box for positions of bits.
+        """
+        return P_box(bit_pos)
+
+    def encrypt(self, inp_mesg: int) -> int:
+        """
+        Permutes bits of int, bits above bit_len are dropped.
+        """
+        return self._permute_int(inp_mesg, self.tables)
+
+    def decrypt(self, inp_mesg: int) -> int:
+        """
+        Moves bits of int back by inverse permutation.
+        """
+        return self._permute_int(inp_mesg, self.inverse_tables)
+
+    def encrypt_bytes(self, data, byteorder: str = "little") -> bytes:
+        """
+        Permutes bits of every block of byte_len bytes.
+        :param data: bytes-like object, size is a multiple of byte_len
+        :param byteorder: byte order of every block
+        :return: permuted bytes
+        """
+        return self._permute_blocks(data, self.tables, byteorder)
+
+    def decrypt_bytes(self, data, byteorder: str = "little") -> bytes:
+        """
+        Moves bits of every block of byte_len bytes back by inverse permutation.
+        """
+        return self._permute_blocks(data, self.inverse_tables, byteorder)
+
+    def _permute_int(self, inp_mesg: int, tables: List[List[int]]) -> int:
+        inp_mesg &= (1 << (8 * self.byte_len)) - 1
+        return sum(map(getitem, tables, inp_mesg.to_bytes(self.byte_len, "little")))
+
+    def _permute_blocks(self, data, tables: List[List[int]], byteorder: str) -> bytes:
+        if self.bit_len % 8:
+            raise ValueError(f"Permutation of {self.bit_len} bits does not cover whole bytes")
+        size = self.byte_len
+        if len(data) % size:
+            raise ValueError(f"Data of {len(data)} bytes is not a multiple of block of {size} bytes")
+        if byteorder == "big":
+            tables = tables[::-1]
+        data = memoryview(data).cast("B")
+        return b"".join(sum(map(getitem, tables, data[i:i + size])).to_bytes(size, byteorder)
+                        for i in range(0, len(data), size))
 
 
 class P_block:
@@ -153,33 +495,27 @@ class P_block:
 
     # positions of bits to encryption
     ENCRYPT_POS = (1, 5, 2, 0, 3, 7, 4, 6)
-    # positions of bits to decryption
-    DECRYPT_POS = (3, 0, 2, 4, 6, 1, 7, 5)
+    # positions of bits to decryption, generated from positions to encryption: (3, 0, 2, 4, 6, 1, 7, 5)
+    DECRYPT_POS = inverse_positions(ENCRYPT_POS)
+
+    # Full 256-entry tables of permutations, compatible with bytes.translate and str.translate
+    ENCRYPT_BYTES = _permutation_table(ENCRYPT_POS)
+    DECRYPT_BYTES = _permutation_table(DECRYPT_POS)
 
     @staticmethod
     def p_encrypt(inp_mesg: int, bit_pos: Tuple[int]) -> int:
-        out_mesg = 0x00
-
-        # Iterate over each bit
-        for bit_idx in range(P_block.BIT_LEN):
-            # Get bit by index
-            bit = (inp_mesg >> bit_idx) & 0x01
-            # Move bit to position
-            out_mesg |= (bit << bit_pos[bit_idx])
-
-        return out_mesg
+        if len(bit_pos) != P_block.BIT_LEN:
+            # Wider permutation
+            return P_box.get(tuple(bit_pos)).encrypt(inp_mesg)
+        # Table of permutation is built once per positions of bits
+        return _permutation_table(tuple(bit_pos))[inp_mesg & 0xFF]
 
     @staticmethod
     def p_decrypt(inp_mesg: int, bit_pos: Tuple[int]) -> int:
-        out_mesg = 0x00
-
-        # Iterate over each bit
-        for bit_idx in range(P_block.BIT_LEN):
-            # Get bit by index
-            bit = (inp_mesg >> bit_idx) & 0x01
-            # Move bit to position
-            out_mesg |= (bit << bit_pos[bit_idx])
-        return out_mesg
+        if len(bit_pos) != P_block.BIT_LEN:
+            # Wider permutation, bit_pos are positions to decryption
+            return P_box.get(tuple(bit_pos)).encrypt(inp_mesg)
+        return _permutation_table(tuple(bit_pos))[inp_mesg & 0xFF]
 
 
 if __name__ == "__main__":
@@ -247,3 +583,39 @@ if __name__ == "__main__":
     print("Decrypted mesg:")
     print(decrypt)
     print("Input message, output decrypt is equal: ", inp_mesg == decrypt)
+
+    # Chars out of the 256-entry tables are not passed through unchanged
+    for cryptography in (S_cryptography, P_cryptography):
+        try:
+            cryptography.encrypt("Слава Україні!")
+            print(cryptography.__name__, "error for chars above 255: False")
+        except ValueError as error:
+            print(cryptography.__name__, "error for chars above 255: True,", error)
+
+    # Test bytes and streaming API
+    print("\n\nBytes and streaming test")
+    inp_bytes = bytes(range(256)) * 1000
+    for cryptography in (S_cryptography, P_cryptography):
+        encrypt = cryptography.encrypt_bytes(inp_bytes)
+        stream = cryptography.encryptor()
+        chunks = [stream.update(inp_bytes[i:i + 777]) for i in range(0, len(inp_bytes), 777)]
+        chunks.append(stream.finalize())
+        print(cryptography.__name__, "stream is equal to bytes: ", b"".join(chunks) == encrypt)
+
+        src, dst = io.BytesIO(encrypt), io.BytesIO()
+        cryptography.decrypt_stream(src, dst, chunk_size=4096)
+        print(cryptography.__name__, "input bytes, decrypted stream is equal: ", dst.getvalue() == inp_bytes)
+
+    # Test wide P_box
+    print("\n\nWide P_box test")
+    for bit_len in (16, 32, 64):
+        bit_pos = tuple(random.sample(range(bit_len), bit_len))
+        p_box = P_box(bit_pos)
+        inp_mesg = random.getrandbits(bit_len)
+        encrypt = p_box.encrypt(inp_mesg)
+        expected = _permute_bits(inp_mesg, bit_pos, bit_len)
+        decrypt = P_block.p_decrypt(P_block.p_encrypt(inp_mesg, bit_pos), p_box.inverse_pos)
+        blocks = os.urandom(8 * bit_len)
+        print(f"{bit_len}bit permutation is equal to loop per bit: ", encrypt == expected,
+              ", input, decrypt is equal: ", inp_mesg == p_box.decrypt(encrypt) == decrypt,
+              ", blocks are equal: ", p_box.decrypt_bytes(p_box.encrypt_bytes(blocks, "big"), "big") == blocks)
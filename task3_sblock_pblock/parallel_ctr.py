@@ -0,0 +1,193 @@
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from task3_sblock_pblock.main import P_block, S_block, translate_file
+from task3_sblock_pblock.sp_network import KeySchedule, SPNetwork
+
+# Size of chunk of one task, 4 MiB
+CHUNK_SIZE = 1 << 22
+
+# Cipher of the worker process, created once by _init_worker
+_worker_cipher: Optional[SPNetwork] = None
+
+
+def _init_worker(key: bytes, block_size: int, rounds: int, key_schedule: Optional[KeySchedule]) -> None:
+    global _worker_cipher
+    _worker_cipher = SPNetwork(key, block_size, rounds, key_schedule)
+
+
+def _process_chunk(src_path: str, dst_path: str, nonce: int, offset: int, length: int) -> int:
+    """
+    Encrypts one chunk of file in CTR mode. Input and output are mapped to memory,
+    so only paths and offsets are sent to the worker, the result is written in place.
+    :param offset: offset of chunk in bytes, multiple of block size
+    :param length: size of chunk in bytes
+    :return: number of processed bytes
+    """
+    cipher = _worker_cipher
+    with open(src_path, "rb") as src, open(dst_path, "r+b") as dst:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(dst.fileno(), 0, access=mmap.ACCESS_WRITE) as dst_map:
+            with memoryview(src_map) as src_view:
+                result = cipher.ctr(src_view[offset:offset + length], nonce, offset // cipher.block_size)
+            dst_map[offset:offset + length] = result
+    return length
+
+
+def _translate_chunk(src_path: str, dst_path: str, table: bytes, offset: int, length: int) -> int:
+    """
+    Translates one chunk of file by 256-entry table, input and output are mapped to memory.
+    :param offset: offset of chunk in bytes
+    :param length: size of chunk in bytes
+    :return: number of processed bytes
+    """
+    with open(src_path, "rb") as src, open(dst_path, "r+b") as dst:
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(dst.fileno(), 0, access=mmap.ACCESS_WRITE) as dst_map:
+            dst_map[offset:offset + length] = src_map[offset:offset + length].translate(table)
+    return length
+
+
+def _create_output(src_path: str, dst_path: str) -> int:
+    """
+    Creates output file of the size of input file, so workers can write their chunks in place.
+    :return: size of input file
+    """
+    if os.path.abspath(src_path) == os.path.abspath(dst_path):
+        raise ValueError("Input and output files should be different")
+    size = os.path.getsize(src_path)
+    with open(dst_path, "wb") as dst:
+        dst.truncate(size)
+    return size
+
+
+def translate_file_parallel(src_path: str, dst_path: str, table: bytes, chunk_size: int = CHUNK_SIZE,
+                            workers: Optional[int] = None) -> int:
+    """
+    Translates file by 256-entry table (S_block/P_block tables) on a pool of processes.
+    Every byte is translated independently, so chunks of any size are independent.
+    Result is the same as of translate_file, e.g. S_cryptography.encrypt_file:
+        translate_file_parallel(src_path, dst_path, S_block.ENCRYPT_BYTES)
+    :param src_path: path of input file
+    :param dst_path: path of output file, should differ from src_path
+    :param table: 256-entry table
+    :param chunk_size: size of chunk of one task in bytes
+    :param workers: number of processes, os.cpu_count() by default
+    :return: number of processed bytes
+    """
+    if len(table) != 256:
+        raise ValueError(f"Table should have 256 entries, got {len(table)}")
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size should be positive, got {chunk_size}")
+
+    size = _create_output(src_path, dst_path)
+    if not size:
+        return 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_translate_chunk, src_path, dst_path, bytes(table), offset,
+                                   min(chunk_size, size - offset))
+                   for offset in range(0, size, chunk_size)]
+        return sum(future.result() for future in futures)
+
+
+def ctr_file_parallel(src_path: str, dst_path: str, key: bytes, nonce: int, block_size: int = 8,
+                      rounds: int = SPNetwork.DEFAULT_ROUNDS, chunk_size: int = CHUNK_SIZE,
+                      workers: Optional[int] = None, key_schedule: Optional[KeySchedule] = None) -> int:
+    """
+    Encrypts or decrypts file by SPNetwork in CTR mode on a pool of processes.
+    Every counter block depends only on its index, so chunks are independent. The output file
+    is created in full size beforehand and every worker writes its chunk at its own offset,
+    so the result is assembled in order without sending data through pickling.
+    :param src_path: path of input file
+    :param dst_path: path of output file, should differ from src_path
+    :param key: key of block_size bytes
+    :param nonce: initial value of counter
+    :param block_size: size of block in bytes
+    :param rounds: number of rounds
+    :param chunk_size: size of chunk of one task in bytes, rounded down to a multiple of block size
+    :param workers: number of processes, os.cpu_count() by default
+    :param key_schedule: key schedule of SPNetwork, module-level function, as it is sent to worker processes
+    :return: number of processed bytes
+    """
+    if os.path.abspath(src_path) == os.path.abspath(dst_path):
+        raise ValueError("Input and output files should be different")
+    chunk_size -= chunk_size % block_size
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size should be at least one block of {block_size} bytes")
+    # Checks key and parameters before the pool is started
+    SPNetwork(key, block_size, rounds, key_schedule)
+
+    size = _create_output(src_path, dst_path)
+    if not size:
+        return 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(key, block_size, rounds, key_schedule)) as executor:
+        futures = [executor.submit(_process_chunk, src_path, dst_path, nonce, offset, min(chunk_size, size - offset))
+                   for offset in range(0, size, chunk_size)]
+        return sum(future.result() for future in futures)
+
+
+def _reversed_key_schedule(key: bytes, rounds: int) -> List[bytes]:
+    """
+    Key schedule for the test: the default one of reversed key.
+    """
+    return SPNetwork.key_schedule(key[::-1], rounds)
+
+
+def test_ctr_file_parallel(size, block_size, chunk_size, key_schedule=None):
+    """
+    Compares parallel CTR of file with the single process CTR and decrypts it back.
+    """
+    key = os.urandom(block_size)
+    data = os.urandom(size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_path = os.path.join(tmp_dir, "input.bin")
+        enc_path = os.path.join(tmp_dir, "encrypted.bin")
+        dec_path = os.path.join(tmp_dir, "decrypted.bin")
+        with open(src_path, "wb") as f:
+            f.write(data)
+
+        assert ctr_file_parallel(src_path, enc_path, key, 77, block_size, chunk_size=chunk_size, workers=4,
+                                 key_schedule=key_schedule) == size
+        with open(enc_path, "rb") as f:
+            encrypted = f.read()
+        expected = SPNetwork(key, block_size, key_schedule=key_schedule).ctr(data, 77)
+        assert encrypted == expected, f"Error for CTR of {size} bytes"
+
+        ctr_file_parallel(enc_path, dec_path, key, 77, block_size, chunk_size=chunk_size, workers=4,
+                          key_schedule=key_schedule)
+        with open(dec_path, "rb") as f:
+            assert f.read() == data, f"Error for decryption of {size} bytes"
+
+
+def test_translate_file_parallel(size, chunk_size):
+    """
+    Compares parallel translation of file by S-box and P-box tables with translate_file.
+    """
+    data = os.urandom(size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src_path = os.path.join(tmp_dir, "input.bin")
+        with open(src_path, "wb") as f:
+            f.write(data)
+
+        for table in (S_block.ENCRYPT_BYTES, S_block.DECRYPT_BYTES, P_block.ENCRYPT_BYTES, P_block.DECRYPT_BYTES):
+            parallel_path = os.path.join(tmp_dir, "parallel.bin")
+            single_path = os.path.join(tmp_dir, "single.bin")
+            assert translate_file_parallel(src_path, parallel_path, table, chunk_size, workers=4) == size
+            translate_file(src_path, single_path, table)
+            with open(parallel_path, "rb") as parallel, open(single_path, "rb") as single:
+                assert parallel.read() == single.read(), f"Error for translation of {size} bytes"
+
+
+if __name__ == "__main__":
+    for file_size, block, chunk in ((0, 8, 1024), (1, 8, 1024), (100003, 8, 4096), (65536, 16, 10000)):
+        test_ctr_file_parallel(file_size, block, chunk)
+    test_ctr_file_parallel(100003, 8, 4096, _reversed_key_schedule)
+    for file_size, chunk in ((0, 1024), (1, 1024), (100003, 4096)):
+        test_translate_file_parallel(file_size, chunk)
+    print("All parallel CTR and translation tests passed")
@@ -0,0 +1,243 @@
+import os
+from operator import getitem
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from task3_sblock_pblock.main import P_block, P_box, S_block
+
+# Key schedule: callable(key, rounds) -> rounds + 1 round keys of block_size bytes
+KeySchedule = Callable[[bytes, int], Sequence[bytes]]
+
+
+class SPNetwork:
+    """
+    Multi-round substitution-permutation block cipher built on S_block and P_block.
+
+    Every round is: xor with round key, S-box for every byte, permutation of bits of the whole block.
+    The block permutation moves bits inside every byte by P_block.ENCRYPT_POS and then spreads
+    bits of every byte over all bytes of the block, so every round mixes the whole block.
+
+    S-box and permutation of a round are merged into T-tables: table i maps byte value v of
+    byte i to the permuted block mask of S(v). The round is the sum of block_size lookups,
+    masks of different bytes never overlap.
+    """
+    DEFAULT_ROUNDS = 8
+
+    def __init__(self, key: bytes, block_size: int = 8, rounds: int = DEFAULT_ROUNDS,
+                 key_schedule: Optional[KeySchedule] = None):
+        """
+        Precomputes round keys and T-tables.
+        :param key: key of block_size bytes
+        :param block_size: size of block in bytes
+        :param rounds: number of rounds
+        :param key_schedule: callable(key, rounds), that returns rounds + 1 round keys of block_size bytes,
+            SPNetwork.key_schedule by default
+        """
+        if block_size < 1:
+            raise ValueError(f"Block size should be positive, got {block_size}")
+        if rounds < 1:
+            raise ValueError(f"Number of rounds should be positive, got {rounds}")
+        if len(key) != block_size:
+            raise ValueError(f"Key of {len(key)} bytes does not match block size of {block_size} bytes")
+
+        self.block_size = block_size
+        self.rounds = rounds
+        self.bit_len = 8 * block_size
+
+        self.p_box = P_box.get(SPNetwork.block_permutation(block_size))
+        round_keys = list((key_schedule or SPNetwork.key_schedule)(bytes(key), rounds))
+        if len(round_keys) != rounds + 1:
+            raise ValueError(f"Key schedule returned {len(round_keys)} round keys instead of {rounds + 1}")
+        for round_key in round_keys:
+            if len(round_key) != block_size:
+                raise ValueError(f"Round key of {len(round_key)} bytes does not match block size of {block_size} bytes")
+        # Round keys as little-endian ints
+        self.round_keys = [int.from_bytes(round_key, "little") for round_key in round_keys]
+
+        # Encryption: S-box and permutation in one lookup per byte, byte-sliced table of S(value)
+        self.enc_tables = [[table[value] for value in S_block.ENCRYPT_BYTES] for table in self.p_box.tables]
+        # Decryption: inverse permutation by lookups, then inverse S-box by bytes.translate
+        self.dec_tables = self.p_box.inverse_tables
+
+    @staticmethod
+    def block_permutation(block_size: int) -> Tuple[int]:
+        """
+        Builds permutation of bits of the block: P_block inside every byte, then bit k of the block
+        moves to (k * block_size) mod (bit_len - 1), so 8 bits of a byte go to 8 different bytes.
+        :param block_size: size of block in bytes
+        :return: new position of every bit
+        """
+        bit_len = 8 * block_size
+        positions = []
+        for bit in range(bit_len):
+            k = 8 * (bit // 8) + P_block.ENCRYPT_POS[bit % 8]
+            positions.append(k if k == bit_len - 1 else (k * block_size) % (bit_len - 1))
+        return tuple(positions)
+
+    @staticmethod
+    def key_schedule(key: bytes, rounds: int) -> List[bytes]:
+        """
+        Default key schedule. Derives rounds + 1 round keys: the next key is the previous one rotated by one byte,
+        substituted by S-box and xor-ed with the round number (as little-endian int).
+        :param key: key of block_size bytes
+        :param rounds: number of rounds
+        :return: round keys of block_size bytes
+        """
+        mask = (1 << (8 * len(key))) - 1
+        round_keys = [bytes(key)]
+        current = bytes(key)
+        for round_idx in range(1, rounds + 1):
+            current = (current[1:] + current[:1]).translate(S_block.ENCRYPT_BYTES)
+            round_key = (int.from_bytes(current, "little") ^ round_idx) & mask
+            round_keys.append(round_key.to_bytes(len(key), "little"))
+        return round_keys
+
+    def encrypt_block(self, block: int) -> int:
+        """
+        Encrypts block given as little-endian int.
+        """
+        size = self.block_size
+        tables = self.enc_tables
+        for round_key in self.round_keys[:-1]:
+            block = sum(map(getitem, tables, (block ^ round_key).to_bytes(size, "little")))
+        return block ^ self.round_keys[-1]
+
+    def decrypt_block(self, block: int) -> int:
+        """
+        Decrypts block given as little-endian int.
+        """
+        size = self.block_size
+        tables = self.dec_tables
+        block ^= self.round_keys[-1]
+        for round_key in reversed(self.round_keys[:-1]):
+            permuted = sum(map(getitem, tables, block.to_bytes(size, "little")))
+            block = int.from_bytes(permuted.to_bytes(size, "little").translate(S_block.DECRYPT_BYTES),
+                                   "little") ^ round_key
+        return block
+
+    def _check_blocks(self, data) -> None:
+        if len(data) % self.block_size:
+            raise ValueError(f"Data of {len(data)} bytes is not a multiple of block size of {self.block_size} bytes")
+
+    def encrypt_ecb(self, data) -> bytes:
+        """
+        Encrypts data in ECB mode, every block independently.
+        :param data: bytes-like object, size is a multiple of block size
+        :return: encrypted bytes
+        """
+        self._check_blocks(data)
+        size = self.block_size
+        data = memoryview(data).cast("B")
+        return b"".join(self.encrypt_block(int.from_bytes(data[i:i + size], "little")).to_bytes(size, "little")
+                        for i in range(0, len(data), size))
+
+    def decrypt_ecb(self, data) -> bytes:
+        """
+        Decrypts data in ECB mode.
+        :param data: bytes-like object, size is a multiple of block size
+        :return: decrypted bytes
+        """
+        self._check_blocks(data)
+        size = self.block_size
+        data = memoryview(data).cast("B")
+        return b"".join(self.decrypt_block(int.from_bytes(data[i:i + size], "little")).to_bytes(size, "little")
+                        for i in range(0, len(data), size))
+
+    def keystream(self, nonce: int, first_block: int, count: int) -> bytes:
+        """
+        Generates CTR keystream: encrypted counter blocks nonce + first_block, ..., nonce + first_block + count - 1.
+        :param nonce: initial value of counter
+        :param first_block: index of the first block
+        :param count: number of blocks
+        :return: count * block_size bytes
+        """
+        size = self.block_size
+        mask = (1 << self.bit_len) - 1
+        start = nonce + first_block
+        return b"".join(self.encrypt_block((start + i) & mask).to_bytes(size, "little") for i in range(count))
+
+    def ctr(self, data, nonce: int, first_block: int = 0) -> bytes:
+        """
+        Encrypts or decrypts data of any size in CTR mode.
+        :param data: bytes-like object
+        :param nonce: initial value of counter, should never be reused with the same key
+        :param first_block: index of block of the first byte of data, to process data from the middle of stream
+        :return: processed bytes
+        """
+        size = len(data)
+        if not size:
+            return b""
+        stream = self.keystream(nonce, first_block, -(-size // self.block_size))[:size]
+        # Xor of the whole buffer at once as big ints
+        return (int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")).to_bytes(size, "little")
+
+
+def test_sp_network(block_size, rounds):
+    """
+    Verifies that decryption inverts encryption in all modes and that the cipher is not trivial.
+    """
+    key = os.urandom(block_size)
+    cipher = SPNetwork(key, block_size, rounds)
+
+    data = os.urandom(block_size * 50)
+    encrypted = cipher.encrypt_ecb(data)
+    assert encrypted != data, "ECB does not change data"
+    assert cipher.decrypt_ecb(encrypted) == data, "Error for ECB"
+
+    data = os.urandom(block_size * 50 + block_size // 2 + 1)
+    encrypted = cipher.ctr(data, nonce=12345)
+    assert cipher.ctr(encrypted, nonce=12345) == data, "Error for CTR"
+    # CTR from the middle of stream
+    offset = 3 * block_size
+    assert cipher.ctr(data[offset:], nonce=12345, first_block=3) == encrypted[offset:], "Error for CTR with offset"
+
+    # One changed bit of the plaintext block changes about half of bits of the ciphertext block
+    if block_size > 1 and rounds >= 4:
+        blocks = [int.from_bytes(data[i:i + block_size], "little") for i in range(0, 50 * block_size, block_size)]
+        changed = sum(bin(cipher.encrypt_block(block) ^ cipher.encrypt_block(block ^ 1)).count("1")
+                      for block in blocks)
+        assert changed / len(blocks) > 8 * block_size / 4, "Bad diffusion"
+
+
+def test_custom_key_schedule(block_size, rounds):
+    """
+    Verifies cipher with a custom key schedule and validation of round keys.
+    """
+    key = os.urandom(block_size)
+
+    def xor_schedule(schedule_key, schedule_rounds):
+        # Every round key is the key xor-ed with the round number in every byte
+        return [bytes(byte ^ round_idx for byte in schedule_key) for round_idx in range(schedule_rounds + 1)]
+
+    cipher = SPNetwork(key, block_size, rounds, key_schedule=xor_schedule)
+    assert cipher.round_keys == [int.from_bytes(round_key, "little") for round_key in xor_schedule(key, rounds)]
+    data = os.urandom(block_size * 10)
+    encrypted = cipher.encrypt_ecb(data)
+    assert cipher.decrypt_ecb(encrypted) == data, "Error for ECB with custom key schedule"
+    assert encrypted != SPNetwork(key, block_size, rounds).encrypt_ecb(data), "Custom key schedule is not used"
+
+    for wrong_schedule in (lambda k, r: [k] * r, lambda k, r: [k + b"\x00"] * (r + 1)):
+        try:
+            SPNetwork(key, block_size, rounds, key_schedule=wrong_schedule)
+            assert False, "No error for wrong key schedule"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    for block_size in (1, 2, 4, 8, 16):
+        for rounds in (1, 4, 8):
+            test_sp_network(block_size, rounds)
+            test_custom_key_schedule(block_size, rounds)
+
+    cipher = SPNetwork(b"DistrLab", block_size=8, rounds=8)
+    inp_mesg = "Glory to Ukraine! Distribution lab is the best!".encode()
+    encrypt = cipher.ctr(inp_mesg, nonce=2023)
+    print("Input mesg:")
+    print(inp_mesg)
+    print("Encrypted mesg:")
+    print(encrypt.hex())
+    decrypt = cipher.ctr(encrypt, nonce=2023)
+    print("Decrypted mesg:")
+    print(decrypt)
+    print("Input message, output decrypt is equal: ", inp_mesg == decrypt)
+    print("All SP-network tests passed")
@@ -0,0 +1,129 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from task4_testing_keys.main import (KeyTestSuite, MaxLengthSequenceTest, MonobitTest, PokerTest,
+                                     SequenceLengthTest)
+
+# Columns of the pass/fail matrix
+TEST_NAMES = (KeyTestSuite.MONOBIT, KeyTestSuite.MAX_LENGTH, KeyTestSuite.POKER, KeyTestSuite.SEQUENCE_LENGTH)
+
+# Number of keys in one task of the pool
+KEYS_PER_TASK = 64
+
+# Shared memory of the worker process, attached once by _init_worker
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(name: str) -> None:
+    global _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=name)
+
+
+def _vet_range(data, key_size: int, stride: int, start: int, stop: int) -> List[List[bool]]:
+    """
+    Runs all tests on keys from start to stop.
+    :param data: buffer of keys
+    :return: row of results of TEST_NAMES for every key
+    """
+    rows = []
+    for idx in range(start, stop):
+        report = KeyTestSuite.run_tests(data[idx * stride:idx * stride + key_size])
+        rows.append([report.tests[name].passed for name in TEST_NAMES])
+    return rows
+
+
+def _vet_shared_range(key_size: int, stride: int, start: int, stop: int) -> (int, List[List[bool]]):
+    with memoryview(_worker_memory.buf) as data:
+        return start, _vet_range(data, key_size, stride, start, stop)
+
+
+def vet_keys(data, key_size: int, stride: Optional[int] = None, workers: Optional[int] = None,
+             keys_per_task: int = KEYS_PER_TASK) -> np.ndarray:
+    """
+    Tests many keys from one contiguous buffer on a pool of processes.
+    The buffer is copied once into shared memory, workers get only indexes of keys.
+    :param data: bytes-like object with keys
+    :param key_size: size of every key in bytes
+    :param stride: distance between starts of keys in bytes, key_size by default
+    :param workers: number of processes, os.cpu_count() by default, 1 to test in the current process
+    :param keys_per_task: number of keys in one task of the pool
+    :return: (number of keys, len(TEST_NAMES)) bool matrix, True if the key passed the test
+    """
+    stride = stride or key_size
+    if key_size <= 0 or stride < key_size:
+        raise ValueError(f"Bad key size {key_size} or stride {stride}")
+    data = memoryview(data).cast("B")
+    count = (len(data) - key_size) // stride + 1 if len(data) >= key_size else 0
+    result = np.zeros((count, len(TEST_NAMES)), dtype=bool)
+    if not count:
+        return result
+
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        result[:] = _vet_range(data, key_size, stride, 0, count)
+        return result
+
+    memory = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        memory.buf[:len(data)] = data
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(memory.name,)) as executor:
+            futures = [executor.submit(_vet_shared_range, key_size, stride, start, min(start + keys_per_task, count))
+                       for start in range(0, count, keys_per_task)]
+            for future in futures:
+                start, rows = future.result()
+                result[start:start + len(rows)] = rows
+    finally:
+        memory.close()
+        memory.unlink()
+    return result
+
+
+def vet_key_list(keys: Sequence[bytes], workers: Optional[int] = None) -> np.ndarray:
+    """
+    Tests list of keys of the same size on a pool of processes.
+    :param keys: keys
+    :param workers: number of processes
+    :return: pass/fail matrix as in vet_keys
+    """
+    if not keys:
+        return np.zeros((0, len(TEST_NAMES)), dtype=bool)
+    key_size = len(keys[0])
+    if any(len(key) != key_size for key in keys):
+        raise ValueError("Keys should be of the same size")
+    return vet_keys(b"".join(keys), key_size, workers=workers)
+
+
+def test_vet_keys(count, workers):
+    """
+    Compares results of the pool with the separate tests for every key.
+    """
+    key_size = MonobitTest.NUM_BYTES
+    keys = [random.randbytes(key_size) for _ in range(count)]
+    # Broken keys
+    keys[1] = b"\x00" * key_size
+    keys[-1] = b"\xAA" * key_size
+    matrix = vet_key_list(keys, workers=workers)
+    assert matrix.shape == (count, len(TEST_NAMES)), "Error for shape"
+
+    for key, row in zip(keys, matrix):
+        expected = [MonobitTest.run_test(key), MaxLengthSequenceTest.run_test(key),
+                    PokerTest.run_test(key), SequenceLengthTest.run_test(key)]
+        assert list(row) == expected, "Error for result of key"
+    assert not matrix[1].any() and not matrix[-1].all(), "Error for broken keys"
+
+    # Keys with gaps between them
+    stride = key_size + 16
+    data = b"".join(key + b"\xFF" * 16 for key in keys)
+    assert (vet_keys(data, key_size, stride, workers=workers) == matrix).all(), "Error for stride"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    test_vet_keys(10, workers=1)
+    test_vet_keys(200, workers=4)
+    print("All bulk tests passed")
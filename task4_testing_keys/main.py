@@ -1,4 +1,6 @@
 import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 
 class MonobitTest:
@@ -160,6 +162,174 @@ class SequenceLengthTest:
         return output_flag
 
 
+def _byte_runs(byte: int) -> List[Tuple[int, int]]:
+    """
+    Splits 8 bits of byte (the most significant bit first) into runs of the same bits.
+    :return: list of (bit value, run length)
+    """
+    runs = []
+    for bit in (int(bit) for bit in bin(byte)[2:].zfill(8)):
+        if runs and runs[-1][0] == bit:
+            runs[-1] = (bit, runs[-1][1] + 1)
+        else:
+            runs.append((bit, 1))
+    return runs
+
+
+# Lookup tables by byte value
+POPCOUNT_TABLE = tuple(byte.bit_count() for byte in range(256))
+# First bit and length of the leading run (from the most significant bit)
+LEADING_RUN_TABLE = tuple(_byte_runs(byte)[0] for byte in range(256))
+# Last bit and length of the trailing run (to the least significant bit)
+TRAILING_RUN_TABLE = tuple(_byte_runs(byte)[-1] for byte in range(256))
+# Runs which are inside the byte, without the leading and the trailing one
+INNER_RUNS_TABLE = tuple(tuple(_byte_runs(byte)[1:-1]) for byte in range(256))
+
+
+@dataclass
+class TestReport:
+    """
+    Result of one test: statistic and its bounds
+    """
+    name: str
+    passed: bool
+    statistic: object
+    min_value: object = None
+    max_value: object = None
+
+
+@dataclass
+class KeyTestReport:
+    """
+    Results of all tests of the key
+    """
+    num_bits: int
+    tests: Dict[str, TestReport] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return all(test.passed for test in self.tests.values())
+
+
+class KeyTestSuite:
+    """
+    Runs monobit, max-length sequence, poker (m = 4) and sequence length tests by one pass over bytes.
+    Every byte is processed by lookup tables: number of ones, leading and trailing runs, inner runs.
+    The current run is kept between bytes and between calls of update, so data can be given by chunks.
+    Results are the same as results of the separate test classes.
+    """
+    MONOBIT = "monobit"
+    MAX_LENGTH = "max_length_sequence"
+    POKER = "poker"
+    SEQUENCE_LENGTH = "sequence_length"
+
+    def __init__(self):
+        self.num_bytes = 0
+        self.ones = 0
+        self.nibbles = [0] * 16
+        self.max_run = 0
+        # Number of runs by bit value and length, lengths from MAX_SEQ_VAL are counted together
+        self.runs = [[0] * (SequenceLengthTest.MAX_SEQ_VAL + 1) for _ in range(2)]
+        self.first_bit = None
+        # The current run, which can continue in the next byte
+        self.run_bit = None
+        self.run_length = 0
+
+    def _add_run(self, bit: int, length: int) -> None:
+        self.runs[bit][min(length, SequenceLengthTest.MAX_SEQ_VAL)] += 1
+        if length > self.max_run:
+            self.max_run = length
+
+    def update(self, bytes_arr) -> None:
+        """
+        Processes next chunk of bytes.
+        :param bytes_arr: bytes-like object
+        """
+        nibbles = self.nibbles
+        add_run = self._add_run
+        run_bit, run_length = self.run_bit, self.run_length
+        if run_bit is None and len(bytes_arr):
+            self.first_bit = bytes_arr[0] >> 7
+
+        for byte in bytes_arr:
+            nibbles[byte >> 4] += 1
+            nibbles[byte & 0x0F] += 1
+            bit, length = LEADING_RUN_TABLE[byte]
+            if length == 8:
+                # Byte of the same bits
+                if bit == run_bit:
+                    run_length += 8
+                    continue
+                if run_bit is not None:
+                    add_run(run_bit, run_length)
+                run_bit, run_length = bit, 8
+                continue
+
+            if bit == run_bit:
+                add_run(bit, run_length + length)
+            else:
+                if run_bit is not None:
+                    add_run(run_bit, run_length)
+                add_run(bit, length)
+            for bit, length in INNER_RUNS_TABLE[byte]:
+                add_run(bit, length)
+            run_bit, run_length = TRAILING_RUN_TABLE[byte]
+
+        self.run_bit, self.run_length = run_bit, run_length
+        self.ones += sum(map(POPCOUNT_TABLE.__getitem__, bytes_arr))
+        self.num_bytes += len(bytes_arr)
+
+    def report(self) -> KeyTestReport:
+        """
+        Evaluates all tests on all processed bytes.
+        :return: report with result of every test
+        """
+        num_bits = 8 * self.num_bytes
+        report = KeyTestReport(num_bits)
+
+        min_val = int(MonobitTest.MIN_VAL_8 * self.num_bytes)
+        max_val = int(MonobitTest.MAX_VAL_8 * self.num_bytes)
+        report.tests[self.MONOBIT] = TestReport(self.MONOBIT, min_val < self.ones < max_val, self.ones,
+                                                min_val, max_val)
+
+        max_run = max(self.max_run, self.run_length)
+        report.tests[self.MAX_LENGTH] = TestReport(self.MAX_LENGTH, max_run < MaxLengthSequenceTest.MAX_LENGTH,
+                                                   max_run, None, MaxLengthSequenceTest.MAX_LENGTH)
+
+        k = 2 * self.num_bytes
+        xi3 = 16 / k * sum(count ** 2 for count in self.nibbles) - k if k else None
+        report.tests[self.POKER] = TestReport(self.POKER, xi3 is not None and PokerTest.MIN_XI3 < xi3 < PokerTest.MAX_XI3,
+                                              xi3, PokerTest.MIN_XI3, PokerTest.MAX_XI3)
+
+        # SequenceLengthTest counts every run except the last one into the dictionary of the opposite bit,
+        # and the first bit adds one run of length 1
+        seq_len_ones = list(self.runs[0])
+        seq_len_zeros = list(self.runs[1])
+        if self.first_bit is not None:
+            (seq_len_ones if self.first_bit == 1 else seq_len_zeros)[1] += 1
+        passed = True
+        for key_seq, value in SequenceLengthTest.EXPECTED_LENGHT.items():
+            expected_min = int(value[SequenceLengthTest.MIN_KEY] * num_bits / 20000)
+            expected_max = int(value[SequenceLengthTest.MAX_KEY] * num_bits / 20000)
+            if not (expected_min < seq_len_ones[key_seq] < expected_max) or \
+                    not (expected_min < seq_len_zeros[key_seq] < expected_max):
+                passed = False
+        report.tests[self.SEQUENCE_LENGTH] = TestReport(
+            self.SEQUENCE_LENGTH, passed, {"ones": seq_len_ones[1:], "zeros": seq_len_zeros[1:]})
+        return report
+
+    @staticmethod
+    def run_tests(bytes_arr) -> KeyTestReport:
+        """
+        Runs all tests on the input bytes_arr by one pass.
+        :param bytes_arr: array of bytes input
+        :return: report with result of every test
+        """
+        suite = KeyTestSuite()
+        suite.update(bytes_arr)
+        return suite.report()
+
+
 if __name__ == "__main__":
     random.seed(3)
 
@@ -197,3 +367,11 @@ if __name__ == "__main__":
 
     bytes_array = bytearray([0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00])  # Example byte array
     print(f"Test array of 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00 hex. Res = {SequenceLengthTest.run_test(bytes_array)}")
+
+    # Single-pass test suite
+    print("\n\n5. Single-pass test suite:")
+    bytes_array = bytearray([random.randint(0, 255) for _ in range(2500)])
+    report = KeyTestSuite.run_tests(bytes_array)
+    for test in report.tests.values():
+        print(f"{test.name}: statistic = {test.statistic}, passed = {test.passed}")
+    print(f"Test array of random bytes in hex of 2500 bytes. Res = {report.passed}")
@@ -0,0 +1,138 @@
+import random
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from task4_testing_keys.main import KeyTestReport, KeyTestSuite, MonobitTest
+
+
+class RandomnessAlert(Exception):
+    """
+    Failure of the window of RNG output
+    """
+    def __init__(self, window_idx: int, report: KeyTestReport):
+        failed = [name for name, test in report.tests.items() if not test.passed]
+        super().__init__(f"Window {window_idx} failed tests: {', '.join(failed)}")
+        self.window_idx = window_idx
+        self.report = report
+
+
+class RandomnessMonitor:
+    """
+    Health monitor of continuous RNG output.
+    Output is given by chunks of any size and is tested by consecutive windows of window_size bytes
+    (20000 bits by default, as in the tests). Only counters of the current window are kept,
+    runs, which cross the border of chunks, are continued in the next chunk.
+    """
+    def __init__(self, window_size: int = MonobitTest.NUM_BYTES,
+                 on_alert: Optional[Callable[[RandomnessAlert], None]] = None,
+                 raise_alerts: bool = False, history: int = 100):
+        """
+        :param window_size: size of window in bytes
+        :param on_alert: callback for every failed window
+        :param raise_alerts: raise RandomnessAlert from update, when the window fails
+        :param history: number of last alerts to keep
+        """
+        if window_size <= 0:
+            raise ValueError(f"Window size should be positive, got {window_size}")
+        self.window_size = window_size
+        self.on_alert = on_alert
+        self.raise_alerts = raise_alerts
+
+        self.suite = KeyTestSuite()
+        self.windows_tested = 0
+        self.windows_failed = 0
+        # Number of failed windows for every test
+        self.failures = {name: 0 for name in (KeyTestSuite.MONOBIT, KeyTestSuite.MAX_LENGTH,
+                                              KeyTestSuite.POKER, KeyTestSuite.SEQUENCE_LENGTH)}
+        self.alerts: Deque[RandomnessAlert] = deque(maxlen=history)
+        self.last_report: Optional[KeyTestReport] = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of bytes of the current incomplete window.
+        """
+        return self.suite.num_bytes
+
+    def update(self, chunk) -> List[KeyTestReport]:
+        """
+        Processes next chunk of RNG output.
+        :param chunk: bytes-like object
+        :return: reports of windows, completed by this chunk
+        """
+        view = memoryview(chunk).cast("B")
+        reports = []
+        offset = 0
+        while offset < len(view):
+            size = min(self.window_size - self.suite.num_bytes, len(view) - offset)
+            self.suite.update(view[offset:offset + size])
+            offset += size
+            if self.suite.num_bytes == self.window_size:
+                reports.append(self._finish_window())
+        return reports
+
+    def _finish_window(self) -> KeyTestReport:
+        report = self.suite.report()
+        self.suite = KeyTestSuite()
+        self.last_report = report
+        self.windows_tested += 1
+        if not report.passed:
+            self.windows_failed += 1
+            for name, test in report.tests.items():
+                self.failures[name] += not test.passed
+            alert = RandomnessAlert(self.windows_tested - 1, report)
+            self.alerts.append(alert)
+            if self.on_alert is not None:
+                self.on_alert(alert)
+            if self.raise_alerts:
+                raise alert
+        return report
+
+
+def test_monitor_chunks():
+    """
+    Verifies that the result does not depend on the size of chunks.
+    """
+    data = random.randbytes(5 * MonobitTest.NUM_BYTES + 100)
+    expected = RandomnessMonitor()
+    expected_reports = expected.update(data)
+    assert len(expected_reports) == 5 and expected.pending == 100, "Error for number of windows"
+    for window_idx, report in enumerate(expected_reports):
+        window = data[window_idx * MonobitTest.NUM_BYTES:(window_idx + 1) * MonobitTest.NUM_BYTES]
+        assert report == KeyTestSuite.run_tests(window), "Error for report of window"
+
+    monitor = RandomnessMonitor()
+    reports = []
+    offset = 0
+    while offset < len(data):
+        size = random.randint(1, 1000)
+        reports.extend(monitor.update(data[offset:offset + size]))
+        offset += size
+    assert reports == expected_reports, "Error for chunks"
+
+
+def test_monitor_alerts():
+    """
+    Verifies that a stuck source raises alerts.
+    """
+    alerts = []
+    monitor = RandomnessMonitor(on_alert=alerts.append)
+    monitor.update(random.randbytes(MonobitTest.NUM_BYTES))
+    monitor.update(b"\x00" * MonobitTest.NUM_BYTES)
+    assert len(alerts) == 1 and alerts[0].window_idx == 1, "Error for alert of stuck source"
+    assert monitor.failures[KeyTestSuite.MONOBIT] == 1, "Error for failures counter"
+
+    monitor = RandomnessMonitor(raise_alerts=True)
+    try:
+        monitor.update(b"\xAA" * MonobitTest.NUM_BYTES)
+        raise AssertionError("Alert was not raised")
+    except RandomnessAlert as alert:
+        print(f"Alert: {alert}")
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    for _ in range(5):
+        test_monitor_chunks()
+    test_monitor_alerts()
+    print("All monitor tests passed")
@@ -0,0 +1,300 @@
+import math
+import random
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from task4_testing_keys.main import KeyTestReport, TestReport
+from task4_testing_keys.numpy_backend import bytes_to_bits_np
+
+
+def igamc(a: float, x: float) -> float:
+    """
+    Regularized upper incomplete gamma function Q(a, x).
+    Series for x < a + 1, continued fraction (modified Lentz) otherwise.
+    """
+    if x <= 0 or a <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        # Q = 1 - P, P by series
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def normal_cdf(x: float) -> float:
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+
+class NistTest(ABC):
+    """
+    Base class of NIST SP 800-22 tests: test passes, when p-value is not less than ALPHA.
+    p_value works with array of bits of any length, run_test with bytes.
+    For sequences shorter than MIN_BITS the test is not applicable: p-value is undefined (nan) and the test fails.
+    """
+    ALPHA = 0.01
+    NAME = ""
+    # Minimal length of sequence recommended by NIST
+    MIN_BITS = 100
+
+    @classmethod
+    def p_value(cls, bits: np.ndarray, **kwargs) -> float:
+        """
+        :param bits: array of bits
+        :param kwargs: parameters of the test
+        :return: p-value, nan for too short sequence
+        """
+        if bits.size < cls.MIN_BITS:
+            return math.nan
+        return cls._p_value(bits, **kwargs)
+
+    @classmethod
+    @abstractmethod
+    def _p_value(cls, bits: np.ndarray, **kwargs) -> float:
+        """
+        Calculates p-value of sequence of at least MIN_BITS bits.
+        """
+
+    @classmethod
+    def report(cls, bits: np.ndarray) -> TestReport:
+        p_value = cls.p_value(bits)
+        # Comparison with nan is False, so not applicable test fails
+        return TestReport(cls.NAME, p_value >= cls.ALPHA, p_value, cls.ALPHA)
+
+    @classmethod
+    def run_test(cls, bytes_arr: bytearray) -> bool:
+        """
+        Testing the input bytes_arr.
+        :param bytes_arr: array of bytes input
+        :return: True if test passed else False.
+        """
+        return cls.report(bytes_to_bits_np(bytes_arr)).passed
+
+
+class BlockFrequencyTest(NistTest):
+    """
+    Frequency test within blocks: proportion of ones in every block of M bits is close to 1/2
+    """
+    NAME = "block_frequency"
+    MIN_BLOCK_SIZE = 20
+
+    @staticmethod
+    def block_size(n: int) -> int:
+        """
+        Chooses size of block by NIST recommendations: M >= 20, M > 0.01 * n, so there are less than 100 blocks.
+        """
+        return max(BlockFrequencyTest.MIN_BLOCK_SIZE, n // 100 + 1)
+
+    @classmethod
+    def _p_value(cls, bits: np.ndarray, block_size: int = None) -> float:
+        m = block_size or cls.block_size(bits.size)
+        n_blocks = bits.size // m
+        if not n_blocks:
+            # Sequence is shorter than one block
+            return math.nan
+        proportions = bits[:n_blocks * m].reshape(n_blocks, m).sum(axis=1) / m
+        chi2 = 4 * m * float(np.sum((proportions - 0.5) ** 2))
+        return igamc(n_blocks / 2, chi2 / 2)
+
+
+class RunsTest(NistTest):
+    """
+    Runs test: number of runs of the same bits is as expected for random sequence
+    """
+    NAME = "runs"
+
+    @classmethod
+    def _p_value(cls, bits: np.ndarray) -> float:
+        n = bits.size
+        pi = np.count_nonzero(bits) / n
+        # Frequency prerequisite, the test is not applicable
+        if abs(pi - 0.5) >= 2 / math.sqrt(n):
+            return 0.0
+        runs = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+        return math.erfc(abs(runs - 2 * n * pi * (1 - pi)) / (2 * math.sqrt(2 * n) * pi * (1 - pi)))
+
+
+class CumulativeSumsTest(NistTest):
+    """
+    Cumulative sums test in forward and backward modes: maximal excursion of random walk of -1 and +1.
+    p-value is minimum of p-values of both modes.
+    """
+    NAME = "cumulative_sums"
+
+    @staticmethod
+    def _mode_p_value(n: int, z: int) -> float:
+        sqrt_n = math.sqrt(n)
+        total = 1.0
+        for k in range(int((-n / z + 1) / 4), int((n / z - 1) / 4) + 1):
+            total -= normal_cdf((4 * k + 1) * z / sqrt_n) - normal_cdf((4 * k - 1) * z / sqrt_n)
+        for k in range(int((-n / z - 3) / 4), int((n / z - 1) / 4) + 1):
+            total += normal_cdf((4 * k + 3) * z / sqrt_n) - normal_cdf((4 * k + 1) * z / sqrt_n)
+        return total
+
+    @classmethod
+    def p_values(cls, bits: np.ndarray) -> (float, float):
+        """
+        :return: p-values of forward and backward modes, nan for too short sequence
+        """
+        if bits.size < cls.MIN_BITS:
+            return math.nan, math.nan
+        walk = np.cumsum(2 * bits.astype(np.int64) - 1)
+        forward = int(np.abs(walk).max())
+        # Backward walk is walk[-1] - walk[k] plus the first step from the end
+        backward = int(np.abs(walk[-1] - np.concatenate(([0], walk[:-1]))).max())
+        return cls._mode_p_value(bits.size, forward), cls._mode_p_value(bits.size, backward)
+
+    @classmethod
+    def _p_value(cls, bits: np.ndarray) -> float:
+        return min(cls.p_values(bits))
+
+
+class ApproximateEntropyTest(NistTest):
+    """
+    Approximate entropy test: frequencies of overlapping patterns of m and m + 1 bits
+    """
+    NAME = "approximate_entropy"
+    # Maximal length of pattern, it is also limited by length of sequence
+    MAX_PATTERN = 10
+
+    @staticmethod
+    def pattern_length(n: int) -> int:
+        """
+        Chooses length of pattern m < log2(n) - 5, as recommended by NIST.
+        """
+        return max(1, min(ApproximateEntropyTest.MAX_PATTERN, int(math.log2(n)) - 6))
+
+    @staticmethod
+    def _phi(bits: np.ndarray, m: int) -> float:
+        n = bits.size
+        extended = np.concatenate((bits, bits[:m - 1])).astype(np.int64)
+        # Value of every overlapping pattern of m bits, sequence is wrapped
+        values = np.zeros(n, dtype=np.int64)
+        for j in range(m):
+            values = (values << 1) | extended[j:j + n]
+        frequencies = np.bincount(values, minlength=1 << m) / n
+        frequencies = frequencies[frequencies > 0]
+        return float(np.sum(frequencies * np.log(frequencies)))
+
+    @classmethod
+    def _p_value(cls, bits: np.ndarray, m: int = None) -> float:
+        n = bits.size
+        m = m or cls.pattern_length(n)
+        ap_en = cls._phi(bits, m) - cls._phi(bits, m + 1)
+        chi2 = 2 * n * (math.log(2) - ap_en)
+        return igamc(2 ** (m - 1), chi2 / 2)
+
+
+class SpectralTest(NistTest):
+    """
+    Discrete Fourier transform (spectral) test: number of peaks of spectrum above threshold
+    """
+    NAME = "spectral"
+    MIN_BITS = 1000
+
+    @classmethod
+    def _p_value(cls, bits: np.ndarray) -> float:
+        n = bits.size
+        spectrum = np.abs(np.fft.rfft(2 * bits.astype(np.float64) - 1)[:n // 2])
+        threshold = math.sqrt(math.log(1 / 0.05) * n)
+        expected = 0.95 * n / 2
+        observed = int(np.count_nonzero(spectrum < threshold))
+        d = (observed - expected) / math.sqrt(n * 0.95 * 0.05 / 4)
+        return math.erfc(abs(d) / math.sqrt(2))
+
+
+class NistTestSuite:
+    """
+    Runs all NIST tests on the same array of bits
+    """
+    TESTS = (BlockFrequencyTest, RunsTest, CumulativeSumsTest, ApproximateEntropyTest, SpectralTest)
+
+    @staticmethod
+    def run_tests(bytes_arr) -> KeyTestReport:
+        """
+        Runs all tests on the input bytes_arr.
+        :param bytes_arr: array of bytes input
+        :return: report with p-value of every test
+        """
+        bits = bytes_to_bits_np(bytes_arr)
+        report = KeyTestReport(bits.size)
+        for test in NistTestSuite.TESTS:
+            report.tests[test.NAME] = test.report(bits)
+        return report
+
+
+def test_nist_examples():
+    """
+    Compares p-values with examples from NIST SP 800-22 for 100 bits of e.
+    """
+    epsilon = np.array([int(bit) for bit in "11001001000011111101101010100010001000010110100011"
+                                            "00001000110100110001001100011001100010100010111000"], dtype=np.uint8)
+    assert round(BlockFrequencyTest.p_value(epsilon, block_size=10), 6) == 0.706438, "Error for block frequency"
+    assert round(RunsTest.p_value(epsilon), 6) == 0.500798, "Error for runs"
+    forward, backward = CumulativeSumsTest.p_values(epsilon)
+    assert (round(forward, 6), round(backward, 6)) == (0.219194, 0.114866), "Error for cumulative sums"
+    assert round(ApproximateEntropyTest.p_value(epsilon, m=2), 6) == 0.235301, "Error for approximate entropy"
+
+    # Worked example of the spectral test in NIST SP 800-22 is not consistent with its formulas,
+    # so the test is verified by periodic sequence, which has no peaks except one
+    periodic = np.tile(np.array([0, 1], dtype=np.uint8), 5000)
+    assert SpectralTest.p_value(periodic) < SpectralTest.ALPHA, "Error for spectral"
+
+
+def test_sample_sizes():
+    """
+    Short sequences give undefined p-value and failed tests instead of errors,
+    block size of long sequences keeps number of blocks below 100.
+    """
+    for n_bytes in (0, 1, 12):
+        report = NistTestSuite.run_tests(random.randbytes(n_bytes))
+        for test_report in report.tests.values():
+            assert math.isnan(test_report.statistic) and not test_report.passed, \
+                f"Error for {test_report.name} of {n_bytes} bytes"
+        assert not report.passed, f"Error for suite of {n_bytes} bytes"
+
+    for n in (100, 1000, 12345, 1 << 20, 10 ** 7):
+        m = BlockFrequencyTest.block_size(n)
+        assert m >= 20 and m > 0.01 * n and n // m < 100, f"Error for block size {m} of {n} bits"
+    assert math.isnan(BlockFrequencyTest.p_value(np.ones(200, dtype=np.uint8), block_size=300)), "Error for big block"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    test_nist_examples()
+    test_sample_sizes()
+
+    print("Random 1 Mbit sequence:")
+    for test_report in NistTestSuite.run_tests(random.randbytes(1 << 17)).tests.values():
+        print(f"{test_report.name}: p-value = {test_report.statistic:.6f}, passed = {test_report.passed}")
+
+    print("\nBiased sequence:")
+    biased = bytes(random.getrandbits(8) | random.getrandbits(8) & 0x01 for _ in range(1 << 14))
+    for test_report in NistTestSuite.run_tests(biased).tests.values():
+        print(f"{test_report.name}: p-value = {test_report.statistic:.6f}, passed = {test_report.passed}")
+    print("All NIST tests passed")
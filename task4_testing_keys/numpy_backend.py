@@ -0,0 +1,155 @@
+import random
+
+import numpy as np
+
+from task4_testing_keys.main import MaxLengthSequenceTest, MonobitTest, PokerTest, SequenceLengthTest
+
+
+def bytes_to_bits_np(bytes_arr) -> np.ndarray:
+    """
+    Converts bytes to array of bits, the most significant bit of every byte first (as bytes_to_bits).
+    :param bytes_arr: bytes-like object
+    :return: uint8 array of 0 and 1
+    """
+    return np.unpackbits(np.frombuffer(bytes_arr, dtype=np.uint8))
+
+
+def run_lengths(bits: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Run-length encoding of bits sequence.
+    :param bits: array of 0 and 1
+    :return: value of bit and length of every run
+    """
+    if not bits.size:
+        return bits[:0], np.zeros(0, dtype=np.int64)
+    # Index of the last bit of every run
+    ends = np.append(np.flatnonzero(np.diff(bits)), bits.size - 1)
+    lengths = np.diff(ends, prepend=-1)
+    return bits[ends], lengths
+
+
+class NumpyMonobitTest(MonobitTest):
+    """
+    Monobit test on NumPy, the same result as MonobitTest
+    """
+    @staticmethod
+    def run_test(bytes_arr: bytearray) -> bool:
+        """
+        Testing the input bytes_arr for number of 0 and 1 in bit representation.
+        :param bytes_arr: array of bytes input
+        :return: True if test passed else False.
+        """
+        sum_of_ones = int(np.count_nonzero(bytes_to_bits_np(bytes_arr)))
+
+        min_val = int(MonobitTest.MIN_VAL_8 * len(bytes_arr))
+        max_val = int(MonobitTest.MAX_VAL_8 * len(bytes_arr))
+        return min_val < sum_of_ones < max_val
+
+
+class NumpyMaxLengthSequenceTest(MaxLengthSequenceTest):
+    """
+    Max-length sequence test on NumPy, the same result as MaxLengthSequenceTest
+    """
+    @staticmethod
+    def run_test(bytes_arr: bytearray) -> bool:
+        """
+        Testing the input bytes_arr for max length of sequence of the same bits.
+        :param bytes_arr: array of bytes input
+        :return: True if test passed else False.
+        """
+        _, lengths = run_lengths(bytes_to_bits_np(bytes_arr))
+        max_length_seq = int(lengths.max()) if lengths.size else 0
+        return max_length_seq < MaxLengthSequenceTest.MAX_LENGTH
+
+
+class NumpyPokerTest(PokerTest):
+    """
+    Poker test on NumPy, the same result as PokerTest
+    """
+    @staticmethod
+    def run_test(bytes_arr: bytearray, m: int = 4) -> bool:
+        """
+        Testing the input bytes_arr for Poker test
+        :param bytes_arr: array of bytes input
+        :param m: length of Poker block
+        :return: True if test passed else False.
+        """
+        if m == 4:
+            # Blocks are nibbles of bytes, no need to unpack bits
+            data = np.frombuffer(bytes_arr, dtype=np.uint8)
+            k = 2 * data.size
+            counts = np.bincount(data >> 4, minlength=16) + np.bincount(data & 0x0F, minlength=16)
+        else:
+            bits_array = bytes_to_bits_np(bytes_arr)
+            k = bits_array.size // m
+            full = bits_array[:k * m].reshape(k, m)
+            values = full.dot(1 << np.arange(m - 1, -1, -1))
+            # The last incomplete block is counted as in PokerTest
+            tail = bits_array[k * m:]
+            if tail.size:
+                values = np.append(values, tail.dot(1 << np.arange(tail.size - 1, -1, -1)))
+            counts = np.bincount(values, minlength=2**m)
+
+        xi3 = 2**m / k * int(np.dot(counts, counts)) - k
+        return PokerTest.MIN_XI3 < xi3 < PokerTest.MAX_XI3
+
+
+class NumpySequenceLengthTest(SequenceLengthTest):
+    """
+    Test the number of sequence of ones and zeros on NumPy, the same result as SequenceLengthTest
+    """
+    @staticmethod
+    def run_test(bytes_arr: bytearray) -> bool:
+        """
+        Testing the input bytes_arr for number of sequence of different length of 0 and 1 in bit representation.
+        :param bytes_arr: array of bytes input
+        :return: True if test passed else False.
+        """
+        bits_array = bytes_to_bits_np(bytes_arr)
+        values, lengths = run_lengths(bits_array)
+        max_seq = SequenceLengthTest.MAX_SEQ_VAL
+
+        # Counting is the same as in SequenceLengthTest: every run except the last one is counted
+        # when the bit changes, into the dictionary of the new bit, and the first bit adds one run of length 1
+        keys = 1 - values[:-1]
+        counted = np.minimum(lengths[:-1], max_seq)
+        seq_len_ones = np.bincount(counted[keys == 1], minlength=max_seq + 1)
+        seq_len_zeros = np.bincount(counted[keys == 0], minlength=max_seq + 1)
+        if values.size:
+            (seq_len_ones if values[0] == 1 else seq_len_zeros)[1] += 1
+
+        for key_seq, value in SequenceLengthTest.EXPECTED_LENGHT.items():
+            expected_min = int(value[SequenceLengthTest.MIN_KEY] * bits_array.size / 20000)
+            expected_max = int(value[SequenceLengthTest.MAX_KEY] * bits_array.size / 20000)
+            if not (expected_min < seq_len_ones[key_seq] < expected_max) or \
+                    not (expected_min < seq_len_zeros[key_seq] < expected_max):
+                return False
+        return True
+
+
+def test_against_python(bytes_arr):
+    """
+    Compares results of NumPy tests with the original tests.
+    """
+    assert NumpyMonobitTest.run_test(bytes_arr) == MonobitTest.run_test(bytes_arr), "Error for monobit"
+    assert NumpyMaxLengthSequenceTest.run_test(bytes_arr) == MaxLengthSequenceTest.run_test(bytes_arr), \
+        "Error for max-length sequence"
+    for m in (4, 3, 8):
+        assert NumpyPokerTest.run_test(bytes_arr, m) == PokerTest.run_test(bytes_arr, m), f"Error for poker m={m}"
+    assert NumpySequenceLengthTest.run_test(bytes_arr) == SequenceLengthTest.run_test(bytes_arr), \
+        "Error for sequence length"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+
+    for _ in range(20):
+        test_against_python(bytearray(random.getrandbits(8) for _ in range(2500)))
+    # Biased bytes fail some of tests
+    for probability in (0.3, 0.45, 0.49):
+        test_against_python(bytearray(sum((random.random() < probability) << i for i in range(8)) for _ in range(2500)))
+    for bytes_arr in (bytearray([0x01] * 1250), bytearray([0xFF] * 100), bytearray([0xFF, 0xFF, 0xF0, 0xAA]),
+                      bytearray([0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00])):
+        test_against_python(bytes_arr)
+
+    print("All NumPy backend tests passed")
@@ -0,0 +1,119 @@
+import hashlib
+import random
+import struct
+from typing import List, Sequence
+
+import numpy as np
+
+from task5_hash.main import SHA1
+
+
+class SHA1Batch:
+    """
+    SHA1 of many messages at once: every message is a lane of NumPy uint32 arrays,
+    the compression function runs over all lanes together. Lanes have their own padding and number of blocks,
+    lanes with fewer blocks keep their state, when longer messages are processed.
+    """
+    K = (0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xCA62C1D6)
+
+    @staticmethod
+    def padded_blocks(messages: Sequence[bytes]) -> (np.ndarray, np.ndarray):
+        """
+        Pads all messages into one matrix of words.
+        :param messages: list of bytes-like objects
+        :return: (N, max_blocks * 16) matrix of big-endian words and number of blocks of every message
+        """
+        lengths = np.array([len(message) for message in messages], dtype=np.int64)
+        # Bit 1 and 64bit length need 9 bytes
+        blocks = (lengths + 9 + SHA1.BLOCK_SIZE - 1) // SHA1.BLOCK_SIZE
+        max_blocks = int(blocks.max()) if len(messages) else 0
+        data = np.zeros((len(messages), max_blocks * SHA1.BLOCK_SIZE), dtype=np.uint8)
+        for row, message, length, count in zip(data, messages, lengths.tolist(), blocks.tolist()):
+            row[:length] = np.frombuffer(message, dtype=np.uint8)
+            row[length] = 0x80
+            end = count * SHA1.BLOCK_SIZE
+            row[end - 8:end] = np.frombuffer(struct.pack(">Q", 8 * length), dtype=np.uint8)
+        return data.view(">u4").astype(np.uint32), blocks
+
+    @staticmethod
+    def compress(h: List[np.ndarray], words: np.ndarray) -> List[np.ndarray]:
+        """
+        Processes one block of every lane.
+        :param h: five arrays of state words
+        :param words: (N, 16) matrix of words of block
+        :return: new state
+        """
+        w = np.empty((words.shape[0], 80), dtype=np.uint32)
+        w[:, :16] = words
+        for i in range(16, 80):
+            t = w[:, i - 3] ^ w[:, i - 8] ^ w[:, i - 14] ^ w[:, i - 16]
+            w[:, i] = (t << 1) | (t >> 31)
+        # Columns are contiguous, so every round reads one array
+        w = np.ascontiguousarray(w.T)
+
+        a, b, c, d, e = h
+        for i in range(0, 20):
+            temp = ((a << 5) | (a >> 27)) + (d ^ (b & (c ^ d))) + e + np.uint32(SHA1Batch.K[0]) + w[i]
+            e, d, c, b, a = d, c, (b << 30) | (b >> 2), a, temp
+        for i in range(20, 40):
+            temp = ((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + np.uint32(SHA1Batch.K[1]) + w[i]
+            e, d, c, b, a = d, c, (b << 30) | (b >> 2), a, temp
+        for i in range(40, 60):
+            temp = ((a << 5) | (a >> 27)) + ((b & c) | (d & (b | c))) + e + np.uint32(SHA1Batch.K[2]) + w[i]
+            e, d, c, b, a = d, c, (b << 30) | (b >> 2), a, temp
+        for i in range(60, 80):
+            temp = ((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + np.uint32(SHA1Batch.K[3]) + w[i]
+            e, d, c, b, a = d, c, (b << 30) | (b >> 2), a, temp
+
+        return [h[0] + a, h[1] + b, h[2] + c, h[3] + d, h[4] + e]
+
+    @staticmethod
+    def digest(messages: Sequence[bytes]) -> List[bytes]:
+        """
+        Calculates SHA1 of every message.
+        :param messages: list of bytes-like objects
+        :return: list of 20-byte digests
+        """
+        if not len(messages):
+            return []
+        words, blocks = SHA1Batch.padded_blocks(messages)
+        sha = SHA1()
+        h = [np.full(len(messages), value, dtype=np.uint32) for value in (sha.h0, sha.h1, sha.h2, sha.h3, sha.h4)]
+
+        for block_idx in range(int(blocks.max())):
+            active = blocks > block_idx
+            new_h = SHA1Batch.compress(h, words[:, 16 * block_idx:16 * (block_idx + 1)])
+            # Finished lanes keep their state
+            h = [np.where(active, new, old) for new, old in zip(new_h, h)]
+
+        digests = np.stack(h, axis=1).astype(">u4").tobytes()
+        return [digests[i:i + SHA1.digest_size] for i in range(0, len(digests), SHA1.digest_size)]
+
+    @staticmethod
+    def hexdigest(messages: Sequence[bytes]) -> List[str]:
+        """
+        Calculates SHA1 of every message.
+        :return: list of hex digests, as SHA1.get_hash
+        """
+        return [digest.hex() for digest in SHA1Batch.digest(messages)]
+
+
+def test_batch_against_hashlib(count, max_length):
+    """
+    Compares batch digests of random messages with hashlib.
+    """
+    messages = [random.randbytes(random.randint(0, max_length)) for _ in range(count)]
+    expected = [hashlib.sha1(message).digest() for message in messages]
+    assert SHA1Batch.digest(messages) == expected, f"Error for {count} messages up to {max_length} bytes"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    test_batch_against_hashlib(1, 0)
+    test_batch_against_hashlib(100, 200)
+    # Lengths around the border of padding to one or two blocks
+    messages_55_56 = [b"a" * length for length in range(50, 70)]
+    assert SHA1Batch.hexdigest(messages_55_56) == [SHA1().get_hash(message) for message in messages_55_56]
+    print("All SHA1 batch tests passed")
+    # Throughput of the batch and one by one hashing is measured by benchmark.py:
+    #   python -m task5_hash.benchmark --hashes sha1 --sizes 64 1024
@@ -0,0 +1,159 @@
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from task5_hash.batch import SHA1Batch
+from task5_hash.registry import get_backend
+
+# Hashes to benchmark, every one is compared with the hashlib implementation of the same hash
+HASHES = ("sha1", "sha256", "sha512")
+
+# Sizes of messages in bytes
+SIZES = (64, 1 << 10, 1 << 14, 1 << 17, 1 << 20)
+
+# Batch engines: callable(messages) -> list of digests
+BATCH_ENGINES = {"sha1": SHA1Batch.digest}
+# Number of messages hashed by one call of batch engine
+BATCH_SIZE = 256
+# Batch engines are measured only for short messages, as all lanes are kept in one matrix
+BATCH_MAX_SIZE = 1 << 14
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def engines(hash_name: str) -> Dict[str, Callable]:
+    """
+    Returns hash functions to compare: callable(message) -> digest.
+    :param hash_name: name of hash from task5_hash.registry
+    """
+    own = get_backend(hash_name)
+    fast = get_backend(hash_name, fast=True)
+    return {
+        "own": lambda message: own(message).digest(),
+        "hashlib": lambda message: fast(message).digest(),
+    }
+
+
+def batch_engine(hash_name: str) -> Optional[Callable]:
+    """
+    Returns batch hash function: callable(message) -> digests of BATCH_SIZE copies of message,
+    or None if there is no batch engine of the hash.
+    """
+    batch = BATCH_ENGINES.get(hash_name)
+    if batch is None:
+        return None
+    return lambda message: batch([message] * BATCH_SIZE)
+
+
+def time_call(func: Callable, repeat: int) -> float:
+    """
+    Measures time of one call of func.
+    :param func: callable without arguments
+    :param repeat: number of measurements, the best one is taken
+    :return: seconds per call
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_memory(hash_name: str, engine: str, size: int) -> (int, int, int):
+    """
+    Hashes one message and measures memory. Should be run in a fresh process,
+    as RSS high-water mark can not be reset.
+    :return: peak of Python allocations by tracemalloc, RSS high-water mark of the process and its growth
+        while hashing, in bytes
+    """
+    func = batch_engine(hash_name) if engine == "batch" else engines(hash_name)[engine]
+    message = random.randbytes(size)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    func(message)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak, max_rss * RSS_UNIT, (max_rss - base_rss) * RSS_UNIT
+
+
+def run_benchmark(hashes: List[str], sizes: List[int], repeat: int = 5, seed: int = 3) -> List[dict]:
+    """
+    Measures throughput and memory of own and hashlib implementation of every hash for all sizes of message,
+    and of batch engine for short messages if the hash has one.
+    Memory is measured in a new process for every row, timing is done in the current process.
+    :param hashes: names of hashes from task5_hash.registry
+    :param sizes: sizes of messages in bytes
+    :param repeat: number of measurements of every message
+    :param seed: seed for random messages
+    :return: list of result rows
+    """
+    random.seed(seed)
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for hash_name in hashes:
+            funcs = engines(hash_name)
+            batch = batch_engine(hash_name)
+            for size in sizes:
+                message = random.randbytes(size)
+                expected = funcs["hashlib"](message)
+                assert funcs["own"](message) == expected, f"Wrong {hash_name} of {size} bytes"
+                rows = {}
+                # Batch engine hashes BATCH_SIZE messages by one call
+                measured = [(engine, func, 1) for engine, func in funcs.items()]
+                if batch is not None and size <= BATCH_MAX_SIZE:
+                    assert batch(message)[0] == expected, f"Wrong batch {hash_name} of {size} bytes"
+                    measured.append(("batch", batch, BATCH_SIZE))
+
+                for engine, func, messages in measured:
+                    seconds = time_call(lambda: func(message), repeat)
+                    peak, max_rss, rss_growth = pool.apply(measure_memory, (hash_name, engine, size))
+                    rows[engine] = {"hash": hash_name, "engine": engine, "size": size, "messages": messages,
+                                    "seconds": seconds, "mb_per_s": messages * size / seconds / 1e6,
+                                    "tracemalloc_peak": peak, "max_rss": max_rss, "max_rss_growth": rss_growth}
+
+                own, fast = rows["own"], rows["hashlib"]
+                own["slowdown_vs_hashlib"] = own["seconds"] / fast["seconds"]
+                line = (f"{hash_name:>7} {size:>8} bytes: own {own['mb_per_s']:9.3f} MB/s, "
+                        f"hashlib {fast['mb_per_s']:9.1f} MB/s, x{own['slowdown_vs_hashlib']:.0f}; "
+                        f"own peak {own['tracemalloc_peak']} B, max RSS {own['max_rss'] >> 20} MiB")
+                if "batch" in rows:
+                    line += f"; batch of {BATCH_SIZE} {rows['batch']['mb_per_s']:.3f} MB/s"
+                print(line, flush=True)
+                results.extend(rows.values())
+    return results
+
+
+def save_json(results: List[dict], path: str) -> None:
+    """
+    Saves results with environment description as JSON.
+    """
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of hash engines against hashlib")
+    parser.add_argument("--hashes", nargs="+", default=list(HASHES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="sizes of messages in bytes")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measurements of every message")
+    parser.add_argument("--json", default="hash_benchmark.json", help="path of JSON output")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmark(args.hashes, args.sizes, args.repeat)
+    save_json(benchmark_results, args.json)
+    print(f"Saved {len(benchmark_results)} results to {args.json}")
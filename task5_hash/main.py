@@ -1,77 +1,148 @@
-import time
-import psutil
 import hashlib
+import struct
+
+
+# One block of message as 16 big-endian 32bit words
+BLOCK_WORDS = struct.Struct(">16I")
+MASK_32 = 0xffffffff
 
 
 class SHA1:
-    def __init__(self):
+    """
+    SHA1 hash. get_hash hashes the whole message at once,
+    update/digest/hexdigest/copy work as hashlib object and keep only incomplete block between calls.
+    """
+    BLOCK_SIZE = 64
+
+    # Attributes of hashlib object
+    name = "sha1"
+    digest_size = 20
+    block_size = BLOCK_SIZE
+
+    def __init__(self, data=b""):
+        """
+        :param data: optional first part of message for update
+        """
         self.h0 = 0x67452301
         self.h1 = 0xEFCDAB89
         self.h2 = 0x98BADCFE
         self.h3 = 0x10325476
         self.h4 = 0xC3D2E1F0
 
+        # State of streaming hash
+        self._h = (self.h0, self.h1, self.h2, self.h3, self.h4)
+        self._buffer = bytearray()
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def update(self, data) -> None:
+        """
+        Adds next part of message.
+        :param data: bytes-like object
+        """
+        data = memoryview(data).cast("B")
+        self._length += len(data)
+        h = self._h
+        offset = 0
+
+        if self._buffer:
+            # Complete the buffered block first
+            offset = min(SHA1.BLOCK_SIZE - len(self._buffer), len(data))
+            self._buffer += data[:offset]
+            if len(self._buffer) < SHA1.BLOCK_SIZE:
+                return
+            h = SHA1.compress(h, self._buffer)
+            self._buffer.clear()
+
+        full_size = len(data) - (len(data) - offset) % SHA1.BLOCK_SIZE
+        for block_offset in range(offset, full_size, SHA1.BLOCK_SIZE):
+            h = SHA1.compress(h, data, block_offset)
+        self._buffer += data[full_size:]
+        self._h = h
+
+    def digest(self) -> bytes:
+        """
+        Returns hash of message added by update, the object can be updated further.
+        """
+        h = self._h
+        tail = SHA1.pad(self._buffer, self._length)
+        for offset in range(0, len(tail), SHA1.BLOCK_SIZE):
+            h = SHA1.compress(h, tail, offset)
+        return struct.pack(">5I", *h)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> "SHA1":
+        """
+        Returns copy of the object, e.g. to hash several messages with common prefix.
+        """
+        other = SHA1()
+        other._h = self._h
+        other._buffer = bytearray(self._buffer)
+        other._length = self._length
+        return other
+
     def get_hash(self, message):
-        h0 = self.h0
-        h1 = self.h1
-        h2 = self.h2
-        h3 = self.h3
-        h4 = self.h4
-
-        pbits = bits = ''.join(format(byte, '08b') for byte in message) + '1'
-        pbits = pbits + "0" * (448 - len(pbits) % 512) + '{0:064b}'.format(len(bits) - 1)
-
-        for c in SHA1.make_chunks(pbits, 512):
-            words = SHA1.make_chunks(c, 32)
-            w = [0] * 80
-            for n in range(0, 16):
-                w[n] = int(words[n], 2)
-            for i in range(16, 80):
-                w[i] = SHA1.rol((w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16]), 1)
-
-            a = h0
-            b = h1
-            c = h2
-            d = h3
-            e = h4
-
-            # Main loop
-            for i in range(0, 80):
-                if 0 <= i <= 19:
-                    f = (b & c) | ((~b) & d)
-                    k = 0x5A827999
-                elif 20 <= i <= 39:
-                    f = b ^ c ^ d
-                    k = 0x6ED9EBA1
-                elif 40 <= i <= 59:
-                    f = (b & c) | (b & d) | (c & d)
-                    k = 0x8F1BBCDC
-                else:
-                    f = b ^ c ^ d
-                    k = 0xCA62C1D6
-
-                temp = SHA1.rol(a, 5) + f + e + k + w[i] & 0xffffffff
-                e = d
-                d = c
-                c = SHA1.rol(b, 30)
-                b = a
-                a = temp
-
-            h0 = h0 + a & 0xffffffff
-            h1 = h1 + b & 0xffffffff
-            h2 = h2 + c & 0xffffffff
-            h3 = h3 + d & 0xffffffff
-            h4 = h4 + e & 0xffffffff
-
-        return '%08x%08x%08x%08x%08x' % (h0, h1, h2, h3, h4)
+        message = memoryview(message).cast("B")
+        h = (self.h0, self.h1, self.h2, self.h3, self.h4)
+
+        # Full blocks are read directly from the message
+        full_size = len(message) - len(message) % SHA1.BLOCK_SIZE
+        for offset in range(0, full_size, SHA1.BLOCK_SIZE):
+            h = SHA1.compress(h, message, offset)
+
+        # Only the tail of message is copied to be padded
+        tail = SHA1.pad(message[full_size:], len(message))
+        for offset in range(0, len(tail), SHA1.BLOCK_SIZE):
+            h = SHA1.compress(h, tail, offset)
+
+        return '%08x%08x%08x%08x%08x' % h
 
     @staticmethod
-    def make_chunks(l, n):
-        return [l[i:i + n] for i in range(0, len(l), n)]
+    def pad(tail, length: int) -> bytes:
+        """
+        Pads the last incomplete block of message: bit 1, zeros and length of message in bits.
+        :param tail: bytes of the last incomplete block
+        :param length: length of the whole message in bytes
+        :return: one or two blocks
+        """
+        zeros = (SHA1.BLOCK_SIZE - 9 - len(tail)) % SHA1.BLOCK_SIZE
+        return bytes(tail) + b"\x80" + b"\x00" * zeros + struct.pack(">Q", 8 * length)
 
     @staticmethod
-    def rol(n, b):
-        return ((n << b) | (n >> (32 - b))) & 0xffffffff
+    def compress(h, data, offset: int = 0):
+        """
+        Processes one block of 64 bytes.
+        :param h: tuple of five 32bit words of state
+        :param data: bytes-like object with block
+        :param offset: offset of block in data
+        :return: new state
+        """
+        w = list(BLOCK_WORDS.unpack_from(data, offset))
+        for i in range(16, 80):
+            t = w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16]
+            w.append(((t << 1) | (t >> 31)) & MASK_32)
+
+        a, b, c, d, e = h
+
+        # Main loop, 4 phases of 20 rounds with their own function and constant
+        for i in range(0, 20):
+            temp = (((a << 5) | (a >> 27)) + (d ^ (b & (c ^ d))) + e + 0x5A827999 + w[i]) & MASK_32
+            e, d, c, b, a = d, c, ((b << 30) | (b >> 2)) & MASK_32, a, temp
+        for i in range(20, 40):
+            temp = (((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + 0x6ED9EBA1 + w[i]) & MASK_32
+            e, d, c, b, a = d, c, ((b << 30) | (b >> 2)) & MASK_32, a, temp
+        for i in range(40, 60):
+            temp = (((a << 5) | (a >> 27)) + ((b & c) | (d & (b | c))) + e + 0x8F1BBCDC + w[i]) & MASK_32
+            e, d, c, b, a = d, c, ((b << 30) | (b >> 2)) & MASK_32, a, temp
+        for i in range(60, 80):
+            temp = (((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + 0xCA62C1D6 + w[i]) & MASK_32
+            e, d, c, b, a = d, c, ((b << 30) | (b >> 2)) & MASK_32, a, temp
+
+        return (h[0] + a & MASK_32, h[1] + b & MASK_32, h[2] + c & MASK_32,
+                h[3] + d & MASK_32, h[4] + e & MASK_32)
 
 
 if __name__ == "__main__":
@@ -102,42 +173,17 @@ if __name__ == "__main__":
     print(f"SHA1 from hashlib: {sha1_impl}")
     print(f"SHA1 my impl: {sha1_my_impl}")
 
-    # Performance test
-    test_val = "Glory to Ukraine!" * 100
-
-    print("\n\nPerformance test")
-    start = time.time()
-    sha1_impl = hashlib.sha1(test_val.encode('ascii')).hexdigest()
-    end = time.time()
-
-    time_sha1_impl = end - start
-    print(f"Glory to Ukraine! * 100. Hashlib implementation time: {end - start}")
-
-    start = time.time()
-    sha1_my_impl = my_obj.get_hash(test_val.encode('ascii'))
-    end = time.time()
-    time_sha1_my_impl = end - start
-    print(f"Glory to Ukraine! * 100. Hashlib implementation time: {end - start}")
-
-    test_val = "Glory to Ukraine!" * 10000
-
-    start = time.time()
-    sha1_impl = hashlib.sha1(test_val.encode('ascii')).hexdigest()
-    end = time.time()
-
-    time_sha1_impl = end - start
-    print(f"\nGlory to Ukraine! * 10000. Hashlib implementation time: {end - start}")
-
-    start = time.time()
-    sha1_my_impl = my_obj.get_hash(test_val.encode('ascii'))
-    end = time.time()
-    time_sha1_my_impl = end - start
-    print(f"Glory to Ukraine! * 10000. Hashlib implementation time: {end - start}")
-
-    test_val = "Glory to Ukraine!" * 1000000
-
-    sha1_impl = hashlib.sha1(test_val.encode('ascii')).hexdigest()
-    print(psutil.Process().memory_info().rss / (1024 * 1024))
-
-    sha1_impl = my_obj.get_hash(test_val.encode('ascii'))
-    print(psutil.Process().memory_info().rss / (1024 * 1024))
+    # Test, compare streaming SHA1 to hashlib
+    hashlib_obj = hashlib.sha1()
+    my_stream = SHA1()
+    for part in (b"Glory", b" to ", b"Ukraine!" * 20, b"", b"1" * 100):
+        hashlib_obj.update(part)
+        my_stream.update(part)
+    prefix_copy = my_stream.copy()
+    prefix_copy.update(b"suffix")
+    print(f"Test compare streaming SHA1 to hashlib: {hashlib_obj.hexdigest() == my_stream.hexdigest()}")
+    print(f"Test compare copy of streaming SHA1 to hashlib: "
+          f"{hashlib_obj.copy().digest() == my_stream.digest() != prefix_copy.digest()}")
+
+    # Performance and memory of the implementation are measured by benchmark.py:
+    #   python -m task5_hash.benchmark
@@ -0,0 +1,84 @@
+import hashlib
+from typing import Callable, Dict, Union
+
+from task5_hash.main import SHA1
+from task5_hash.sha2 import SHA256, SHA512
+
+# Backend is a callable, that creates hash object: backend(data=b"") with update/digest/hexdigest.
+# Our classes and hashlib constructors (hashlib.sha256) are backends.
+HashBackend = Callable
+
+# Our pure-Python engines by name
+HASH_ENGINES: Dict[str, HashBackend] = {
+    "sha1": SHA1,
+    "sha256": SHA256,
+    "sha512": SHA512,
+}
+
+
+def _normalize(hash_name: str) -> str:
+    """
+    Converts name to the form of hashlib: "SHA-256" -> "sha256", "SHA3-256" -> "sha3_256".
+    """
+    name = hash_name.lower().replace("-", "_")
+    return "sha" + name[4:] if name.startswith("sha_") else name
+
+
+def register_hash(hash_name: str, backend: HashBackend) -> None:
+    """
+    Adds engine to the registry.
+    :param hash_name: name of hash, e.g. "sha3_256"
+    :param backend: callable, that creates hash object with update/digest/hexdigest
+    """
+    HASH_ENGINES[_normalize(hash_name)] = backend
+
+
+def get_backend(hash_name: Union[str, HashBackend] = "sha1", fast: bool = False) -> HashBackend:
+    """
+    Returns backend of hash by name.
+    :param hash_name: name of hash ("sha1", "SHA-256", ...) or backend itself, which is returned as is
+    :param fast: use hashlib implementation, when it exists, instead of our engine
+    :return: backend
+    """
+    if not isinstance(hash_name, str):
+        return hash_name
+
+    name = _normalize(hash_name)
+    if fast and name in hashlib.algorithms_available:
+        return getattr(hashlib, name, None) or (lambda data=b"": hashlib.new(name, data))
+    if name in HASH_ENGINES:
+        return HASH_ENGINES[name]
+    if name in hashlib.algorithms_available:
+        # Engine of our own does not exist, e.g. for SHA-3
+        return lambda data=b"": hashlib.new(name, data)
+    raise ValueError(f"Unsupported hash type {hash_name}")
+
+
+def new(hash_name: Union[str, HashBackend] = "sha1", data=b"", fast: bool = False):
+    """
+    Creates hash object as hashlib.new.
+    """
+    return get_backend(hash_name, fast)(data)
+
+
+def hash_to_int(backend: HashBackend, message, bit_length: int = None) -> int:
+    """
+    Hashes message and converts digest to int.
+    :param backend: backend of hash
+    :param message: bytes-like object
+    :param bit_length: if given, the leftmost bit_length bits of digest are taken (as for ECDSA)
+    :return: int of digest
+    """
+    digest = backend(message).digest()
+    value = int.from_bytes(digest, "big")
+    if bit_length is not None and 8 * len(digest) > bit_length:
+        value >>= 8 * len(digest) - bit_length
+    return value
+
+
+if __name__ == "__main__":
+    message = b"Distributed lab is the best!"
+    for name in ("sha1", "SHA-256", "sha512", "sha3_256"):
+        ours = new(name, message).hexdigest()
+        fast = new(name, message, fast=True).hexdigest()
+        print(f"{name}: {ours}, the same as hashlib: {ours == fast}")
@@ -0,0 +1,216 @@
+import hashlib
+import random
+import struct
+
+
+class SHA2:
+    """
+    Base class of SHA-2 hashes with the same interface as SHA1:
+    get_hash for the whole message and update/digest/hexdigest/copy as hashlib object.
+    Subclasses define size of word, constants and rotations.
+    """
+    name = ""
+    digest_size = 0
+    block_size = 0
+    # Struct of 16 words of block and of digest words
+    BLOCK_WORDS: struct.Struct = None
+    DIGEST_FORMAT = ""
+    LENGTH_BYTES = 0
+    # Bits of word and mask of them
+    WORD_BITS = 0
+    MASK = 0
+    K = ()
+    H = ()
+    # Rotations of big sigma 0 and 1, small sigma 0 and 1 (the last one of small sigmas is a shift)
+    SIGMA0 = ()
+    SIGMA1 = ()
+    SMALL_SIGMA0 = ()
+    SMALL_SIGMA1 = ()
+
+    def __init__(self, data=b""):
+        """
+        :param data: optional first part of message for update
+        """
+        self._h = tuple(self.H)
+        self._buffer = bytearray()
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def _rotr(self, x: int, n: int) -> int:
+        """
+        Rotates word x right by n bits.
+        """
+        return ((x >> n) | (x << (self.WORD_BITS - n))) & self.MASK
+
+    def get_hash(self, message) -> str:
+        """
+        Returns hex hash of the whole message, state of the object is not used.
+        """
+        return type(self)(message).hexdigest()
+
+    def update(self, data) -> None:
+        """
+        Adds next part of message.
+        :param data: bytes-like object
+        """
+        data = memoryview(data).cast("B")
+        self._length += len(data)
+        h = self._h
+        offset = 0
+
+        if self._buffer:
+            offset = min(self.block_size - len(self._buffer), len(data))
+            self._buffer += data[:offset]
+            if len(self._buffer) < self.block_size:
+                return
+            h = self.compress(h, self._buffer)
+            self._buffer.clear()
+
+        full_size = len(data) - (len(data) - offset) % self.block_size
+        for block_offset in range(offset, full_size, self.block_size):
+            h = self.compress(h, data, block_offset)
+        self._buffer += data[full_size:]
+        self._h = h
+
+    def pad(self) -> bytes:
+        """
+        Pads the buffered incomplete block: bit 1, zeros and length of message in bits.
+        """
+        zeros = (self.block_size - 1 - self.LENGTH_BYTES - len(self._buffer)) % self.block_size
+        return (bytes(self._buffer) + b"\x80" + b"\x00" * zeros +
+                (8 * self._length).to_bytes(self.LENGTH_BYTES, "big"))
+
+    def digest(self) -> bytes:
+        """
+        Returns hash of message added by update, the object can be updated further.
+        """
+        h = self._h
+        tail = self.pad()
+        for offset in range(0, len(tail), self.block_size):
+            h = self.compress(h, tail, offset)
+        return struct.pack(self.DIGEST_FORMAT, *h)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> "SHA2":
+        other = type(self)()
+        other._h = self._h
+        other._buffer = bytearray(self._buffer)
+        other._length = self._length
+        return other
+
+    def compress(self, h, data, offset: int = 0):
+        """
+        Processes one block.
+        :param h: tuple of eight words of state
+        :param data: bytes-like object with block
+        :param offset: offset of block in data
+        :return: new state
+        """
+        rotr = self._rotr
+        mask = self.MASK
+        s0_a, s0_b, s0_c = self.SIGMA0
+        s1_a, s1_b, s1_c = self.SIGMA1
+        ss0_a, ss0_b, ss0_shift = self.SMALL_SIGMA0
+        ss1_a, ss1_b, ss1_shift = self.SMALL_SIGMA1
+
+        w = list(self.BLOCK_WORDS.unpack_from(data, offset))
+        for i in range(16, len(self.K)):
+            x, y = w[i - 15], w[i - 2]
+            small_sigma0 = rotr(x, ss0_a) ^ rotr(x, ss0_b) ^ (x >> ss0_shift)
+            small_sigma1 = rotr(y, ss1_a) ^ rotr(y, ss1_b) ^ (y >> ss1_shift)
+            w.append((w[i - 16] + small_sigma0 + w[i - 7] + small_sigma1) & mask)
+
+        a, b, c, d, e, f, g, hh = h
+        for k, word in zip(self.K, w):
+            sigma1 = rotr(e, s1_a) ^ rotr(e, s1_b) ^ rotr(e, s1_c)
+            temp1 = hh + sigma1 + (g ^ (e & (f ^ g))) + k + word
+            sigma0 = rotr(a, s0_a) ^ rotr(a, s0_b) ^ rotr(a, s0_c)
+            temp2 = sigma0 + ((a & b) | (c & (a | b)))
+            hh, g, f, e, d, c, b, a = g, f, e, (d + temp1) & mask, c, b, a, (temp1 + temp2) & mask
+
+        return tuple((x + y) & mask for x, y in zip(h, (a, b, c, d, e, f, g, hh)))
+
+
+class SHA256(SHA2):
+    name = "sha256"
+    digest_size = 32
+    block_size = 64
+    BLOCK_WORDS = struct.Struct(">16I")
+    DIGEST_FORMAT = ">8I"
+    LENGTH_BYTES = 8
+    WORD_BITS = 32
+    MASK = 0xffffffff
+    SIGMA0 = (2, 13, 22)
+    SIGMA1 = (6, 11, 25)
+    SMALL_SIGMA0 = (7, 18, 3)
+    SMALL_SIGMA1 = (17, 19, 10)
+    H = (0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19)
+    K = (0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+         0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+         0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+         0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+         0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+         0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+         0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+         0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2)
+
+
+class SHA512(SHA2):
+    name = "sha512"
+    digest_size = 64
+    block_size = 128
+    BLOCK_WORDS = struct.Struct(">16Q")
+    DIGEST_FORMAT = ">8Q"
+    LENGTH_BYTES = 16
+    WORD_BITS = 64
+    MASK = 0xffffffffffffffff
+    SIGMA0 = (28, 34, 39)
+    SIGMA1 = (14, 18, 41)
+    SMALL_SIGMA0 = (1, 8, 7)
+    SMALL_SIGMA1 = (19, 61, 6)
+    H = (0x6a09e667f3bcc908, 0xbb67ae8584caa73b, 0x3c6ef372fe94f82b, 0xa54ff53a5f1d36f1,
+         0x510e527fade682d1, 0x9b05688c2b3e6c1f, 0x1f83d9abfb41bd6b, 0x5be0cd19137e2179)
+    K = (0x428a2f98d728ae22, 0x7137449123ef65cd, 0xb5c0fbcfec4d3b2f, 0xe9b5dba58189dbbc, 0x3956c25bf348b538,
+         0x59f111f1b605d019, 0x923f82a4af194f9b, 0xab1c5ed5da6d8118, 0xd807aa98a3030242, 0x12835b0145706fbe,
+         0x243185be4ee4b28c, 0x550c7dc3d5ffb4e2, 0x72be5d74f27b896f, 0x80deb1fe3b1696b1, 0x9bdc06a725c71235,
+         0xc19bf174cf692694, 0xe49b69c19ef14ad2, 0xefbe4786384f25e3, 0x0fc19dc68b8cd5b5, 0x240ca1cc77ac9c65,
+         0x2de92c6f592b0275, 0x4a7484aa6ea6e483, 0x5cb0a9dcbd41fbd4, 0x76f988da831153b5, 0x983e5152ee66dfab,
+         0xa831c66d2db43210, 0xb00327c898fb213f, 0xbf597fc7beef0ee4, 0xc6e00bf33da88fc2, 0xd5a79147930aa725,
+         0x06ca6351e003826f, 0x142929670a0e6e70, 0x27b70a8546d22ffc, 0x2e1b21385c26c926, 0x4d2c6dfc5ac42aed,
+         0x53380d139d95b3df, 0x650a73548baf63de, 0x766a0abb3c77b2a8, 0x81c2c92e47edaee6, 0x92722c851482353b,
+         0xa2bfe8a14cf10364, 0xa81a664bbc423001, 0xc24b8b70d0f89791, 0xc76c51a30654be30, 0xd192e819d6ef5218,
+         0xd69906245565a910, 0xf40e35855771202a, 0x106aa07032bbd1b8, 0x19a4c116b8d2d0c8, 0x1e376c085141ab53,
+         0x2748774cdf8eeb99, 0x34b0bcb5e19b48a8, 0x391c0cb3c5c95a63, 0x4ed8aa4ae3418acb, 0x5b9cca4f7763e373,
+         0x682e6ff3d6b2b8a3, 0x748f82ee5defb2fc, 0x78a5636f43172f60, 0x84c87814a1f0ab72, 0x8cc702081a6439ec,
+         0x90befffa23631e28, 0xa4506cebde82bde9, 0xbef9a3f7b2c67915, 0xc67178f2e372532b, 0xca273eceea26619c,
+         0xd186b8c721c0c207, 0xeada7dd6cde0eb1e, 0xf57d4f7fee6ed178, 0x06f067aa72176fba, 0x0a637dc5a2c898a6,
+         0x113f9804bef90dae, 0x1b710b35131c471b, 0x28db77f523047d84, 0x32caab7b40c72493, 0x3c9ebe0a15c9bebc,
+         0x431d67c49c100d4c, 0x4cc5d4becb3e42b6, 0x597f299cfc657e2a, 0x5fcb6fab3ad6faec, 0x6c44198c4a475817)
+
+
+def test_against_hashlib(engine, hashlib_engine):
+    """
+    Compares hashes of random messages, given at once and by parts, with hashlib.
+    """
+    for length in list(range(0, 260)) + [1000, 10000]:
+        message = random.randbytes(length)
+        assert engine().get_hash(message) == hashlib_engine(message).hexdigest(), f"Error for {length} bytes"
+
+        sha = engine()
+        split = random.randint(0, length)
+        sha.update(message[:split])
+        copy = sha.copy()
+        sha.update(message[split:])
+        assert sha.digest() == hashlib_engine(message).digest(), f"Error for update of {length} bytes"
+        copy.update(b"x")
+        assert copy.digest() == hashlib_engine(message[:split] + b"x").digest(), f"Error for copy of {length} bytes"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    test_against_hashlib(SHA256, hashlib.sha256)
+    test_against_hashlib(SHA512, hashlib.sha512)
+    print("All SHA-2 tests passed")
@@ -0,0 +1,169 @@
+import mmap
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from task5_hash.main import SHA1
+
+# Size of leaf, 1 MiB
+LEAF_SIZE = 1 << 20
+# Number of leaves in one task of the pool
+LEAVES_PER_TASK = 4
+
+# Prefixes of leaves and nodes, so a leaf can not be taken for a node
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+
+def leaf_hash(data) -> bytes:
+    sha = SHA1(LEAF_PREFIX)
+    sha.update(data)
+    return sha.digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return SHA1(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Merkle tree of SHA1 hashes of leaves.
+    Nodes are hashed by pairs, the last node of odd level goes to the next level unchanged.
+    """
+    def __init__(self, leaves: Sequence[bytes]):
+        """
+        :param leaves: hashes of leaves
+        """
+        if not leaves:
+            leaves = [leaf_hash(b"")]
+        self.levels = [list(leaves)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    @property
+    def leaves(self) -> List[bytes]:
+        return self.levels[0]
+
+    def hexroot(self) -> str:
+        return self.root.hex()
+
+    def proof(self, index: int) -> List[Tuple[bytes, bool]]:
+        """
+        Builds inclusion proof of leaf.
+        :param index: index of leaf
+        :return: list of (hash of sibling, True if sibling is on the left) from leaf to root
+        """
+        if not 0 <= index < len(self.leaves):
+            raise IndexError(f"Leaf {index} is out of tree of {len(self.leaves)} leaves")
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append((level[sibling], sibling < index))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_proof(leaf: bytes, proof: List[Tuple[bytes, bool]], root: bytes) -> bool:
+        """
+        Verifies inclusion proof.
+        :param leaf: hash of leaf
+        :param proof: proof from MerkleTree.proof
+        :param root: expected root
+        :return: True if leaf belongs to the tree with root
+        """
+        current = leaf
+        for sibling, is_left in proof:
+            current = node_hash(sibling, current) if is_left else node_hash(current, sibling)
+        return current == root
+
+
+def _hash_leaves(path: str, leaf_size: int, first: int, last: int) -> List[bytes]:
+    """
+    Hashes leaves from first to last of file mapped to memory.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return [leaf_hash(view[i * leaf_size:(i + 1) * leaf_size]) for i in range(first, last)]
+
+
+def tree_hash_file(path: str, leaf_size: int = LEAF_SIZE, workers: Optional[int] = None,
+                   leaves_per_task: int = LEAVES_PER_TASK) -> MerkleTree:
+    """
+    Builds Merkle tree of file. Leaves are hashed on a pool of processes, every worker maps the file
+    to memory and gets only indexes of leaves.
+    :param path: path of file
+    :param leaf_size: size of leaf in bytes
+    :param workers: number of processes, os.cpu_count() by default, 1 to hash in the current process
+    :param leaves_per_task: number of leaves in one task of the pool
+    :return: tree of file
+    """
+    size = os.path.getsize(path)
+    count = -(-size // leaf_size)
+    if not count:
+        return MerkleTree([])
+
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        return MerkleTree(_hash_leaves(path, leaf_size, 0, count))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_hash_leaves, path, leaf_size, first, min(first + leaves_per_task, count))
+                   for first in range(0, count, leaves_per_task)]
+        leaves = [leaf for future in futures for leaf in future.result()]
+    return MerkleTree(leaves)
+
+
+def verify_file_leaf(path: str, index: int, proof: List[Tuple[bytes, bool]], root: bytes,
+                     leaf_size: int = LEAF_SIZE) -> bool:
+    """
+    Re-verifies one leaf of file against the known root, without hashing the whole file.
+    """
+    with open(path, "rb") as f:
+        f.seek(index * leaf_size)
+        return MerkleTree.verify_proof(leaf_hash(f.read(leaf_size)), proof, root)
+
+
+def test_tree_hash_file(size, leaf_size, workers):
+    """
+    Compares tree of file with tree of leaves in memory and checks proofs of all leaves.
+    """
+    data = random.randbytes(size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "artifact.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        tree = tree_hash_file(path, leaf_size, workers, leaves_per_task=2)
+        expected = MerkleTree([leaf_hash(data[i:i + leaf_size]) for i in range(0, size, leaf_size)])
+        assert tree.root == expected.root, f"Error for root of {size} bytes"
+
+        for index in range(len(tree.leaves)):
+            proof = tree.proof(index)
+            assert verify_file_leaf(path, index, proof, tree.root, leaf_size), f"Error for proof of leaf {index}"
+
+        if size:
+            # Changed byte breaks only the proof of its leaf
+            with open(path, "r+b") as f:
+                f.seek(size - 1)
+                f.write(bytes([data[-1] ^ 1]))
+            last = len(tree.leaves) - 1
+            assert not verify_file_leaf(path, last, tree.proof(last), tree.root, leaf_size), "Error for changed leaf"
+            assert verify_file_leaf(path, 0, tree.proof(0), tree.root, leaf_size) or last == 0, "Error for leaf 0"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    for file_size, leaf, pool_size in ((0, 1024, 1), (100, 1024, 1), (10 * 1024 + 5, 1024, 1), (7 * 4096, 4096, 4)):
+        test_tree_hash_file(file_size, leaf, pool_size)
+    print("All tree hash tests passed")
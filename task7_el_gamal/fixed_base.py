@@ -0,0 +1,160 @@
+import random
+import time
+
+import Cryptodome.Util.number as num
+
+# Bits of exponent in one window. Table of 2048-bit modulus has 512 * 15 values (about 2 MB),
+# it is built as fast as 4 pow calls and makes every next exponentiation about 4 times faster.
+WINDOW = 4
+
+
+class FixedBasePow:
+    """
+    Fixed-base windowed exponentiation: base ** exponent mod modulus for many exponents and the same base.
+    table[i][d] = base ** (d * 2 ** (window * i)), so exponentiation is one multiplication per window
+    of exponent and no squarings.
+    """
+
+    def __init__(self, base: int, modulus: int, exponent_bits: int = None, window: int = WINDOW,
+                 order: int = None) -> None:
+        """
+        Precomputes the table.
+        :param base: fixed base
+        :param modulus: modulus
+        :param exponent_bits: maximal bit length of exponent, bit length of modulus by default
+        :param window: bits of exponent in one window
+        :param order: order of base (or multiple of it, e.g. p - 1 for prime p), bigger exponents are reduced by it
+        """
+        self.base = base % modulus
+        self.modulus = modulus
+        self.window = window
+        self.order = order
+        self.exponent_bits = exponent_bits or modulus.bit_length()
+
+        mask = (1 << window) - 1
+        self.table = []
+        current = self.base
+        for _ in range(-(-self.exponent_bits // window)):
+            row = [1]
+            value = 1
+            for _ in range(mask):
+                value = value * current % modulus
+                row.append(value)
+            self.table.append(row)
+            # base ** (2 ** (window * (i + 1)))
+            current = value * current % modulus
+
+    def pow(self, exponent: int) -> int:
+        """
+        Calculates base ** exponent mod modulus.
+        :param exponent: exponent, exponents out of the table are reduced by order or calculated by pow
+        :return: result
+        """
+        if (exponent < 0 or exponent.bit_length() > self.exponent_bits) and self.order:
+            exponent %= self.order
+        if exponent < 0 or exponent.bit_length() > self.exponent_bits:
+            return pow(self.base, exponent, self.modulus)
+
+        modulus = self.modulus
+        mask = (1 << self.window) - 1
+        result = 1
+        for row in self.table:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % modulus
+            exponent >>= self.window
+        return result % modulus
+
+
+class FixedBaseMixin:
+    """
+    Mixin for classes with prime p and generator g: pow_g calculates g ** exponent mod p by FixedBasePow table of g.
+    The table is built on the first call of pow_g and dropped when g or p is assigned.
+    """
+    _g = None
+    _p = None
+    _g_pow = None
+
+    @property
+    def g(self) -> int:
+        return self._g
+
+    @g.setter
+    def g(self, value: int) -> None:
+        self._g = value
+        self._g_pow = None
+
+    @property
+    def p(self) -> int:
+        return self._p
+
+    @p.setter
+    def p(self, value: int) -> None:
+        self._p = value
+        self._g_pow = None
+
+    def pow_g(self, exponent: int) -> int:
+        """
+        Calculates g**exponent mod p by fixed-base table of g, the table is built on the first call.
+        :param exponent: exponent
+        :return: g**exponent mod p
+        """
+        if self._g_pow is None:
+            self._g_pow = FixedBasePow(self.g, self.p, order=self.p - 1)
+        return self._g_pow.pow(exponent)
+
+
+def test_fixed_base_pow(bit_length, window):
+    """
+    Compares FixedBasePow with pow for random and border exponents.
+    """
+    p = num.getPrime(bit_length)
+    g = random.randint(2, p - 1)
+    fixed = FixedBasePow(g, p, window=window, order=p - 1)
+    exponents = [0, 1, 2, p - 2, p - 1, (1 << bit_length) - 1, p * 5 + 3, -7]
+    exponents += [random.randint(1, p - 2) for _ in range(100)]
+    for exponent in exponents:
+        assert fixed.pow(exponent) == pow(g, exponent, p), f"Error for {bit_length} bits, exponent {exponent}"
+
+    # Modulus of one bit length
+    assert FixedBasePow(5, 1).pow(3) == 0, "Error for modulus 1"
+
+
+def test_fixed_base_mixin():
+    """
+    Checks that the table of FixedBaseMixin follows changes of g and p.
+    """
+    group = FixedBaseMixin()
+    group.p, group.g = 90439, 52627
+    assert group.pow_g(12345) == pow(52627, 12345, 90439), "Error for the first table"
+    group.g = 3
+    assert group.pow_g(12345) == pow(3, 12345, 90439), "Table is not rebuilt for new g"
+    group.p = 65537
+    assert group.pow_g(12345) == pow(3, 12345, 65537), "Table is not rebuilt for new p"
+
+
+if __name__ == "__main__":
+    random.seed(3)
+    for bits, window_bits in ((17, 4), (64, 3), (256, 5), (1024, 4)):
+        test_fixed_base_pow(bits, window_bits)
+    test_fixed_base_mixin()
+    print("All fixed-base tests passed")
+
+    p = num.getPrime(2048)
+    g = random.randint(2, p - 1)
+    exponents = [random.randint(1, p - 2) for _ in range(100)]
+
+    start = time.time()
+    fixed = FixedBasePow(g, p)
+    print(f"2048 bit modulus. Table time: {time.time() - start}")
+
+    start = time.time()
+    fixed_results = [fixed.pow(k) for k in exponents]
+    print(f"100 exponentiations. Fixed-base time: {time.time() - start}")
+
+    start = time.time()
+    pow_results = [pow(g, k, p) for k in exponents]
+    print(f"100 exponentiations. pow time: {time.time() - start}")
+    assert fixed_results == pow_results
@@ -1,23 +1,37 @@
 import Cryptodome.Util.number as num
 import random
-from task5_hash.main import SHA1
+from task5_hash.registry import get_backend, hash_to_int
+from task7_el_gamal.fixed_base import FixedBaseMixin
 
 
-class ElGamelSignature:
+class ElGamelSignature(FixedBaseMixin):
     """
     Class for ElGamel signature.
     """
     P_CONST = 602334574490710843
     G_CONST = 72757217426062278
 
-    def __init__(self, p, g) -> None:
+    def __init__(self, p, g, hash_name="sha1", fast_hash=False) -> None:
         """
         Initializes a ElGamelSignature object with p and g values.
         :param p: prime number
         :param g: primitive
+        :param hash_name: name of hash from task5_hash.registry ("sha1", "sha256", ...) or hash backend object
+        :param fast_hash: use hashlib implementation of hash, if it exists
         """
         self.p = p
         self.g = g
+        self.hash_backend = get_backend(hash_name, fast_hash)
+
+    def hash_message(self, message) -> int:
+        """
+        Calculates int hash of message for sign and signVerif.
+        :param message: string or bytes message
+        :return: int value of hash
+        """
+        if isinstance(message, str):
+            message = message.encode()
+        return hash_to_int(self.hash_backend, message)
 
     @staticmethod
     def generate_prime_and_primitive_root(bit_length=2048) -> (int, int):
@@ -52,7 +66,7 @@ class ElGamelSignature:
         priv_key = random.randint(1, self.p - 2)
 
         # Calculate a public key from the private key, p, and g values.
-        pub_key = pow(self.g, priv_key, self.p)
+        pub_key = self.pow_g(priv_key)
 
         return priv_key, pub_key
 
@@ -68,7 +82,7 @@ class ElGamelSignature:
             if ElGamelSignature.GCD(k, self.p - 1) == 1:
                 break
 
-        r = pow(self.g, k, self.p)
+        r = self.pow_g(k)
         l = ElGamelSignature.inverse(k, self.p - 1)
         s = l * (message - priv_key * r) % (self.p - 1)
         return r, s
@@ -84,7 +98,7 @@ class ElGamelSignature:
         if r < 1 or r > self.p - 1:
             return False
         v1 = pow(pub_key, r, self.p) % self.p * pow(r, s, self.p) % self.p
-        v2 = pow(self.g, message, self.p)
+        v2 = self.pow_g(message)
         return v1 == v2
 
     @staticmethod
@@ -122,7 +136,7 @@ class ElGamelSignature:
         return u1
 
 
-class ElGamalEncryption:
+class ElGamalEncryption(FixedBaseMixin):
     """
     Class for ElGamal encryption.
     """
@@ -154,7 +168,7 @@ class ElGamalEncryption:
         priv_key = random.randint(1, self.p - 2)
 
         # Calculate a public key from the private key, p, and g values.
-        pub_key = pow(self.g, priv_key, self.p)
+        pub_key = self.pow_g(priv_key)
 
         return priv_key, pub_key
 
@@ -169,7 +183,7 @@ class ElGamalEncryption:
         for mess_str in ElGamalEncryption.divide_chunks(message, chunk_size):
             mess_val = ElGamalEncryption.str_to_val(mess_str)
             k = random.randint(1, self.p - 2)
-            c1 = pow(self.g, k, self.p)
+            c1 = self.pow_g(k)
             c2 = (pow(pub_key, k, self.p) * mess_val) % self.p
             output.append((c1, c2))
 
@@ -201,7 +215,7 @@ class ElGamalEncryption:
         """
 
         k = random.randint(1, self.p - 2)
-        c1 = pow(self.g, k, self.p)
+        c1 = self.pow_g(k)
         c2 = (pow(pub_key, k, self.p) * message) % self.p
 
         return (c1, c2)
@@ -297,17 +311,15 @@ if __name__ == "__main__":
     print("\nI. ElGamelSignature")
     message = "Distribution lab the best!"
 
-    # Use my SHA1 implementation to calculate hash of message!
-    my_sha = SHA1()
-
-    hash_val = int(my_sha.get_hash(message.encode('ascii')), 16)
-
     p = ElGamelSignature.P_CONST
     g = ElGamelSignature.G_CONST
     # Or can generate P and G values, but requires to long time to find prime.
     # p, g = ElGamelSignature.generate_prime_and_primitive_root()
 
-    elgamel_obj = ElGamelSignature(p, g)
+    # Use my SHA1 implementation to calculate hash of message! Any hash of task5_hash.registry can be used.
+    elgamel_obj = ElGamelSignature(p, g, hash_name="sha1")
+
+    hash_val = elgamel_obj.hash_message(message)
 
     priv_key, pub_key = elgamel_obj.get_private_public_keys()
     print(f"Private key: {priv_key}; Public key: {pub_key}")
@@ -328,6 +340,13 @@ if __name__ == "__main__":
     sign_valid = elgamel_obj.signVerif(pub_key, r, s, hash_val)
     print(f"Verify validation for wrong pub_key (another priv_key used): {sign_valid}")
 
+    elgamel_sha256 = ElGamelSignature(p, g, hash_name="sha256")
+    sha256_val = elgamel_sha256.hash_message(message)
+    r, s = elgamel_sha256.sign(priv_key, sha256_val)
+    print(f"\n 4. Test: SHA-256 hash of original message:")
+    sign_valid = elgamel_sha256.signVerif(pub_key, r, s, sha256_val)
+    print(f"Verify validation for original pub_key and message: {sign_valid}")
+
     print("\n\nII. ElGamelEncryption")
     message = "Distribution lab the best!"
 